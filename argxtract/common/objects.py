@@ -14,6 +14,14 @@ allow_loops = True
 max_call_depth = 1
 null_value_handling = consts.NULL_HANDLING_NONE
 bypass_all_conditional_checks = False
+# Memory (in MB) to use for pending trace states before spilling to file.
+trace_queue_max_memory = 256
+# Maximum number of call sites in the combined trace tree (0 for no limit).
+max_trace_tree_size = 100000
+# Number of processes to use for function pattern matching.
+pattern_matching_processes = 1
+# Compiled ARG definitions (by file path). Kept for the whole process.
+arg_definitions = {}
 
 #========== File-specific variables =========
 arm_arch = consts.ARMv6M
@@ -33,15 +41,26 @@ application_vector_table = {}
 self_targeting_branches = []
 core_bytes = None
 disassembled_firmware = {}
+# Address index (built once links have been annotated).
+all_addresses = []
+next_address_index = {}
+previous_address_index = {}
+pc_address_index = {}
+# Instruction table (numpy arrays indexed by (address-start address)/2).
+instruction_table = {}
 data_region = {}
 errored_instructions = []
 function_blocks = {}
+# Function block index (rebuilt whenever function blocks are assigned).
+function_block_starts = []
+function_block_ends = {}
+# Call graph (built once call depths are computed).
+call_graph = None
 replace_functions = {}
 denylisted_functions = []
 coi_addresses = {}
 table_branches = {}
 
 # Tracing objects.
-coi_chains = []
 coi_function_blocks = []
 potential_start_points = []
\ No newline at end of file
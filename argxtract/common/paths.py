@@ -5,4 +5,5 @@ base_path = ''
 core_path = ''
 resources_path = ''
 vendor_path = ''
-tmp_path = ''  
\ No newline at end of file
+tmp_path = ''  
+cache_path = None
\ No newline at end of file
@@ -17,7 +17,9 @@ from argxtract.core.register_evaluator import RegisterEvaluator
 
 class FirmwareAnalyser:
     def __init__(self, mode, vendor, max_time, per_trace_max_time, function_folder,
-                    max_call_depth, loglevel, null_handling, bypass, process_id):
+                    max_call_depth, loglevel, null_handling, bypass, process_id,
+                    queue_memory=None, cache_path=None, pattern_processes=1,
+                    max_trace_tree_size=None):
         common_objs.mode = mode
         if per_trace_max_time > max_time:
             max_time = 0
@@ -26,9 +28,14 @@ class FirmwareAnalyser:
         common_objs.max_call_depth = max_call_depth
         common_objs.null_value_handling = null_handling
         common_objs.bypass_all_conditional_checks = bypass
+        if queue_memory != None:
+            common_objs.trace_queue_max_memory = queue_memory
+        common_objs.pattern_matching_processes = pattern_processes
+        if max_trace_tree_size != None:
+            common_objs.max_trace_tree_size = max_trace_tree_size
         
         logging.getLogger().setLevel(loglevel)
-        self.set_paths(process_id)
+        self.set_paths(process_id, cache_path)
         self.function_folder = function_folder
 
         # First things first, run vendor tests.
@@ -94,8 +101,11 @@ class FirmwareAnalyser:
             return None
         
         # Get application code base.
+        # Re-use the estimate from a previous run, if available.
         if app_code_base == None:
-            self.disassembler.estimate_app_code_base()
+            if self.disassembler.load_code_base_from_cache() != True:
+                self.disassembler.estimate_app_code_base()
+                self.disassembler.save_code_base_to_cache()
         else:
             common_objs.app_code_base = app_code_base
         common_objs.disassembly_start_address = common_objs.app_code_base
@@ -118,14 +128,22 @@ class FirmwareAnalyser:
             return None
 
         """ Step 2: Disassemble and annotate data and other pertinent info """
-        # Disassemble firmware binary.
-        self.disassembler.create_disassembled_object()
-        
-        # Mark out .data and inline data.
-        self.disassembler.identify_inline_data()
-        
-        # Annotate firmware object with branch call/target information.
-        self.disassembler.annotate_links()
+        # Re-use the output of this step from a previous run, if available.
+        if self.disassembler.load_disassembly_from_cache() != True:
+            # Disassemble firmware binary.
+            self.disassembler.create_disassembled_object()
+            
+            # The firmware has now been disassembled at the final code 
+            #  base, so the decoded instructions won't be rebased again.
+            self.disassembler.release_decoded_instructions()
+            
+            # Mark out .data and inline data.
+            self.disassembler.identify_inline_data()
+            
+            # Annotate firmware object with branch call/target information.
+            self.disassembler.annotate_links()
+            
+            self.disassembler.save_disassembly_to_cache()
 
         """ Step 3: Function block estimation and pattern matching """
         # Identify function blocks
@@ -226,7 +244,7 @@ class FirmwareAnalyser:
         final_output['unhandled'] = output_object['unhandled']
         return final_output
         
-    def set_paths(self, process_id):
+    def set_paths(self, process_id, cache_path=None):
         curr_path = os.path.dirname(os.path.realpath(__file__))
         base_path = os.path.abspath(
             os.path.join(curr_path, '..')
@@ -243,6 +261,8 @@ class FirmwareAnalyser:
         )
         if (not (os.path.isdir(common_paths.tmp_path))):
             os.mkdir(common_paths.tmp_path)
+        if cache_path != None:
+            common_paths.cache_path = os.path.abspath(cache_path)
         
     def reset(self):
         self.disassembler = None
@@ -272,14 +292,21 @@ class FirmwareAnalyser:
         common_objs.self_targeting_branches = []
         common_objs.core_bytes = None
         common_objs.disassembled_firmware = {}
+        common_objs.all_addresses = []
+        common_objs.next_address_index = {}
+        common_objs.previous_address_index = {}
+        common_objs.pc_address_index = {}
+        common_objs.instruction_table = {}
         common_objs.data_region = {}
         common_objs.errored_instructions = []
         common_objs.function_blocks = {}
+        common_objs.function_block_starts = []
+        common_objs.function_block_ends = {}
+        common_objs.call_graph = None
         common_objs.replace_functions = {}
         common_objs.denylisted_functions = []
         common_objs.coi_addresses = {}
         common_objs.table_branches = {}
-        common_objs.coi_chains = []
         common_objs.coi_function_blocks = []
         common_objs.potential_start_points = []
         
@@ -0,0 +1,325 @@
+import json
+import logging
+from argxtract.common import objects as common_objs
+
+
+ELEMENT_TYPES = [
+    'hex', 'int8', 'uint8', 'int16', 'uint16', 'int32', 'uint32',
+    'dict', 'bitfield'
+]
+
+# Modes in which a structure's elements are decoded.
+MODE_POINTER = 'pointer'
+MODE_VALUE = 'value'
+MODE_BITFIELD = 'bitfield'
+
+
+class ArgDefinitionError(Exception):
+    pass
+
+
+class ArgDefinitionCompiler:
+    def get_compiled_definition(self, arg_file):
+        """Get the decoding plan for an ARG definition file.
+
+        Definition files are loaded, validated and compiled once per
+        process. Invalid files are logged and compile to None.
+        """
+        if arg_file not in common_objs.arg_definitions:
+            common_objs.arg_definitions[arg_file] = \
+                self.compile_arg_file(arg_file)
+        return common_objs.arg_definitions[arg_file]
+
+    def compile_arg_file(self, arg_file):
+        try:
+            with open(arg_file) as f:
+                coi_definitions = json.load(f)
+        except Exception as e:
+            logging.error(
+                'Errored ARG definition file: '
+                + arg_file
+                + ' ('
+                + str(e)
+                + ')'
+            )
+            return None
+
+        try:
+            compiled_args = self.compile_args(coi_definitions)
+        except ArgDefinitionError as e:
+            logging.error(
+                'Invalid ARG definition file: '
+                + arg_file
+                + ' ('
+                + str(e)
+                + ')'
+            )
+            return None
+        logging.debug(
+            'Compiled ARG definition file: '
+            + arg_file
+        )
+        return compiled_args
+
+    def compile_args(self, coi_definitions):
+        if ((type(coi_definitions) is not dict)
+                or ('args' not in coi_definitions)):
+            raise ArgDefinitionError('no args provided')
+        if type(coi_definitions['args']) is not dict:
+            raise ArgDefinitionError('args must be an object')
+
+        # Arguments are read from consecutive registers,
+        #  in the order in which they are defined.
+        compiled_args = []
+        for arg_name in coi_definitions['args']:
+            arg_definition = coi_definitions['args'][arg_name]
+            compiled_args.append(
+                self.compile_arg(arg_name, arg_definition)
+            )
+        return compiled_args
+
+    def compile_arg(self, arg_name, arg_definition):
+        self.check_keys(arg_name, arg_definition, ['in_out', 'data'])
+        in_out = arg_definition['in_out']
+        if type(in_out) is not str:
+            raise ArgDefinitionError(arg_name + ': in_out must be a string')
+
+        memory_offset = None
+        if 'memory_offset' in arg_definition:
+            memory_offset = arg_definition['memory_offset']
+            if type(memory_offset) is not int:
+                raise ArgDefinitionError(
+                    arg_name + ': memory_offset must be an integer'
+                )
+
+        compiled_arg = {
+            'name': arg_name,
+            'in_out': in_out,
+            'ptr_val': None,
+            'memory_offset': memory_offset,
+            'data': None,
+            'output_data': None
+        }
+
+        # Output-only arguments don't have any input to decode.
+        if in_out == 'out':
+            if memory_offset != None:
+                raise ArgDefinitionError(
+                    arg_name + ': memory_offset is not supported for output'
+                )
+            compiled_arg['output_data'] = self.compile_output_structure(
+                arg_name,
+                arg_definition['data']
+            )
+            return compiled_arg
+
+        self.check_keys(arg_name, arg_definition, ['ptr_val'])
+        ptr_val = arg_definition['ptr_val']
+        if ptr_val not in ['pointer', 'value']:
+            raise ArgDefinitionError(arg_name + ': unknown ptr_val')
+        compiled_arg['ptr_val'] = ptr_val
+        if ptr_val == 'pointer':
+            mode = MODE_POINTER
+        else:
+            mode = MODE_VALUE
+        compiled_arg['data'] = self.compile_structure(
+            arg_name,
+            arg_definition['data'],
+            mode
+        )
+
+        # Input with custom output (e.g., "custom_out").
+        if 'out' in in_out:
+            compiled_arg['output_data'] = self.compile_output_structure(
+                arg_name,
+                arg_definition['data']
+            )
+        return compiled_arg
+
+    def compile_structure(self, path, data_structure, mode):
+        if ((type(data_structure) is not dict) or (data_structure == {})):
+            raise ArgDefinitionError(path + ': data must be a non-empty object')
+
+        compiled_structure = []
+        for element_name in data_structure:
+            element_path = path + '->' + element_name
+            element = self.compile_element(
+                element_path,
+                element_name,
+                data_structure[element_name]
+            )
+
+            # Nested data is decoded differently depending on how
+            #  the element itself is accessed.
+            if element['type'] in ['dict', 'bitfield']:
+                self.check_keys(
+                    element_path,
+                    data_structure[element_name],
+                    ['data']
+                )
+                if element['type'] == 'bitfield':
+                    child_mode = MODE_BITFIELD
+                elif mode == MODE_POINTER:
+                    child_mode = MODE_POINTER
+                else:
+                    child_mode = MODE_VALUE
+                element['data'] = self.compile_structure(
+                    element_path,
+                    data_structure[element_name]['data'],
+                    child_mode
+                )
+
+            # Pointers can only be followed from memory.
+            if ((mode == MODE_VALUE) and (element['ptr_val'] == 'pointer')
+                    and (len(data_structure.keys()) > 1)):
+                raise ArgDefinitionError(
+                    element_path + ': pointer not supported within value'
+                )
+            compiled_structure.append(element)
+        return compiled_structure
+
+    def compile_element(self, path, element_name, element_definition):
+        self.check_keys(
+            path,
+            element_definition,
+            ['ptr_val', 'type', 'length_bits']
+        )
+        if element_definition['ptr_val'] not in ['pointer', 'value']:
+            raise ArgDefinitionError(path + ': unknown ptr_val')
+        if element_definition['type'] not in ELEMENT_TYPES:
+            raise ArgDefinitionError(path + ': unknown type')
+
+        element = {
+            'name': element_name,
+            'ptr_val': element_definition['ptr_val'],
+            'type': element_definition['type'],
+            'length_bits': None,
+            'length_expression': None,
+            'byte_endian': None,
+            'word_endian': None,
+            'data': None
+        }
+
+        (element['length_bits'], element['length_expression']) = \
+            self.compile_length_field(path, element_definition['length_bits'])
+
+        if 'byte-endian' in element_definition:
+            if element_definition['byte-endian'] not in ['big', 'little']:
+                raise ArgDefinitionError(path + ': unknown byte-endian')
+            element['byte_endian'] = element_definition['byte-endian']
+
+        # Word endianness is given as <endian>-<word length in bits>.
+        # Big-endian words need no reordering.
+        if 'word-endian' in element_definition:
+            word_endian = str(element_definition['word-endian']).split('-')
+            if ((len(word_endian) != 2)
+                    or (word_endian[0] not in ['big', 'little'])
+                    or (not word_endian[1].isdigit())
+                    or (int(word_endian[1]) == 0)):
+                raise ArgDefinitionError(path + ': unknown word-endian')
+            if word_endian[0] == 'little':
+                element['word_endian'] = int(word_endian[1])
+        return element
+
+    def compile_length_field(self, path, length_bits):
+        if type(length_bits) is int:
+            return (length_bits, None)
+        if type(length_bits) is not str:
+            raise ArgDefinitionError(path + ': invalid length_bits')
+
+        # Length expressions are of the form <operand> [<op> <operand>],
+        #  where operands are integers or references to decoded fields.
+        tokens = length_bits.split()
+        if len(tokens) not in [1, 3]:
+            raise ArgDefinitionError(path + ': invalid length_bits')
+        operator = None
+        if len(tokens) == 3:
+            operator = tokens[1]
+            if operator not in ['*', '+', '-']:
+                raise ArgDefinitionError(path + ': invalid length_bits')
+        operands = []
+        for token in tokens[0::2]:
+            if token.isdigit():
+                operands.append(int(token))
+            else:
+                operands.append(self.compile_reference(path, token))
+        return (None, (operator, operands))
+
+    def compile_reference(self, path, reference):
+        # References prefixed by '#' refer to previously processed
+        #  arguments, rather than to the structure being processed.
+        is_argument_reference = False
+        if reference.startswith('#'):
+            is_argument_reference = True
+            reference = reference[1:]
+        components = reference.split('->')
+        if '' in components:
+            raise ArgDefinitionError(path + ': invalid reference')
+        return (is_argument_reference, components)
+
+    def compile_output_structure(self, path, data_structure):
+        if ((type(data_structure) is not dict) or (data_structure == {})):
+            raise ArgDefinitionError(path + ': data must be a non-empty object')
+
+        compiled_structure = []
+        for element_name in data_structure:
+            element_path = path + '->' + element_name
+            element_definition = data_structure[element_name]
+            self.check_keys(element_path, element_definition, ['type'])
+            if element_definition['type'] == 'dict':
+                self.check_keys(element_path, element_definition, ['data'])
+                compiled_structure.append({
+                    'name': element_name,
+                    'type': 'dict',
+                    'data': self.compile_output_structure(
+                        element_path,
+                        element_definition['data']
+                    )
+                })
+                continue
+
+            self.check_keys(
+                element_path,
+                element_definition,
+                ['store_type', 'output']
+            )
+            element = {
+                'name': element_name,
+                'type': element_definition['type'],
+                'store_type': element_definition['store_type'],
+                'store': None,
+                'store_reference': None,
+                'length_bits': None,
+                'length_expression': None,
+                'output': element_definition['output']
+            }
+            if element['store_type'] == 'random':
+                self.check_keys(
+                    element_path,
+                    element_definition,
+                    ['length_bits']
+                )
+                (element['length_bits'], element['length_expression']) = \
+                    self.compile_length_field(
+                        element_path,
+                        element_definition['length_bits']
+                    )
+            else:
+                self.check_keys(element_path, element_definition, ['store'])
+                element['store'] = element_definition['store']
+                if ((element['store_type'] != 'value')
+                        and (type(element['store']) is str)
+                        and ('->' in element['store'])):
+                    element['store_reference'] = self.compile_reference(
+                        element_path,
+                        element['store']
+                    )
+            compiled_structure.append(element)
+        return compiled_structure
+
+    def check_keys(self, path, definition, keys):
+        if type(definition) is not dict:
+            raise ArgDefinitionError(path + ': definition must be an object')
+        for key in keys:
+            if key not in definition:
+                raise ArgDefinitionError(path + ': missing ' + key)
@@ -1,215 +1,167 @@
-import numpy as np
-from argxtract.core import utils
-    
-def logical_shift_left(value, shift):
+def get_mask(num_bits=32):
+    return (1 << num_bits) - 1
+
+def to_signed(value, num_bits=32):
+    value = value & get_mask(num_bits)
+    if value & (1 << (num_bits - 1)):
+        value = value - (1 << num_bits)
+    return value
+
+def logical_shift_left(value, shift, num_bits=32):
     """Logical Shift Left
-    
+
     (LSL) moves each bit of a bitstring left by a specified number of bits.
     Zeros are shifted in at the right end of the bitstring.
-    Bits that are shifted off the left end of the bitstring are discarded, 
+    Bits that are shifted off the left end of the bitstring are discarded,
     except that the last such bit can be produced as a carry output.
     """
     if shift == 0:
         return (value, 0)
-    if shift > 32:
-        return ('00000000', 0)
-    bit_length = utils.get_bit_length(value)
-    bits = utils.get_binary_representation(value, bit_length)
-    extended_bits = bits
-    for i in range(shift):
-        extended_bits += '0'
-        carry_out = extended_bits[0]
-        shifted_value = extended_bits[(-1*bit_length):]
-        extended_bits = shifted_value
-    new_value = utils.convert_bits_to_type(extended_bits, 'hex')
-    carry_out = int(carry_out)
+    if shift > num_bits:
+        return (0, 0)
+    new_value = (value << shift) & get_mask(num_bits)
+    carry_out = (value >> (num_bits - shift)) & 1
     return (new_value, carry_out)
-    
-def logical_shift_right(value, shift):
+
+def logical_shift_right(value, shift, num_bits=32):
     """Logical Shift Right
-    
+
     (LSR) moves each bit of a bitstring right by a specified number of bits.
-    Zeros are shifted in at the left end of the bitstring. 
-    Bits that are shifted off the right end of the bitstring are discarded, 
+    Zeros are shifted in at the left end of the bitstring.
+    Bits that are shifted off the right end of the bitstring are discarded,
     except that the last such bit can be produced as a carry output.
     """
     if shift == 0:
         return (value, 0)
-    if shift > 32:
-        return ('00000000', 0)
-    bit_length = utils.get_bit_length(value)
-    bits = utils.get_binary_representation(value, bit_length)
-    extended_bits = bits
-    for i in range(shift):
-        extended_bits = '0' + extended_bits
-        carry_out = extended_bits[-1]
-        shifted_value = extended_bits[0:bit_length]
-        extended_bits = shifted_value
-    new_value = utils.convert_bits_to_type(shifted_value, 'hex')
-    carry_out = int(carry_out)
+    if shift > num_bits:
+        return (0, 0)
+    value = value & get_mask(num_bits)
+    new_value = value >> shift
+    carry_out = (value >> (shift - 1)) & 1
     return (new_value, carry_out)
 
-def arithmetic_shift_right(value, shift):
+def arithmetic_shift_right(value, shift, num_bits=32):
     """Arithmetic Shift Right
-    
-    (ASR) moves each bit of a bitstring right by a specified number of bits. 
-    Copies of the leftmost bit are shifted in at the left end of the bitstring. 
-    Bits that are shifted off the right end of the bitstring are discarded, 
+
+    (ASR) moves each bit of a bitstring right by a specified number of bits.
+    Copies of the leftmost bit are shifted in at the left end of the bitstring.
+    Bits that are shifted off the right end of the bitstring are discarded,
     except that the last such bit can be produced as a carry output.
     """
     if shift == 0:
         return (value, 0)
-    if shift > 32:
+    if shift > num_bits:
         return (None, 0)
-    bit_length = utils.get_bit_length(value)
-    bits = utils.get_binary_representation(value, bit_length)
-    leftmost_bit = bits[0]
-    extended_bits = bits
-    for i in range(shift):
-        extended_bits = leftmost_bit + extended_bits
-        carry_out = extended_bits[-1]
-        shifted_value = extended_bits[0:bit_length]
-        extended_bits = shifted_value
-    new_value = utils.convert_bits_to_type(shifted_value, 'hex')
-    carry_out = int(carry_out)
+    signed_value = to_signed(value, num_bits)
+    new_value = (signed_value >> shift) & get_mask(num_bits)
+    carry_out = (signed_value >> (shift - 1)) & 1
     return (new_value, carry_out)
-    
-def rotate_right(value, shift):
+
+def rotate_right(value, shift, num_bits=32):
     """Rotate Right
-    
-    (ROR) moves each bit of a bitstring right by a specified number of bits. 
-    Each bit that is shifted off the right end of the bitstring is 
-    re-introduced at the left end. The last bit shifted off the the right end 
+
+    (ROR) moves each bit of a bitstring right by a specified number of bits.
+    Each bit that is shifted off the right end of the bitstring is
+    re-introduced at the left end. The last bit shifted off the the right end
     of the bitstring can be produced as a carry output.
     """
     if shift == 0:
         return (value, 0)
-    if shift > 32:
+    if shift > num_bits:
         return (None, 0)
-    bit_length = utils.get_bit_length(value)
-    bits = utils.get_binary_representation(value, bit_length)
-    shifted_bits = bits
-    for i in range(shift):
-        rightmost_bit = bits[-1]
-        shifted_bits = rightmost_bit + bits
-        bits = shifted_bits[0:bit_length]
-    new_value = utils.convert_bits_to_type(bits, 'hex')
-    carry_out = int(rightmost_bit)
+    value = value & get_mask(num_bits)
+    rotation = shift % num_bits
+    new_value = ((value >> rotation) | (value << (num_bits - rotation))) \
+        & get_mask(num_bits)
+    carry_out = (new_value >> (num_bits - 1)) & 1
     return (new_value, carry_out)
-    
-def rotate_right_with_extend(value, carry_in=None):
+
+def rotate_right_with_extend(value, carry_in=None, num_bits=32):
     """Rotate Right with Extend
-    
-    (RRX) moves each bit of a bitstring right by one bit. 
-    The carry input is shifted in at the left end of the bitstring. 
-    The bit shifted off the right end of the bitstring can be produced 
+
+    (RRX) moves each bit of a bitstring right by one bit.
+    The carry input is shifted in at the left end of the bitstring.
+    The bit shifted off the right end of the bitstring can be produced
     as a carry output.
     """
-    if carry_in == None: carry_in = '0'
-    if type(carry_in) is int: carry_in = str(carry_in)
-    bit_length = utils.get_bit_length(value)
-    bits = utils.get_binary_representation(value, bit_length)
-    shifted_bits = bits
-    carry_out = int(bits[-1])
-    shifted_bits = carry_in + bits
-    bits = shifted_bits[0:bit_length]
-    new_value = utils.convert_bits_to_type(bits, 'hex')
+    if carry_in == None: carry_in = 0
+    value = value & get_mask(num_bits)
+    new_value = (int(carry_in) << (num_bits - 1)) | (value >> 1)
+    carry_out = value & 1
     return (new_value, carry_out)
-    
-def add_with_carry(x, y, carry_in=0, num_bits = 32, sub=False):
-    orig_x = x
-    orig_y = y
+
+def add_with_carry(x, y, carry_in=0, num_bits=32, sub=False):
+    """Add with Carry
+
+    Computes x + y + carry_in (or x + NOT(y) + carry_in for subtraction),
+    as per the ARM pseudocode AddWithCarry(). The carry flag is set
+    if the unsigned sum does not fit in num_bits, and the overflow flag
+    is set if the signed sum does not fit in num_bits.
+    """
+    if ((x == None) or (y == None)):
+        return (None, None, None)
+    if carry_in == None: carry_in = 0
+    mask = get_mask(num_bits)
+    x = x & mask
+    y = y & mask
     if sub == True:
-        np_dtype = utils.get_numpy_type([x, y])
-        y = np.bitwise_not(
-            y.astype(np_dtype),
-            dtype=np_dtype,
-            casting='safe'
+        y = ~y & mask
+    unsigned_sum = x + y + carry_in
+    signed_sum = to_signed(x, num_bits) + to_signed(y, num_bits) + carry_in
+
+    # Set result.
+    result = unsigned_sum & mask
+
+    # Set carry.
+    if result == unsigned_sum:
+        carry_out = 0
+    else:
+        carry_out = 1
+
+    # Set overflow.
+    if to_signed(result, num_bits) == signed_sum:
+        overflow = 0
+    else:
+        overflow = 1
+    return (result, carry_out, overflow)
+
+def sign_extend(value, total_bits=32, bit_length=None):
+    if bit_length == None: bit_length = total_bits
+    value = to_signed(value, bit_length)
+    return value & get_mask(total_bits)
+
+def split_leading_bits(value, num_bits, field_bits):
+    """Split Leading Bits
+
+    Splits a num_bits-wide bitstring (held as an integer) into its
+    leading (most significant) field_bits bits and the remaining bits.
+    Both parts are returned as (value, num_bits) pairs. If fewer than
+    field_bits bits are available, all of them form the leading part.
+    """
+    if field_bits >= num_bits:
+        return ((value, num_bits), (0, 0))
+    remaining_bits = num_bits - field_bits
+    leading_part = (value >> remaining_bits, field_bits)
+    remaining_part = (value & get_mask(remaining_bits), remaining_bits)
+    return (leading_part, remaining_part)
+
+def reverse_words(value, num_bits, word_bits):
+    """Reverse Words
+
+    Reverses the order of the word_bits-wide words in a num_bits-wide
+    bitstring (held as an integer). Words are counted from the most
+    significant end, so if num_bits is not a multiple of word_bits,
+    the final (least significant) word is the shorter one.
+    """
+    words = []
+    remaining_bits = num_bits
+    while remaining_bits > 0:
+        word_length = min(word_bits, remaining_bits)
+        remaining_bits -= word_length
+        words.append(
+            ((value >> remaining_bits) & get_mask(word_length), word_length)
         )
-    try:
-        if num_bits == 32:
-            np.seterr(over='ignore')
-            uint_x = np.uint32(x)
-            np.seterr(over='ignore')
-            int_x = np.int32(x)
-            np.seterr(over='ignore')
-            uint_y = np.uint32(y)
-            np.seterr(over='ignore')
-            int_y = np.int32(y)
-            np.seterr(over='ignore')
-            uint_carry_in = np.uint32(carry_in)
-        elif num_bits == 16:
-            np.seterr(over='ignore')
-            uint_x = np.uint16(x)
-            np.seterr(over='ignore')
-            int_x = np.int16(x)
-            np.seterr(over='ignore')
-            uint_y = np.uint16(y)
-            np.seterr(over='ignore')
-            int_y = np.int16(y)
-            np.seterr(over='ignore')
-            uint_carry_in = np.uint16(carry_in)
-        elif num_bits == 8:
-            np.seterr(over='ignore')
-            uint_x = np.uint8(x)
-            np.seterr(over='ignore')
-            int_x = np.int8(x)
-            np.seterr(over='ignore')
-            uint_y = np.uint8(y)
-            np.seterr(over='ignore')
-            int_y = np.int8(y)
-            np.seterr(over='ignore')
-            uint_carry_in = np.uint8(carry_in)
-            
-        np.seterr(over='ignore')
-        unsigned_sum = uint_x + uint_y + uint_carry_in
-        np.seterr(over='ignore')
-        signed_sum = int_x + int_y + uint_carry_in
-        
-        # Set result.
-        np.seterr(over='ignore')
-        result = np.uint32(unsigned_sum)
-        
-        # Set carry.
-        np.seterr(over='ignore')
-        if np.uint32(result) == unsigned_sum:
-            carry_out = 0
-        else:
-            carry_out = 1
-
-        # Set overflow.
-        np.seterr(over='ignore')
-        if np.int32(result) == signed_sum:
-            overflow = 0
-        else:
-            overflow = 1
-            
-        if sub == True:
-            existing = result
-            if carry_in == 1:
-                if orig_x >= orig_y:
-                    carry_out = 1
-            if carry_in == 0:
-                if orig_x > orig_y:
-                    carry_out = 1
-        return (result, carry_out, overflow)
-    except:
-        return (None, None, None)
-    
-def is_zero_bit(x):
-    for bit in x:
-        if bit != '0':
-            return 0
-    return 1
-    
-def sign_extend(value, total_bits=32):
-    bin_value = bin(int('1'+value, 16))[3:]
-    top_bit = bin_value[0]
-    length_bits = len(bin_value)
-    num_sign_bits = total_bits - length_bits
-    extended_bits = ''
-    for i in range(num_sign_bits):
-        extended_bits += top_bit
-    extended_bits += bin_value
-    extended_hex = '%0*x' % ((len(extended_bits) + 3) // 4, int(extended_bits, 2))
-    return extended_hex
\ No newline at end of file
+    reversed_value = 0
+    for (word, word_length) in reversed(words):
+        reversed_value = (reversed_value << word_length) | word
+    return reversed_value
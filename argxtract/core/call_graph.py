@@ -0,0 +1,147 @@
+import logging
+from argxtract.core import utils
+from argxtract.common import objects as common_objs
+
+
+class CallGraph:
+    def __init__(self, function_blocks):
+        """Build the call graph for a set of function blocks.
+
+        Function blocks are numbered in address order, and callees
+        are held as lists of block numbers (adjacency arrays).
+        Edges are taken from each block's xref_to list.
+        """
+        self.function_starts = sorted(function_blocks.keys())
+        self.function_index = {}
+        for idx, function_start in enumerate(self.function_starts):
+            self.function_index[function_start] = idx
+
+        self.callees = [[] for x in self.function_starts]
+        for idx, function_start in enumerate(self.function_starts):
+            xref_tos = function_blocks[function_start]['xref_to']
+            if xref_tos == None:
+                continue
+            for xref_to in xref_tos:
+                if xref_to not in self.function_index:
+                    continue
+                callee = self.function_index[xref_to]
+                if ((callee == idx) or (callee in self.callees[idx])):
+                    continue
+                self.callees[idx].append(callee)
+
+        # Call sites are only needed when building call chains.
+        self.caller_sites = {}
+
+        self.components = []
+        self.component_index = []
+        self.component_depths = []
+        self.identify_components()
+        self.compute_component_depths()
+
+    #-------------------- Queries -----------------------#
+    def get_caller_sites(self, function_start):
+        """Get (calling address, calling function block) pairs.
+
+        These are obtained from the function block's xref_from list.
+        None is returned if the function block has no xref_from list.
+        """
+        if function_start in self.caller_sites:
+            return self.caller_sites[function_start]
+        xrefs_from = common_objs.function_blocks[function_start]['xref_from']
+        if xrefs_from == None:
+            caller_sites = None
+        else:
+            caller_sites = []
+            for xref_from in xrefs_from:
+                caller_sites.append((
+                    xref_from,
+                    utils.id_function_block_for_instruction(xref_from)
+                ))
+        self.caller_sites[function_start] = caller_sites
+        return caller_sites
+
+    def get_call_depth(self, function_start):
+        if function_start not in self.function_index:
+            return 0
+        component = self.component_index[self.function_index[function_start]]
+        return self.component_depths[component]
+
+    #-------------------- Call depth -----------------------#
+    def identify_components(self):
+        # Tarjan's strongly connected components algorithm, using
+        #  an explicit stack, as call chains can be very long.
+        # Components are numbered in reverse topological order,
+        #  i.e., callees before callers.
+        num_functions = len(self.function_starts)
+        self.component_index = [None] * num_functions
+        visit_index = [None] * num_functions
+        low_link = [0] * num_functions
+        on_stack = [False] * num_functions
+        component_stack = []
+        counter = 0
+
+        for root in range(num_functions):
+            if visit_index[root] != None:
+                continue
+            call_stack = [(root, 0)]
+            visit_index[root] = counter
+            low_link[root] = counter
+            counter += 1
+            component_stack.append(root)
+            on_stack[root] = True
+            while call_stack != []:
+                (node, edge) = call_stack[-1]
+                if edge < len(self.callees[node]):
+                    call_stack[-1] = (node, edge+1)
+                    callee = self.callees[node][edge]
+                    if visit_index[callee] == None:
+                        visit_index[callee] = counter
+                        low_link[callee] = counter
+                        counter += 1
+                        component_stack.append(callee)
+                        on_stack[callee] = True
+                        call_stack.append((callee, 0))
+                    elif on_stack[callee] == True:
+                        low_link[node] = min(low_link[node], visit_index[callee])
+                    continue
+
+                call_stack.pop()
+                if call_stack != []:
+                    parent = call_stack[-1][0]
+                    low_link[parent] = min(low_link[parent], low_link[node])
+                if low_link[node] != visit_index[node]:
+                    continue
+                component = []
+                while True:
+                    member = component_stack.pop()
+                    on_stack[member] = False
+                    self.component_index[member] = len(self.components)
+                    component.append(member)
+                    if member == node:
+                        break
+                self.components.append(component)
+
+    def compute_component_depths(self):
+        # The call depth of a function is the length of the longest
+        #  call chain from it, with mutually recursive functions
+        #  (i.e., a component) counting as a single function.
+        self.component_depths = [0] * len(self.components)
+        for component_idx, component in enumerate(self.components):
+            depth = 0
+            for member in component:
+                for callee in self.callees[member]:
+                    callee_component = self.component_index[callee]
+                    if callee_component == component_idx:
+                        continue
+                    depth = max(
+                        depth,
+                        self.component_depths[callee_component] + 1
+                    )
+            self.component_depths[component_idx] = depth
+        logging.debug(
+            'Call graph has '
+            + str(len(self.function_starts))
+            + ' functions in '
+            + str(len(self.components))
+            + ' components.'
+        )
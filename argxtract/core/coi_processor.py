@@ -1,6 +1,5 @@
 import os
 import sys
-import json
 import copy
 import struct
 import logging
@@ -12,16 +11,21 @@ from collections import Counter
 from argxtract.common import paths as common_paths
 from argxtract.core import utils
 from argxtract.core import consts
+from argxtract.core import binary_operations as binops
 from argxtract.common import objects as common_objs
+from argxtract.core.arg_compiler import ArgDefinitionCompiler
 from argxtract.core.chipset_analyser import ChipsetAnalyser
 from argxtract.core.register_evaluator import RegisterEvaluator
 from argxtract.core.function_pattern_matcher import FunctionPatternMatcher
+from argxtract.core.trace_tree import TraceTreeBuilder
+from argxtract.core.paged_memory import PagedMemory
 
 
 class CoiProcessor:
     def __init__(self):
         self.chipset_analyser = ChipsetAnalyser()
         self.reg_eval = RegisterEvaluator()
+        self.arg_compiler = ArgDefinitionCompiler()
         
     def identify_coi_addresses(self):
         coi_address_object = {}
@@ -31,6 +35,12 @@ class CoiProcessor:
             return
 
         for arg_file in coi_list:
+            # Definitions that can't be compiled can't be processed.
+            compiled_args = self.arg_compiler.get_compiled_definition(
+                arg_file
+            )
+            if compiled_args == None:
+                continue
             coi_name = (os.path.basename(arg_file)).replace('.json', '')
             coi_address_object[coi_name] = {}
             coi_address_object[coi_name]['callers'] = []
@@ -54,31 +64,21 @@ class CoiProcessor:
             coi_address_object[svc_name]['svc_num'] = svc_num
             svc_nums_of_interest[svc_num] = svc_name
             
-        all_addresses = list(common_objs.disassembled_firmware.keys())
-        all_addresses.sort()
-        ins_address = common_objs.code_start_address - 2
-        while ins_address <= common_objs.code_end_address:
-            ins_address += 2
-            if ins_address not in common_objs.disassembled_firmware:
+        # Only consider SVC instructions with numbers we are interested in.
+        for ins_address in self.find_svc_encodings(svc_nums_of_interest):
+            if ((ins_address < common_objs.code_start_address) 
+                    or (ins_address > (common_objs.code_end_address + 2))):
                 continue
-            if ins_address in common_objs.errored_instructions:
+            # Make sure the bytes were actually disassembled as an SVC.
+            if utils.is_valid_code_address(ins_address) != True:
                 continue
-            if common_objs.disassembled_firmware[ins_address]['is_data'] == True:
-                continue
-            
             insn = common_objs.disassembled_firmware[ins_address]['insn']
-            if insn == None: 
-                continue
-                
-            # Only consider SVC instructions.
             if (insn.id != ARM_INS_SVC):
                 continue
                 
             # Get svc call.
             svc_number = insn.operands[0].value.imm
-            
-            # If SVC number not one that we are interested in, then continue.
-            if svc_number not in list(svc_nums_of_interest.keys()):
+            if svc_number not in svc_nums_of_interest:
                 continue
             
             svc_name = svc_nums_of_interest[svc_number]
@@ -97,6 +97,22 @@ class CoiProcessor:
         new_address_object = None
         coi_address_object = None
         
+    def find_svc_encodings(self, svc_nums):
+        # Thumb SVC is encoded as the halfword 0xDFxx, where xx is the 
+        #  SVC number. Scanning the raw bytes for these is much faster than 
+        #  checking every instruction in the disassembled firmware.
+        core_bytes = common_objs.core_bytes
+        halfwords = np.frombuffer(
+            core_bytes, 
+            dtype='<u2', 
+            count=len(core_bytes)//2
+        )
+        is_svc = ((halfwords & 0xFF00) == 0xDF00)
+        is_svc &= np.isin(halfwords & 0x00FF, list(svc_nums))
+        svc_addresses = common_objs.disassembly_start_address \
+            + (2 * np.nonzero(is_svc)[0])
+        return svc_addresses.tolist()
+        
     def get_svc_num(self, svc_name):
         if ((common_objs.vendor_svc_set != None) and 
                 (common_objs.vendor_svc_set != {})):
@@ -116,142 +132,63 @@ class CoiProcessor:
     
     #-------------------- Trace -----------------------#
     def process_coi_chains(self):
+        # Memory is held as integer bytes, as handed back to the tracer.
+        #  It is updated in place, and the tracer gets a fork of it.
         self.output_object = {
             'output': {},
-            'memory': {},
+            'memory': PagedMemory(),
             'cois': []
         }
+        # Addresses whose values were spilled over from multi-byte 
+        #  output values (i.e., that weren't written explicitly).
+        self.spilled_addresses = set()
 
-        processing_object = {}
-        all_fblocks = []
+        # Build the combined trace tree directly from the call graph.
+        # Combining the chains reduces trace time.
+        trace_tree_builder = TraceTreeBuilder(common_objs.max_trace_tree_size)
+        start_fblocks = []
         for coi_name in common_objs.coi_addresses:
-            # Get call chains.
-            (coi_chains, fblocks) = self.find_all_coi_chains(
+            logging.debug('Looking for COI name: ' + coi_name)
+            # For every instruction that calls the COI, identify the 
+            #  function block that it belongs to.
+            # This is the starting point for the COI call chains.
+            call_sites = []
+            for xref_from_coi in common_objs.coi_addresses[coi_name]['callers']:
+                function_block = utils.id_function_block_for_instruction(
+                    xref_from_coi
+                )
+                if function_block not in start_fblocks:
+                    start_fblocks.append(function_block)
+                call_sites.append((xref_from_coi, function_block))
+            is_chain_added = trace_tree_builder.add_coi_call_sites(
                 coi_name,
-                store=False
+                call_sites
             )
-            if len(coi_chains) > 0:
+            if is_chain_added == True:
                 self.output_object['cois'].append(coi_name)
-            processing_object[coi_name] = coi_chains
-            for fblock in fblocks:
-                if fblock not in all_fblocks:
-                    all_fblocks.append(fblock)
-        # Combine the outputs, to reduce trace time.
-        combined_trace_object = self.combine_coi_traces(processing_object)
+            else:
+                logging.info('No COI chains identified.')
+        logging.debug(
+            'Trace tree has '
+            + str(trace_tree_builder.num_nodes)
+            + ' nodes.'
+        )
+        combined_trace_object = trace_tree_builder.annotate_trace_tree()
         
         # Save the function blocks in common_objs, so that we don't 
         #  accidentally denylist them.
-        common_objs.coi_function_blocks = all_fblocks
+        common_objs.coi_function_blocks = \
+            trace_tree_builder.get_chain_function_blocks(start_fblocks)
         
         # Get output from register trace.
         unhandled = self.reg_eval.estimate_reg_values_for_trace_object(
             combined_trace_object,
-            self
+            self,
+            trace_tree_builder
         )
         self.output_object['unhandled'] = unhandled
         return self.output_object
         
-    def find_all_coi_chains(self, coi_name, store=True):
-        """Find all call chains tracing backwards from a COI."""
-        all_coi_chains = []
-        fblock_list = []
-        
-        logging.debug('Looking for COI name: ' + coi_name)
-
-        # First get all instructions that call the COI.
-        xrefs_from_coi = common_objs.coi_addresses[coi_name]['callers']
-        
-        starting_points = []
-        # For every instruction that call the COI, identify the function
-        #  block that it belongs to.
-        # This is the starting point for the COI call chain.
-        for xref_from_coi in xrefs_from_coi:
-            function_block = utils.id_function_block_for_instruction(
-                xref_from_coi
-            )
-            if function_block not in fblock_list:
-                fblock_list.append(function_block)
-            coixref_functionblock = str(xref_from_coi) + ':' + str(function_block)
-            starting_points.append(coixref_functionblock)
-        starting_points = list(set(starting_points))
-        
-        # For each call to the COI, get the call chain.
-        for starting_point in starting_points:
-            logging.trace('Getting chains for ' + starting_point)
-            self.get_chain(starting_point, '', all_coi_chains, fblock_list)
-        
-        if len(all_coi_chains) == 0:
-            logging.info('No COI chains identified.')
-            return (all_coi_chains, fblock_list)
-            
-        all_coi_chains.sort()
-        
-        debug_msg = 'COI chains:\n'
-        for item in all_coi_chains:
-            debug_msg += '\t\t\t\t' + str(item) + '\n'
-        logging.debug(debug_msg)
-        
-        if store == True:
-            common_objs.coi_chains = all_coi_chains
-        else:
-            return (all_coi_chains, fblock_list)
-    
-    def get_chain(self, xref_fblock, chain, output_list, fblock_list):
-        if chain == '':
-            chain = xref_fblock
-        else:
-            chain = chain + ',' + xref_fblock
-
-        xref = int(xref_fblock.split(':')[0])
-        func_block = int(xref_fblock.split(':')[1])
-        
-        # Check for calls to this function block.
-        if func_block not in common_objs.function_blocks:
-            output_list.append(chain)
-            return
-        xrefs_from = common_objs.function_blocks[func_block]['xref_from']
-        
-        # If there are no calls to this function block, perhaps it's the 
-        #  end of the chain, i.e., the starting point.
-        # Add it to the list and return.
-        if xrefs_from == None:
-            output_list.append(chain)
-            return
-        
-        # If there are calls to this function block, get xrefs for the 
-        #  "callers" (the xref_froms).
-        callers = []
-        for xref_from in xrefs_from:
-            function_block = utils.id_function_block_for_instruction(
-                xref_from
-            )
-            # If it's self-references, ignore.
-            if function_block == func_block:
-                continue
-            # If it's the Reset Handler, ignore.
-            if function_block == common_objs.application_vector_table['reset']:
-                output_list.append(chain)
-                continue
-                
-            if function_block not in fblock_list:
-                fblock_list.append(function_block)
-                
-            xref_functionblock = str(xref_from) + ':' + str(function_block)
-            
-            # If this item is already in chain, then we would just be looping 
-            #  over and over. Stop at this point instead?
-            split_chain = chain.split(',')
-            if xref_functionblock in split_chain:
-                output_list.append(chain)
-                continue
-                
-            callers.append(xref_functionblock)
-        callers = list(set(callers))
-        
-        # Recursively check.
-        for caller in callers:
-            self.get_chain(caller, chain, output_list, fblock_list)
-
     def get_arg_files(self):
         arg_files = []
         arg_dir = os.path.join(
@@ -266,65 +203,6 @@ class CoiProcessor:
                     arg_files.append(os.path.join(root, filename))
         return arg_files
 
-    def combine_coi_traces(self, all_coi_object):
-        output_object = {}
-        for coi_name in all_coi_object:
-            list_coi_chain = all_coi_object[coi_name]
-            for coi_chain in list_coi_chain:
-                output_object = self.add_chain_to_trace_object(
-                    output_object,
-                    coi_chain,
-                    coi_name
-                )
-        output_object = utils.order_dict(output_object)
-        self.annotation_id = 0
-        for key in output_object:
-            output_object[key]['branch_or_end_points'] = \
-                self.annotate_trace_object(
-                    output_object[key]['branch_or_end_points']
-                )
-        self.annotation_id = None
-        return output_object
-    
-    def add_chain_to_trace_object(self, output_object, coi_chain, coi_name):
-        combined_object = output_object
-        chain_elements = coi_chain.split(',')
-        chain_elements.reverse()
-        while len(chain_elements) > 0:
-            ins_address = int(chain_elements[0].split(':')[0])
-            function_block = int(chain_elements[0].split(':')[1])
-            if function_block not in combined_object:
-                combined_object[function_block] = {
-                    'branch_or_end_points': {}
-                }
-            
-            working_object = combined_object[function_block]['branch_or_end_points']
-            if ins_address not in working_object:
-                working_object[ins_address] = {
-                    'is_end': False,
-                    'coi_name': None,
-                    'branch_target': {}
-                }
-            if len(chain_elements) == 1:
-                working_object[ins_address]['is_end'] = True
-                working_object[ins_address]['coi_name'] = coi_name
-            combined_object = working_object[ins_address]['branch_target']
-            chain_elements = chain_elements[1:]
-        return output_object
-  
-    def annotate_trace_object(self, dictionary):
-        for k in dictionary:
-            if dictionary[k]['is_end'] == False:
-                for branch in dictionary[k]['branch_target']:
-                    dictionary[k]['branch_target'][branch]['branch_or_end_points'] = \
-                        self.annotate_trace_object(
-                            dictionary[k]['branch_target'][branch]['branch_or_end_points']
-                        )
-            else:
-                dictionary[k]['id'] = 'epid' + str(self.annotation_id)
-                self.annotation_id += 1
-        return dictionary
-        
     """ ================== Argument processing ================== """
     def process_trace_output(self, trace_output):
         self.temporary_object = {}
@@ -334,6 +212,10 @@ class CoiProcessor:
 
         # Match up with COI definitions per output item.
         for item in trace_output:
+            # Registers and (byte) memory are integer values, as held 
+            #  by the tracer.
+            memory_regs = trace_output[item]
+            
             # First assign all existing memory addresses.
             # Otherwise we lose this information.
             self.output_object['memory'] = self.update_memory(
@@ -343,7 +225,7 @@ class CoiProcessor:
             
             # Now match COI definition.
             output_item = self.match_coi_definition(
-                trace_output[coi_name],
+                memory_regs,
                 coi_name
             )
             is_object_already_present = False
@@ -355,11 +237,11 @@ class CoiProcessor:
                 self.output_object['output'][coi_name].append(output_item['output'])
             # If COI definition had output values to update in memory,
             #  do that now.
-            self.output_object['memory'] = self.update_memory(
+            self.output_object['memory'] = self.update_output_memory(
                 self.output_object['memory'],
                 output_item['memory']
             )
-        return self.output_object['memory']
+        return self.output_object['memory'].fork()
     
     def match_coi_definition(self, memory_regs, coi_name):
         arg_file = os.path.join(
@@ -367,62 +249,56 @@ class CoiProcessor:
             'args',
             coi_name + '.json'
         )
-        with open(arg_file) as f:
-            coi_definitions = json.load(f)
-            
+        compiled_args = self.arg_compiler.get_compiled_definition(arg_file)
+        
         register = ARM_REG_R0
-        stack_pointer = self.reg_eval.get_register_bytes(
-            memory_regs['registers'],
-            ARM_REG_SP,
-            'int'
-        )
         output_object = {
             'output': {},
             'memory': {}
         }
-        for arg in coi_definitions['args']:
-            val = self.reg_eval.get_register_bytes(
-                memory_regs['registers'],
-                register
-            )
-            if val == None: val = '00000000'
-            logging.debug(
-                'Read value '
-                + str(val)
-                + ' from register: '
-                + str(register)
-            )
+        if compiled_args == None:
+            return output_object
+            
+        for compiled_arg in compiled_args:
+            val = None
+            if register in memory_regs['registers']:
+                val = memory_regs['registers'][register]
+            if val == None: val = 0x00000000
+            if utils.is_log_enabled(logging.DEBUG):
+                logging.debug(
+                    'Read value '
+                    + '{0:08x}'.format(val)
+                    + ' from register: '
+                    + str(register)
+                )
             register += 1
             # Process the value, according to the definition.
             output_object = self.process_argument(
-                coi_definitions['args'][arg],
+                compiled_arg,
                 memory_regs,
                 val,
                 output_object
             )
         return output_object
             
-    def process_argument(self, arg_definition, memory_regs, val, output_object):
+    def process_argument(self, compiled_arg, memory_regs, val, output_object):
         # If output.
-        if arg_definition['in_out'] == 'out':
-            mem_address = val
-            if 'memory_offset' in arg_definition:
-                mem_address += arg_definition['memory_offset']
+        if compiled_arg['in_out'] == 'out':
             output_object = self.process_output(
-                arg_definition,
-                mem_address,
+                compiled_arg['output_data'],
+                val,
                 output_object
             )
             return output_object
 
         # Process the value according to data structure.
-        data_structure = arg_definition['data']
+        data_structure = compiled_arg['data']
         structured_data = {}
         
-        if arg_definition['ptr_val'] == 'pointer':
-            mem_address = int(val, 16)
-            if 'memory_offset' in arg_definition:
-                mem_address += arg_definition['memory_offset']
+        if compiled_arg['ptr_val'] == 'pointer':
+            mem_address = val
+            if compiled_arg['memory_offset'] != None:
+                mem_address += compiled_arg['memory_offset']
             structured_data = self.process_pointer_data(
                 data_structure,
                 memory_regs,
@@ -430,11 +306,12 @@ class CoiProcessor:
                 structured_data
             )
         else:
-            value = self.convert_to_bit_string(val)
+            # Register values are 32 bits wide.
+            bit_field = (val, 32)
             structured_data = self.process_value_data(
                 data_structure,
                 memory_regs,
-                value,
+                bit_field,
                 structured_data
             )
 
@@ -446,119 +323,73 @@ class CoiProcessor:
         # If custom output:
         # Note that this is different to just "out"! This has input AND output.
         # We also ignore any memory offset.
-        if 'out' in arg_definition['in_out']:
-            mem_address = val
+        if compiled_arg['output_data'] != None:
             output_object = self.process_output(
-                arg_definition,
-                mem_address,
+                compiled_arg['output_data'],
+                val,
                 output_object
             )
         return output_object
     
-    def process_value_data(self, data_structure, memory_regs, value_in_bits, current_object):
-        logging.debug(
-            'Start Process Value Data , with starting bits: ' 
-            + value_in_bits
-        )
+    def process_value_data(self, data_structure, memory_regs, bit_field, current_object):
         structured_data = {}
-        if (len(list(data_structure.keys())) == 1):
-            arg_name = list(data_structure.keys())[0]
-            logging.debug(
-                'Single element structure for '
-                + arg_name
-                + ' with bits: '
-                + value_in_bits
-            )
-            element = self.format_element(
-                data_structure[arg_name],
+        if len(data_structure) == 1:
+            element = data_structure[0]
+            structured_data[element['name']] = self.format_element(
+                element,
                 memory_regs,
-                value_in_bits,
+                bit_field,
                 current_object
             )
-            structured_data[arg_name] = element
             return structured_data
             
-        # If there is more than one key, then further processing is needed.
-        for structure_element in data_structure:
-            logging.debug(
-                'Analysing ' 
-                + structure_element 
-                + ' in value mode, with starting bits: '
-                + value_in_bits
-            )
-            structured_data[structure_element] = self.process_value_element(
-                data_structure[structure_element],
-                memory_regs,
-                value_in_bits,
+        # If there is more than one element, then further processing is needed.
+        # (The compiler ensures that none of the elements are pointers.)
+        for element in data_structure:
+            len_bits = self.get_length_field(
+                element,
                 structured_data
             )
-            # Update bitstring.
-            if data_structure[structure_element]['ptr_val'] == 'pointer':
-                len_bits = 32
-            else:
-                len_bits = self.get_length_field(
-                    data_structure[structure_element],
-                    structured_data
+            (element_field, _) = self.split_bit_field(bit_field, len_bits)
+            if ((element_field != None) and (element_field[1] < len_bits)):
+                logging.error(
+                    'Incorrect number of bits! ' 
+                    + self.bit_field_to_string(element_field)
                 )
-            value_in_bits = value_in_bits[len_bits:]
-            
-        return structured_data
-        
-    def process_value_element(self, data_structure, memory_regs, value_in_bits, current_object):
-        if data_structure['ptr_val'] == 'pointer':
-            address = int(value_in_bits[0:32], 2)
-            structured_data = self.process_pointer_data(
-                data_structure,
+            structured_data[element['name']] = self.format_element(
+                element,
                 memory_regs,
-                address,
-                current_object
+                element_field,
+                structured_data
             )
-        else:
+            # Update remaining bits.
             len_bits = self.get_length_field(
-                data_structure,
-                current_object
-            )
-            element_bits = value_in_bits[0:len_bits]
-            if len(element_bits) < len_bits:
-                logging.error('Incorrect number of bits! ' + element_bits)
-            structured_data = self.format_element(
-                data_structure,
-                memory_regs,
-                element_bits,
-                current_object
+                element,
+                structured_data
             )
+            (_, bit_field) = self.split_bit_field(bit_field, len_bits)
+            
         return structured_data
         
     def process_pointer_data(self, data_structure, memory_regs, mem_address, current_object):
-        logging.debug(
-            'Start Process Pointer Data , with starting address: ' 
-            + hex(mem_address)
-        )
         structured_data = {}
-        for structure_element in data_structure:
-            logging.debug(
-                'Analysing ' 
-                + structure_element 
-                + ' in pointer mode, with address:'
-                + hex(mem_address)
-            )
-            
+        for element in data_structure:
             # Get offset for next address.
-            if data_structure[structure_element]['ptr_val'] == 'pointer':
+            if element['ptr_val'] == 'pointer':
                 offset = 4
                 # Addresses must be word-aligned.
                 modulo_remainder = mem_address % 4
                 mem_address += modulo_remainder
             else:
                 len_bits = self.get_length_field(
-                    data_structure[structure_element],
+                    element,
                     current_object
                 )
                 offset = int(len_bits/8)
             
             # Process according to different types.
-            structured_data[structure_element] = self.process_pointer_element(
-                data_structure[structure_element],
+            structured_data[element['name']] = self.process_pointer_element(
+                element,
                 memory_regs,
                 mem_address,
                 structured_data
@@ -569,165 +400,87 @@ class CoiProcessor:
             
         return structured_data
         
-    def process_pointer_element(self, data_structure, memory_regs, mem_address, current_object):
-        # We consider 4 cases: 
-        if ((data_structure['ptr_val'] == 'value') 
-                and (data_structure['type'] != 'dict')):
-            structured_data = self.process_pointer_value_nondictionary(
-                data_structure,
-                memory_regs,
-                mem_address,
-                current_object
-            )
-        elif ((data_structure['ptr_val'] == 'value') 
-                and (data_structure['type'] == 'dict')):
-            structured_data = self.process_pointer_value_dictionary(
-                data_structure['data'],
-                memory_regs,
-                mem_address,
-                current_object
-            )
-        elif ((data_structure['ptr_val'] == 'pointer') 
-                and (data_structure['type'] != 'dict')):
-            structured_data = self.process_pointer_pointer_nondictionary(
-                data_structure,
+    def process_pointer_element(self, element, memory_regs, mem_address, current_object):
+        # Structures are processed from memory, either at the current 
+        #  address or at the address that it points to.
+        if element['type'] == 'dict':
+            if element['ptr_val'] == 'pointer':
+                mem_address = self.get_data_from_memory(
+                    memory_regs,
+                    mem_address,
+                    4
+                )
+            structured_data = self.process_pointer_data(
+                element['data'],
                 memory_regs,
                 mem_address,
                 current_object
             )
-        else:
-            structured_data = self.process_pointer_pointer_dictionary(
-                data_structure['data'],
+            return structured_data
+        
+        # Other elements are read from memory and formatted.
+        if element['ptr_val'] == 'pointer':
+            mem_address = self.get_data_from_memory(
                 memory_regs,
                 mem_address,
-                current_object
+                4
             )
-        return structured_data
-            
-    def process_pointer_value_nondictionary(self, data_structure, memory_regs, mem_address, current_object):
-        # Just read bits and format.
         len_bits = self.get_length_field(
-            data_structure,
+            element,
             current_object
         )
         num_bytes = int(len_bits/8)
-        
-        if 'byte-endian' in data_structure:
-            byte_endianness = data_structure['byte-endian']
-        else:
-            byte_endianness = None
         value = self.get_data_from_memory(
             memory_regs,
             mem_address,
             num_bytes,
-            byte_endianness
-        )
-        # Convert to bits.
-        value_in_bits = self.convert_to_bit_string(value)
-        element = self.format_element(
-            data_structure,
-            memory_regs,
-            value_in_bits,
-            current_object
-        )
-        return element
-        
-    def process_pointer_value_dictionary(self, data_structure, memory_regs, mem_address, current_object):
-        element = self.process_pointer_data(
-            data_structure,
-            memory_regs,
-            mem_address,
-            current_object
-        )
-        return element
-        
-    def process_pointer_pointer_nondictionary(self, data_structure, memory_regs, mem_address, current_object):
-        # Get address (from memory).
-        address_value = self.get_data_from_memory(
-            memory_regs,
-            mem_address,
-            4
-        )
-        new_address = int(address_value, 16)
-
-        # Read from new address in memory.
-        len_bits = self.get_length_field(
-            data_structure,
-            current_object
-        )
-        num_bytes = int(len_bits/8)
-        if 'byte-endian' in data_structure:
-            byte_endianness = data_structure['byte-endian']
-        else:
-            byte_endianness = None
-        value = self.get_data_from_memory(
-            memory_regs,
-            new_address,
-            num_bytes,
-            byte_endianness
-        )
-        
-        # Convert to bits.
-        value_in_bits = self.convert_to_bit_string(value)
-        
-        # Format
-        element = self.format_element(
-            data_structure,
-            memory_regs,
-            value_in_bits,
-            current_object
+            element['byte_endian']
         )
-        return element
-        
-    def process_pointer_pointer_dictionary(self, data_structure, memory_regs, mem_address, current_object):
-        # Get address from memory.
-        address_value = self.get_data_from_memory(
-            memory_regs,
-            mem_address,
-            4
-        )
-        new_address = int(address_value, 16)
-        
-        # Pass to normal processing?
-        element = self.process_pointer_data(
-            data_structure,
+        bit_field = (value, 8*num_bytes)
+        structured_data = self.format_element(
+            element,
             memory_regs,
-            new_address,
+            bit_field,
             current_object
         )
-        return element
+        return structured_data
     
     def get_data_from_memory(self, memory_regs, mem_address, num_bytes, 
                 endian=common_objs.endian):
-        logging.debug(
-            'Reading '
-            + str(num_bytes)
-            + ' from memory address: '
-            + hex(mem_address)
-        )
-        if num_bytes == 0: return ''
+        """Read num_bytes from mem_address, as an integer value."""
+        if utils.is_log_enabled(logging.DEBUG):
+            logging.debug(
+                'Reading '
+                + str(num_bytes)
+                + ' from memory address: '
+                + hex(mem_address)
+            )
+        if num_bytes == 0: return 0
         address_type = self.reg_eval.get_address_type(
             mem_address,
             memory_regs['memory']
         )
         if address_type == consts.ADDRESS_FIRMWARE:
-            value = utils.get_firmware_bytes(
-                mem_address,
+            offset = mem_address - common_objs.disassembly_start_address
+            value_bytes = self.get_firmware_data_bytes(
+                offset,
                 num_bytes,
-                'hex',
                 endian
             )
-            return value
+            return self.convert_data_bytes(value_bytes, num_bytes)
         if address_type == consts.ADDRESS_DATA:
-            value = self.reg_eval.get_data_bytes(
-                mem_address,
-                num_bytes,
-                'hex',
-                endian
-            )
-            return value
-        value = ''           
+            # The data region is read as a whole, in the given byte order.
+            offset = mem_address - common_objs.data_segment_start_address
+            offset = common_objs.data_segment_start_firmware_address \
+                        + offset \
+                        - common_objs.disassembly_start_address
+            value_bytes = common_objs.core_bytes[offset:(offset+num_bytes)]
+            if endian == 'little':
+                value_bytes = value_bytes[::-1]
+            return self.convert_data_bytes(value_bytes, num_bytes)
         if (num_bytes%4 == 0):
+            # Words are concatenated in address order.
+            value = 0
             num_words = int(num_bytes/4)
             for i in range(num_words):
                 read_word = self.get_memory_bytes(
@@ -736,9 +489,7 @@ class CoiProcessor:
                     4,
                     endian
                 )
-                if ((read_word == None) or (read_word == '')):
-                    read_word = '00000000'
-                value += read_word
+                value = (value << 32) | read_word
         else:
             value = self.get_memory_bytes(
                 memory_regs['memory'],
@@ -746,231 +497,262 @@ class CoiProcessor:
                 num_bytes,
                 endian
             )
-        if ((value == None) or (value == '')):
-            value = ''.zfill(num_bytes * 2)
-        if len(value) < (num_bytes*2):
-            diff = (num_bytes*2) - len(value)
-            for i in range(diff):
-                value += '0'
         return value
         
+    def get_firmware_data_bytes(self, offset, num_bytes, endian):
+        # Firmware is read by word (then by half-word and byte), 
+        #  with each read in the given byte order.
+        value_bytes = b''
+        remaining_bytes = num_bytes
+        while remaining_bytes > 0:
+            if remaining_bytes >= 4:
+                obtained_bytes = 4
+            elif remaining_bytes >= 2:
+                obtained_bytes = 2
+            else:
+                obtained_bytes = 1
+            data_bytes = common_objs.core_bytes[offset:(offset+obtained_bytes)]
+            if endian == 'little':
+                data_bytes = data_bytes[::-1]
+            value_bytes += data_bytes
+            remaining_bytes -= obtained_bytes
+            offset += obtained_bytes
+        return value_bytes
+        
+    def convert_data_bytes(self, value_bytes, num_bytes):
+        # Bytes beyond the end of the file are read as 0.
+        if len(value_bytes) < num_bytes:
+            value_bytes = value_bytes + bytes(num_bytes - len(value_bytes))
+        return int.from_bytes(value_bytes, byteorder='big')
+        
     def get_memory_bytes(self, memory_map, address, num_bytes=4, endian=common_objs.endian):
         if ((num_bytes == 4) and (address%4 == 0)):
             logging.debug('Getting memory word.')
-            value = self.reg_eval.get_memory_word(memory_map, address, endian)
+            value = self.get_memory_concatenation(memory_map, address, 4, endian)
         elif ((num_bytes == 2) and (address%2 == 0)):
             logging.debug('Getting memory half-word.')
-            value = self.reg_eval.get_memory_halfword(memory_map, address, endian)
+            value = self.get_memory_concatenation(memory_map, address, 2, endian)
         else:
+            # Other reads are in address order.
             logging.debug('Getting memory bytes.')
-            remaining_bytes = num_bytes
-            value = ''
-            while remaining_bytes > 0:
-                if address not in memory_map:
-                    value += '00'
-                else:
-                    value += memory_map[address]
-                address += 1
-                remaining_bytes -= 1
-        if ((value == None) or (value == '')):
-            value = ''.zfill(num_bytes * 2)
+            value = self.get_memory_concatenation(
+                memory_map,
+                address,
+                num_bytes,
+                'big'
+            )
         return value
         
-    def process_bitfield_data(self, data_structure, memory_regs, value_in_bits, current_object):
+    def get_memory_concatenation(self, memory_map, address, num_bytes,
+                                    endian=common_objs.endian):
+        if endian == None: endian = common_objs.endian
+        # Unwritten addresses are read as 0.
+        value_bytes = bytes(
+            memory_map.get(address+i, 0) for i in range(num_bytes)
+        )
+        return int.from_bytes(value_bytes, byteorder=endian)
+        
+    def process_bitfield_data(self, data_structure, memory_regs, bit_field, current_object):
         structured_data = {}
-        first_level_keys = list(data_structure.keys())
-        for first_level_key in first_level_keys:
+        for element in data_structure:
             len_bits = self.get_length_field(
-                data_structure[first_level_key],
-                current_object
+                element,
+                structured_data
+            )
+            (element_field, bit_field) = self.split_bit_field(
+                bit_field,
+                len_bits
             )
-            element_bits = value_in_bits[0:len_bits]
-            value_in_bits = value_in_bits[len_bits:]
-            if data_structure[first_level_key]['type'] == 'dict':
-                structured_data[first_level_key] = self.process_value_data(
-                    data_structure[first_level_key]['data'],
+            if element['type'] == 'dict':
+                structured_data[element['name']] = self.process_value_data(
+                    element['data'],
                     memory_regs,
-                    element_bits,
+                    element_field,
                     structured_data
                 )
-            elif data_structure[first_level_key]['type'] == 'bitfield':
-                structured_data[first_level_key] = self.process_bitfield_data(
-                    data_structure[first_level_key]['data'],
+            elif element['type'] == 'bitfield':
+                structured_data[element['name']] = self.process_bitfield_data(
+                    element['data'],
                     memory_regs,
-                    element_bits,
+                    element_field,
                     structured_data
                 )
             else:
-                structured_data[first_level_key] = self.format_element(
-                    data_structure[first_level_key],
+                structured_data[element['name']] = self.format_element(
+                    element,
                     memory_regs,
-                    element_bits,
+                    element_field,
                     structured_data
                 )
         return structured_data
         
-    def get_length_field(self, data_structure, current_object):
-        length_bits = data_structure['length_bits']
-        if type(length_bits) is int:
-            return length_bits
+    def get_length_field(self, element, current_object):
+        if element['length_bits'] != None:
+            return element['length_bits']
 
-        split_pattern = length_bits.split(' ')
-        arithmetic_function = []
-        for element in split_pattern:
-            element = element.strip()
-            if element in ['*', '+', '-']:
-                arithmetic_function.append(element)
-            elif element.isdigit():
-                arithmetic_function.append(int(element))
+        (operator, operands) = element['length_expression']
+        values = []
+        for operand in operands:
+            if type(operand) is int:
+                values.append(operand)
             else:
-                element_value = self.get_previously_processed_data(
-                    element,
+                values.append(int(self.get_previously_processed_data(
+                    operand,
                     current_object
-                )
-                arithmetic_function.append(int(element_value))
-        output = arithmetic_function[0]
-        if '*' in arithmetic_function:
-            arithmetic_function.remove('*')
-            for value in arithmetic_function[1:]:
+                )))
+        output = values[0]
+        if operator == '*':
+            for value in values[1:]:
                 output = output * value
-        elif '+' in arithmetic_function:
-            arithmetic_function.remove('+')
-            for value in arithmetic_function[1:]:
+        elif operator == '+':
+            for value in values[1:]:
                 output = output + value
-        elif '-' in arithmetic_function:
-            arithmetic_function.remove('-')
-            for value in arithmetic_function[1:]:
+        elif operator == '-':
+            for value in values[1:]:
                 output = output - value
         return output
         
-    def get_previously_processed_data(self, pattern, current_object):
-        if pattern.startswith('#'):
-            pattern = pattern[1:]
-            value_to_store = copy.deepcopy(self.temporary_object)
+    def get_previously_processed_data(self, reference, current_object):
+        (is_argument_reference, components) = reference
+        if is_argument_reference == True:
+            value_to_store = self.temporary_object
         else:
-            value_to_store = copy.deepcopy(current_object)
+            value_to_store = current_object
             
-        split_path = pattern.split('->')
-        for component in split_path:
+        for component in components:
             value_to_store = value_to_store[component]
-        return value_to_store
+        return copy.deepcopy(value_to_store)
     
-    def format_element(self, format_structure, memory_regs, element_bits, current_object):
-        if 'word-endian' in format_structure:
-            element_bits = self.process_endianness(
-                element_bits,
-                format_structure['word-endian']
-            )
-        element = self.convert_element_type(
-            format_structure,
-            element_bits,
+    def format_element(self, element, memory_regs, bit_field, current_object):
+        if ((element['word_endian'] != None) and (bit_field != None)):
+            # Reverse the order of (little-endian) words.
+            bit_field = (
+                binops.reverse_words(
+                    bit_field[0],
+                    bit_field[1],
+                    element['word_endian']
+                ),
+                bit_field[1]
+            )
+        element_value = self.convert_element_type(
+            element,
+            bit_field,
             memory_regs,
             current_object
         )
-        return element
-    
-    def process_endianness(self, bitstring, endian):
-        string_len = int(endian.split('-')[1])
-        num_words = int(string_len/4)
-        if endian.startswith('little'):
-            converted_bits = ''.join(reversed([bitstring[i:i+string_len] 
-                    for i in range(0, len(bitstring), string_len)]))
-        else:
-            converted_bits = bitstring
-        return converted_bits
+        return element_value
         
-    def convert_element_type(self, element_structure, element_bits, memory_regs, current_object):
+    def convert_element_type(self, element, bit_field, memory_regs, current_object):
         len_bits = self.get_length_field(
-            element_structure,
+            element,
             current_object
         )
-        if ((element_bits == None) or (element_bits == '')):
+        if ((bit_field == None) or (bit_field[1] == 0)):
             return None
-        dtype = element_structure['type']
+        dtype = element['type']
         if dtype == 'hex':
-            element_value = int(element_bits, 2)
             len_halfbytes = int(len_bits/4)
-            element_value = '{0:0{1}x}'.format(element_value, len_halfbytes)
+            element_value = '{0:0{1}x}'.format(bit_field[0], len_halfbytes)
         elif dtype == 'int8':
-            element_value = int(element_bits, 2)
-            element_value = np.int8(element_value)
+            element_value = np.int8(bit_field[0])
         elif dtype == 'uint8':
-            element_value = int(element_bits, 2)
-            element_value = np.uint8(element_value)
+            element_value = np.uint8(bit_field[0])
         elif dtype == 'int16':
-            element_value = int(element_bits, 2)
-            element_value = np.int16(element_value)
+            element_value = np.int16(bit_field[0])
         elif dtype == 'uint16':
-            element_value = int(element_bits, 2)
-            element_value = np.uint16(element_value)
+            element_value = np.uint16(bit_field[0])
         elif dtype == 'int32':
-            element_value = int(element_bits, 2)
-            element_value = np.int32(element_value)
+            element_value = np.int32(bit_field[0])
         elif dtype == 'uint32':
-            element_value = int(element_bits, 2)
-            element_value = np.uint32(element_value)
+            element_value = np.uint32(bit_field[0])
         elif dtype == 'dict':
             element_value = self.process_value_data(
-                element_structure['data'],
+                element['data'],
                 memory_regs,
-                element_bits,
+                bit_field,
                 current_object
             )
         elif dtype == 'bitfield':
             element_value = self.process_bitfield_data(
-                element_structure['data'],
+                element['data'],
                 memory_regs,
-                element_bits,
+                bit_field,
                 current_object
             )
             
         return element_value
         
     def update_memory(self, memory_object, ram_data):
-        for address in ram_data:
-            if ram_data[address] == None:
+        # Tracer memory that was forked from this memory object still
+        #  shares most of its pages, and these needn't be compared.
+        if ((type(ram_data) is PagedMemory) 
+                and (type(memory_object) is PagedMemory)):
+            ram_items = ram_data.get_unshared_items(memory_object)
+        else:
+            ram_items = [(address, ram_data[address]) for address in ram_data]
+        for (address, value) in ram_items:
+            if value == None:
                 continue
             if address not in memory_object:
-                memory_object[address] = ram_data[address]
+                memory_object[address] = value
             else:
-                if memory_object[address] != ram_data[address]:
+                if memory_object[address] != value:
                     logging.debug(
                         'Duplicate address: '
                         + hex(address)
                         + '. Existing value: '
                         + str(memory_object[address])
                         + '. New value: '
-                        + str(ram_data[address])
+                        + str(value)
                     )
-                memory_object[address] = ram_data[address]
+                memory_object[address] = value
+        # Spilled addresses that the tracer holds are now explicit.
+        self.spilled_addresses = set([
+            address for address in self.spilled_addresses
+                if ram_data.get(address) == None
+        ])
         return memory_object
         
-    def process_output(self, arg_definition, val, output_object):
+    def update_output_memory(self, memory_object, output_memory):
+        # Output values are hex strings, which may span multiple bytes 
+        #  at a single address. Split these into individual 
+        #  (little-endian) bytes, without overwriting explicitly 
+        #  written addresses.
+        for address in sorted(output_memory.keys()):
+            value = output_memory[address]
+            if ((value == None) or (value == '')):
+                continue
+            if len(value) % 2 == 1:
+                value = '0' + value
+            value_bytes = bytes.fromhex(value)[::-1]
+            memory_object = self.update_memory(
+                memory_object,
+                {address: value_bytes[0]}
+            )
+            for i in range(1, len(value_bytes)):
+                if (((address+i) in memory_object) 
+                        and ((address+i) not in self.spilled_addresses)):
+                    continue
+                memory_object[address+i] = value_bytes[i]
+                self.spilled_addresses.add(address+i)
+        return memory_object
+        
+    def process_output(self, data_structure, val, output_object):
         logging.debug('Processing output object.')
-        for arg_name in arg_definition['data']:
-            if arg_definition['data'][arg_name]['type'] == 'dict':
+        for element in data_structure:
+            if element['type'] == 'dict':
                 output_object = self.process_output(
-                    arg_definition['data'][arg_name],
+                    element['data'],
                     val,
                     output_object
                 )
             else:
-                address_bytes = val[0:8]
-                mem_address = int(address_bytes, 16)
-                if len(val) > 8: val = val[8:]
-                output_definition = arg_definition['data'][arg_name]
-                if output_definition['store_type'] == 'value':
-                    value_to_store = output_definition['store']
-                    output_object['memory'][mem_address] = value_to_store
-                    logging.debug(
-                        'Storing value '
-                        + str(value_to_store) 
-                        + ' to memory address: '
-                        + hex(mem_address)
-                    )
-                elif output_definition['store_type'] == 'random':
+                mem_address = val
+                if element['store_type'] == 'value':
+                    value_to_store = element['store']
+                elif element['store_type'] == 'random':
                     num_random_bits = self.get_length_field(
-                        output_definition,
+                        element,
                         output_object
                     )
                     num_hex_chars = int(num_random_bits/4)
@@ -979,36 +761,36 @@ class CoiProcessor:
                     while value_to_store.replace('0', '').strip() == '':
                         value_to_store = hex(getrandbits(num_random_bits))[2:]
                     value_to_store = value_to_store.zfill(num_hex_chars)
-                    output_object['memory'][mem_address] = value_to_store
-                    logging.debug(
-                        'Storing value '
-                        + str(value_to_store) 
-                        + ' to memory address: '
-                        + hex(mem_address)
-                    )
                 else:
-                    value_to_store = output_definition['store']
-                    if '->' in value_to_store:
+                    value_to_store = element['store']
+                    if element['store_reference'] != None:
                         value_to_store = self.get_previously_processed_data(
-                            value_to_store,
+                            element['store_reference'],
                             output_object
                         )
-                    output_object['memory'][mem_address] = value_to_store
-                    logging.debug(
-                        'Storing value '
-                        + str(value_to_store) 
-                        + ' to memory address: '
-                        + hex(mem_address)
-                    )
-                if output_definition['output'] == True:
-                    output_object['output'][arg_name] = value_to_store
+                output_object['memory'][mem_address] = value_to_store
+                logging.debug(
+                    'Storing value '
+                    + str(value_to_store) 
+                    + ' to memory address: '
+                    + hex(mem_address)
+                )
+                if element['output'] == True:
+                    output_object['output'][element['name']] = value_to_store
         return output_object
         
-    def convert_to_bit_string(self, value):
-        if value == None: return value
-        if value == '': return value
-        if type(value) is str:
-            value = bin(int('1'+value, 16))[3:]
-        else:
-            value = bin(value)[2:]
-        return value
\ No newline at end of file
+    #---- Bit fields ----
+    # Values are decoded as (value, num_bits) pairs, where the bits
+    #  are read from the most significant end.
+    def split_bit_field(self, bit_field, field_bits):
+        if bit_field == None:
+            return (None, None)
+        return binops.split_leading_bits(
+            bit_field[0],
+            bit_field[1],
+            field_bits
+        )
+        
+    def bit_field_to_string(self, bit_field):
+        if bit_field[1] == 0: return ''
+        return '{0:0{1}b}'.format(bit_field[0], bit_field[1])
\ No newline at end of file
@@ -4,6 +4,10 @@ from capstone.arm import *
 MODE_SVC = 'svc'
 MODE_FUNCTION = 'function'
 
+# Time (in seconds) allowed for a worker process to stop when terminated,
+#  before it is killed.
+WORKER_TERMINATE_TIMEOUT = 5
+
 # ARM architecture.
 ARMv6M = 'armv6m'
 ARMv7M = 'armv7m'
@@ -28,6 +32,39 @@ NULL_HANDLING_NONE = 'n'
 NULL_HANDLING_LOOSE = 'l'
 NULL_HANDLING_STRICT = 's'
 
+# Translated instruction (trace step) types.
+STEP_ERRORED = 'errored'
+STEP_DATA = 'data'
+STEP_SKIP = 'skip'
+STEP_EXECUTE = 'execute'
+STEP_BRANCH = 'branch'
+STEP_TABLE_BRANCH = 'table_branch'
+STEP_IT = 'it'
+
+# Disassembly cache format version.
+# Increment whenever the disassembly/annotation output changes.
+DISASSEMBLY_CACHE_VERSION = 2
+
+# Instruction groups (for function fingerprints).
+# Stores are the instructions that write to memory during execution.
+LOAD_INSTRUCTIONS = [
+    ARM_INS_LDR, ARM_INS_LDREX, ARM_INS_LDRH, ARM_INS_LDRSH,
+    ARM_INS_LDREXH, ARM_INS_LDRB, ARM_INS_LDRSB, ARM_INS_LDREXB,
+    ARM_INS_LDRD, ARM_INS_LDM, ARM_INS_LDMDB, ARM_INS_POP
+]
+STORE_INSTRUCTIONS = [
+    ARM_INS_STR, ARM_INS_STREX, ARM_INS_STRH, ARM_INS_STREXH,
+    ARM_INS_STRB, ARM_INS_STREXB, ARM_INS_STRD, ARM_INS_STM,
+    ARM_INS_STMDB, ARM_INS_PUSH
+]
+CALL_INSTRUCTIONS = [ARM_INS_BL, ARM_INS_BLX]
+
+# Function fingerprint counts that pattern files can constrain
+#  (as min_<feature> and max_<feature>).
+FUNCTION_FEATURE_COUNTS = [
+    'instructions', 'loads', 'stores', 'calls', 'wide_instructions'
+]
+
 # Error codes
 ERROR_INVALID_INSTRUCTION = 'error_invalid_ins'
 
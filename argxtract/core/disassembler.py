@@ -1,9 +1,12 @@
 import os
 import sys
+import pickle
 import struct
+import hashlib
 import logging
-import numpy as np
 
+import numpy
+import capstone
 from capstone import *
 from capstone.arm import *
 from collections import Counter
@@ -14,6 +17,7 @@ from argxtract.core import binary_operations as binops
 from argxtract.common import paths as common_paths
 from argxtract.common import objects as common_objs
 from argxtract.core.strand_execution import StrandExecution
+from argxtract.core.instruction_record import lower_instruction
 
 md = Cs(CS_ARCH_ARM, CS_MODE_THUMB + CS_MODE_LITTLE_ENDIAN)
 # Turn on SKIPDATA mode - this is needed!
@@ -24,6 +28,10 @@ md.detail = True
 class FirmwareDisassembler:
     def __init__(self):
         self.arm_switch8 = None
+        # Instructions (and their base address) from the last 
+        #  disassembly, for re-use if disassembling at a different base.
+        self.decoded_instructions = None
+        self.decoded_base = None
         
     def estimate_app_code_base(self):
         logging.info('Estimating app code base.')
@@ -376,31 +384,33 @@ class FirmwareDisassembler:
         if common_objs.disassembled_firmware == {}:
             self.disassemble_and_handle_byte_errors()
             
-            trace_msg = 'Revised instructions (taking into account ' \
-                        + 'potential byte misinterpretations):\n'
-            for ins_address in common_objs.disassembled_firmware:
-                instruction = common_objs.disassembled_firmware[ins_address]['insn']
-                bytes = ''.join('{:02x}'.format(x) for x in instruction.bytes)
-                trace_msg += '\t\t\t\t\t\t\t\t0x%x:\t%s\t%s\t%s\n' %(ins_address,
-                                                bytes,
-                                                instruction.mnemonic,
-                                                instruction.op_str)
-            logging.trace(trace_msg)
+            if utils.is_log_enabled(logging.TRACE):
+                trace_msg = 'Revised instructions (taking into account ' \
+                            + 'potential byte misinterpretations):\n'
+                for ins_address in common_objs.disassembled_firmware:
+                    instruction = common_objs.disassembled_firmware[ins_address]['insn']
+                    bytes = ''.join('{:02x}'.format(x) for x in instruction.bytes)
+                    trace_msg += '\t\t\t\t\t\t\t\t0x%x:\t%s\t%s\t%s\n' %(ins_address,
+                                                    bytes,
+                                                    instruction.mnemonic,
+                                                    instruction.op_str)
+                logging.trace(trace_msg)
         
         # There's no need to disassemble again if app code base is 0.
         if common_objs.app_code_base > 0x00000000:
             logging.trace('Disassembling again due to non-zero code base.')
             self.disassemble_and_handle_byte_errors()
             
-            trace_msg = 'Final disassembly (prior to inline data checks):\n'
-            for ins_address in common_objs.disassembled_firmware:
-                instruction = common_objs.disassembled_firmware[ins_address]['insn']
-                bytes = ''.join('{:02x}'.format(x) for x in instruction.bytes)
-                trace_msg += '\t\t\t\t\t\t\t\t0x%x:\t%s\t%s\t%s\n' %(ins_address,
-                                                bytes,
-                                                instruction.mnemonic,
-                                                instruction.op_str)
-            logging.trace(trace_msg)
+            if utils.is_log_enabled(logging.TRACE):
+                trace_msg = 'Final disassembly (prior to inline data checks):\n'
+                for ins_address in common_objs.disassembled_firmware:
+                    instruction = common_objs.disassembled_firmware[ins_address]['insn']
+                    bytes = ''.join('{:02x}'.format(x) for x in instruction.bytes)
+                    trace_msg += '\t\t\t\t\t\t\t\t0x%x:\t%s\t%s\t%s\n' %(ins_address,
+                                                    bytes,
+                                                    instruction.mnemonic,
+                                                    instruction.op_str)
+                logging.trace(trace_msg)
             
         # Estimate architecture.
         self.test_arm_arch()
@@ -453,34 +463,35 @@ class FirmwareDisassembler:
 
         # Trace message.
         logging.trace('Regenerating instructions.')
-        all_addresses = list(common_objs.disassembled_firmware.keys())
-        all_addresses.sort()
-        trace_msg = 'Final instructions: \n'
-        address = common_objs.code_start_address - 2
-        while address <= common_objs.code_end_address:
-            address += 2
-            if address not in common_objs.disassembled_firmware:
-                continue
-            if common_objs.disassembled_firmware[address]['is_data'] == True:
-                next_address = utils.get_next_address(all_addresses, address)
-                if next_address == None: next_address = address + 2
-                data = utils.get_firmware_bytes(
-                    address,
-                    next_address-address
-                )
-                trace_msg += '\t\t\t\t\t\t\t\t0x%x:\t%s\t%s\t%s\n' %(address,
-                                            data,
-                                            'data',
-                                            '')
-            else:
-                insn = common_objs.disassembled_firmware[address]['insn']
-                bytes = insn.bytes
-                bytes = ''.join('{:02x}'.format(x) for x in bytes)
-                trace_msg += '\t\t\t\t\t\t\t\t0x%x:\t%s\t%s\t%s\n' %(address,
-                                            bytes,
-                                            insn.mnemonic,
-                                            insn.op_str)
-        logging.trace(trace_msg)
+        if utils.is_log_enabled(logging.TRACE):
+            all_addresses = list(common_objs.disassembled_firmware.keys())
+            all_addresses.sort()
+            trace_msg = 'Final instructions: \n'
+            address = common_objs.code_start_address - 2
+            while address <= common_objs.code_end_address:
+                address += 2
+                if address not in common_objs.disassembled_firmware:
+                    continue
+                if common_objs.disassembled_firmware[address]['is_data'] == True:
+                    next_address = utils.get_next_address(all_addresses, address)
+                    if next_address == None: next_address = address + 2
+                    data = utils.get_firmware_bytes(
+                        address,
+                        next_address-address
+                    )
+                    trace_msg += '\t\t\t\t\t\t\t\t0x%x:\t%s\t%s\t%s\n' %(address,
+                                                data,
+                                                'data',
+                                                '')
+                else:
+                    insn = common_objs.disassembled_firmware[address]['insn']
+                    bytes = insn.bytes
+                    bytes = ''.join('{:02x}'.format(x) for x in bytes)
+                    trace_msg += '\t\t\t\t\t\t\t\t0x%x:\t%s\t%s\t%s\n' %(address,
+                                                bytes,
+                                                insn.mnemonic,
+                                                insn.op_str)
+            logging.trace(trace_msg)
         
         self.vector_table_addresses = None
         
@@ -495,44 +506,305 @@ class FirmwareDisassembler:
         
         self.all_addresses = None
         
+        # Summarise the instructions, for marking the last instruction.
+        utils.build_instruction_table()
+        
         # Mark out last known instruction.
         common_objs.disassembled_firmware = self.mark_last_instruction(
             common_objs.disassembled_firmware
         )
         
-    def disassemble_fw(self):
+        # Addresses are final from here on, so index them.
+        utils.build_address_index()
+        
+    # =======================================================================
+    #--------------------------- Disassembly Cache --------------------------
+    def get_firmware_digest(self):
+        with open(common_paths.path_to_fw, 'rb') as f:
+            filebytes = f.read()
+        return hashlib.sha256(filebytes).hexdigest()
+        
+    def get_code_base_cache_file(self):
+        if common_paths.cache_path == None:
+            return None
+        
+        # The estimated code base depends on the file contents, the vendor,
+        #  and the versions of this tool's disassembly logic and of Capstone
+        #  (but not on the code base, unlike the disassembly).
+        cache_filename = self.get_firmware_digest() \
+            + '_' + str(common_objs.vendor) \
+            + '_v' + str(consts.DISASSEMBLY_CACHE_VERSION) \
+            + '_cs' + capstone.__version__ \
+            + '_code_base.pkl'
+        return os.path.join(common_paths.cache_path, cache_filename)
+        
+    def save_code_base_to_cache(self):
+        cache_file = self.get_code_base_cache_file()
+        if cache_file == None:
+            return
+        if common_objs.app_code_base == None:
+            return
+            
+        cache_object = {
+            'app_code_base': common_objs.app_code_base,
+            'self_targeting_branches': common_objs.self_targeting_branches
+        }
+        temp_file = cache_file + '.' + str(os.getpid())
+        with open(temp_file, 'wb') as f:
+            pickle.dump(cache_object, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_file, cache_file)
+        logging.debug('Saved app code base to cache: ' + cache_file)
+        
+    def load_code_base_from_cache(self):
+        # Looked up before estimating the code base, which would otherwise 
+        #  need a full disassembly (at base 0) on every run.
+        cache_file = self.get_code_base_cache_file()
+        if cache_file == None:
+            return False
+        if (not (os.path.isfile(cache_file))):
+            return False
+        
+        try:
+            with open(cache_file, 'rb') as f:
+                cache_object = pickle.load(f)
+        except Exception as e:
+            logging.warning(
+                'Unable to read app code base cache file '
+                + cache_file
+                + ': '
+                + str(e)
+            )
+            return False
+            
+        common_objs.app_code_base = cache_object['app_code_base']
+        common_objs.disassembly_start_address = common_objs.app_code_base
+        common_objs.self_targeting_branches = \
+            cache_object['self_targeting_branches']
         logging.info(
-            'Disassembling firmware using Capstone '
-            + 'using disassembly start address: '
-            + hex(common_objs.disassembly_start_address)
+            'App code base loaded from cache: ' 
+            + hex(common_objs.app_code_base)
         )
+        return True
         
-        disassembled_fw = {}
+    def get_disassembly_cache_file(self):
+        if common_paths.cache_path == None:
+            return None
+        
+        # The disassembled/annotated firmware depends on the file contents,
+        #  the code base, the vendor, and the versions of this tool's 
+        #  disassembly logic and of Capstone.
+        cache_filename = self.get_firmware_digest() \
+            + '_' + '{0:08x}'.format(common_objs.app_code_base) \
+            + '_' + str(common_objs.vendor) \
+            + '_v' + str(consts.DISASSEMBLY_CACHE_VERSION) \
+            + '_cs' + capstone.__version__ \
+            + '.pkl'
+        return os.path.join(common_paths.cache_path, cache_filename)
+        
+    def save_disassembly_to_cache(self):
+        cache_file = self.get_disassembly_cache_file()
+        if cache_file == None:
+            return
+        
+        # Instructions are stored as (lowered) instruction records,
+        #  so they needn't be decoded again when loading.
+        firmware = []
+        for address in common_objs.disassembled_firmware:
+            entry = common_objs.disassembled_firmware[address]
+            other_keys = {}
+            for key in entry:
+                if key in ['insn', '_insn', 'is_data']:
+                    continue
+                other_keys[key] = entry[key]
+            firmware.append((address, entry['insn'], entry['is_data'], other_keys))
+            
+        cache_object = {
+            'firmware': firmware,
+            'arm_arch': common_objs.arm_arch,
+            'code_end_address': common_objs.code_end_address,
+            'data_segment_start_address': 
+                common_objs.data_segment_start_address,
+            'data_segment_start_firmware_address': 
+                common_objs.data_segment_start_firmware_address,
+            'data_region': common_objs.data_region,
+            'errored_instructions': common_objs.errored_instructions,
+            'replace_functions': common_objs.replace_functions,
+            'table_branches': common_objs.table_branches
+        }
+        
+        # Write to a temporary file first, so that parallel processes 
+        #  never read a partially-written cache file.
+        temp_file = cache_file + '.' + str(os.getpid())
+        with open(temp_file, 'wb') as f:
+            pickle.dump(cache_object, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_file, cache_file)
+        logging.debug('Saved disassembly to cache: ' + cache_file)
+        
+    def load_disassembly_from_cache(self):
+        cache_file = self.get_disassembly_cache_file()
+        if cache_file == None:
+            return False
+        if (not (os.path.isfile(cache_file))):
+            return False
+        
+        try:
+            with open(cache_file, 'rb') as f:
+                cache_object = pickle.load(f)
+        except Exception as e:
+            logging.warning(
+                'Unable to read disassembly cache file '
+                + cache_file
+                + ': '
+                + str(e)
+            )
+            return False
+            
         with open(common_paths.path_to_fw, 'rb') as f:
-            byte_file = f.read()
-            # Save firmware bytes.
-            common_objs.core_bytes = byte_file
+            common_objs.core_bytes = f.read()
+            
+        disassembled_firmware = {}
+        for (address, insn, is_data, other_keys) in cache_object['firmware']:
+            entry = {
+                'insn': insn,
+                'is_data': is_data
+            }
+            entry.update(other_keys)
+            disassembled_firmware[address] = entry
+            
+        common_objs.disassembled_firmware = disassembled_firmware
+        common_objs.arm_arch = cache_object['arm_arch']
+        common_objs.code_end_address = cache_object['code_end_address']
+        common_objs.data_segment_start_address = \
+            cache_object['data_segment_start_address']
+        common_objs.data_segment_start_firmware_address = \
+            cache_object['data_segment_start_firmware_address']
+        common_objs.data_region = cache_object['data_region']
+        common_objs.errored_instructions = cache_object['errored_instructions']
+        common_objs.replace_functions = cache_object['replace_functions']
+        common_objs.table_branches = cache_object['table_branches']
+        
+        utils.build_address_index()
+        self.release_decoded_instructions()
+        logging.info('Loaded disassembly from cache.')
+        return True
+        
+    def disassemble_fw(self):
+        # If the firmware has already been disassembled (at some other base),
+        #  relocate that output rather than running Capstone again.
+        disassembled = self.rebase_disassembly()
+        if disassembled == None:
+            logging.info(
+                'Disassembling firmware using Capstone '
+                + 'using disassembly start address: '
+                + hex(common_objs.disassembly_start_address)
+            )
+            with open(common_paths.path_to_fw, 'rb') as f:
+                byte_file = f.read()
+                # Save firmware bytes.
+                common_objs.core_bytes = byte_file
 
-        disassembled = md.disasm(
-            byte_file,
-            common_objs.disassembly_start_address
-        )
+            # From here on, instructions are handled as plain records.
+            disassembled = self.disassemble_bytes(
+                byte_file,
+                common_objs.disassembly_start_address
+            )
+        self.decoded_instructions = disassembled
+        self.decoded_base = common_objs.disassembly_start_address
         
-        trace_msg = 'Disassembled firmware instructions:\n'
+        disassembled_fw = {}
         for instruction in disassembled:
             disassembled_fw[instruction.address] = {
                 'insn': instruction,
                 'is_data': False
             }
-            bytes = ''.join('{:02x}'.format(x) for x in instruction.bytes)
-            trace_msg += '\t\t\t\t\t\t\t\t0x%x:\t%s\t%s\t%s\n' %(instruction.address,
-                                            bytes,
-                                            instruction.mnemonic,
-                                            instruction.op_str)
-        logging.trace(trace_msg)
+            
+        if utils.is_log_enabled(logging.TRACE):
+            trace_msg = 'Disassembled firmware instructions:\n'
+            for address in disassembled_fw:
+                instruction = disassembled_fw[address]['insn']
+                bytes = ''.join('{:02x}'.format(x) for x in instruction.bytes)
+                trace_msg += '\t\t\t\t\t\t\t\t0x%x:\t%s\t%s\t%s\n' %(address,
+                                                bytes,
+                                                instruction.mnemonic,
+                                                instruction.op_str)
+            logging.trace(trace_msg)
         
         return disassembled_fw
         
+    def release_decoded_instructions(self):
+        self.decoded_instructions = None
+        self.decoded_base = None
+        
+    def rebase_disassembly(self):
+        if self.decoded_instructions == None:
+            return None
+        delta = common_objs.disassembly_start_address - self.decoded_base
+        # Thumb instructions decode identically at any base, except for 
+        #  the targets of (PC-relative) immediate branches. 
+        # This doesn't hold for PC-relative loads/ADR if the alignment 
+        #  of the base changes, so only word-aligned rebasing is allowed.
+        if ((delta % 4) != 0):
+            return None
+        if delta == 0:
+            logging.debug('Re-using previously disassembled firmware.')
+            return self.decoded_instructions
+        logging.info(
+            'Relocating disassembled firmware to start address: '
+            + hex(common_objs.disassembly_start_address)
+        )
+        
+        rebased = []
+        for insn in self.decoded_instructions:
+            if insn.id in [ARM_INS_B, ARM_INS_BL, ARM_INS_BLX, 
+                    ARM_INS_CBZ, ARM_INS_CBNZ]:
+                insn = self.rebase_branch_instruction(insn, delta)
+            else:
+                insn = insn.replace(address=insn.address+delta)
+            rebased.append(insn)
+        return rebased
+        
+    def rebase_branch_instruction(self, insn, delta):
+        new_address = insn.address + delta
+        op_str = insn.op_str
+        operands = []
+        for operand in insn.operands:
+            if operand.type != ARM_OP_IMM:
+                operands.append(operand)
+                continue
+            old_target = operand.imm & 0xFFFFFFFF
+            new_target = (old_target + delta) & 0xFFFFFFFF
+            old_target_str = '#0x{0:x}'.format(old_target)
+            # If we can't patch the operand string, 
+            #  just disassemble this one instruction again.
+            if op_str.count(old_target_str) != 1:
+                return self.disassemble_bytes(insn.bytes, new_address)[0]
+            # As in Capstone, the register and memory base values share
+            #  their storage with the immediate.
+            value = operand.value
+            operands.append(operand.replace(
+                value=value.replace(
+                    reg=new_target,
+                    imm=binops.to_signed(new_target),
+                    mem=value.mem.replace(base=new_target)
+                )
+            ))
+            op_str = op_str.replace(
+                old_target_str,
+                '#0x{0:x}'.format(new_target)
+            )
+        return insn.replace(
+            address=new_address,
+            op_str=op_str,
+            operands=tuple(operands)
+        )
+        
+    def disassemble_bytes(self, code_bytes, start_address):
+        """Disassemble bytes into instruction records."""
+        instructions = []
+        for insn in md.disasm(code_bytes, start_address):
+            instructions.append(lower_instruction(insn))
+        return instructions
+        
     def add_dummy_keys(self, disassembled_fw):
         logging.debug('Creating dummy keys for disassembled object.')
         # Add dummy keys to the object, to prevent errors later.
@@ -688,12 +960,10 @@ class FirmwareDisassembler:
         switch8_index = lr_value
         while switch8_index < (table_branch_max-1):
             switch8_index += 1
-            switch_table_index = utils.get_firmware_bytes(switch8_index, 1)
+            switch_table_index = utils.get_firmware_value(switch8_index, 1)
             (result,carry) = \
                 binops.logical_shift_left(switch_table_index, 1)
-            result_bin = utils.get_binary_representation(result, 8)
-            result = str(carry) + result_bin
-            switch8_address = lr_value + int(result, 2)
+            switch8_address = lr_value + result
             table_branch_addresses.append(switch8_address)
 
         common_objs.replace_functions[ins_address]['table_branch_addresses'] = \
@@ -806,21 +1076,13 @@ class FirmwareDisassembler:
         table_branch_addresses = []
         for i in range(num_entries):
             index_address = lr_address + (mul_factor*i)
-            value = utils.get_firmware_bytes(
+            value = utils.get_firmware_value(
                 index_address, 
                 num_bytes=mul_factor
             )
             
-            if (subtype in ['case_uqi', 'case_uhi']):
-                value = value.zfill(8)
-                value = int(value, 16)
-            elif (subtype in ['case_sqi', 'case_shi']):
-                value = binops.sign_extend(value)
-                bin_value = utils.get_binary_representation(value, 32)
-                if bin_value[0] == '1':
-                    value = (4294967296 - int(value, 16)) * (-1)
-                else:
-                    value = int(value, 16)
+            if (subtype in ['case_sqi', 'case_shi']):
+                value = binops.to_signed(value, (8*mul_factor))
             
             branch_address = lr_address + (2*value)
             if subtype == 'case_si':
@@ -1003,7 +1265,7 @@ class FirmwareDisassembler:
                     init_regs, {}, condition_flags, True
                 )
             
-            pc_value = int(register_object[ARM_REG_PC], 16)
+            pc_value = register_object[ARM_REG_PC]
             table_branch_addresses.append(pc_value)
             
             strand_exec_inst = None
@@ -1198,7 +1460,7 @@ class FirmwareDisassembler:
         if len(original_bytes) == 4:
             new_bytes = utils.get_firmware_bytes(data_start_address, 2)
             new_bytes = bytes.fromhex(new_bytes)
-            new_insns = md.disasm(
+            new_insns = self.disassemble_bytes(
                 new_bytes,
                 data_start_address
             )
@@ -1284,7 +1546,7 @@ class FirmwareDisassembler:
     def handle_misinterpretation(self, ins_address, insn):
         logging.debug('Handling potential incorrect insn at ' + hex(ins_address))
         insn_bytes = common_objs.disassembled_firmware[ins_address]['insn'].bytes
-        insn = md.disasm(
+        insn = self.disassemble_bytes(
             insn_bytes[0:2], 
             ins_address
         )
@@ -1302,7 +1564,7 @@ class FirmwareDisassembler:
             )
         if len(insn_bytes) == 2: return
         
-        insn2 = md.disasm(
+        insn2 = self.disassemble_bytes(
             insn_bytes[2:4], 
             ins_address+2
         )
@@ -1327,7 +1589,7 @@ class FirmwareDisassembler:
             if len(next_insn_bytes) == 4:
                 subsequent_bytes = next_insn_bytes[2:4]
                 next_insn_bytes = next_insn_bytes[0:2]
-            next_insn = md.disasm(
+            next_insn = self.disassemble_bytes(
                 insn_bytes[2:4] + next_insn_bytes, 
                 ins_address+2
             )
@@ -1344,7 +1606,7 @@ class FirmwareDisassembler:
                     + code_start_insn.mnemonic
                 )
             if subsequent_bytes != None:
-                next_insn = md.disasm(
+                next_insn = self.disassemble_bytes(
                     subsequent_bytes, 
                     ins_address+6
                 )
@@ -1756,7 +2018,7 @@ class FirmwareDisassembler:
         )
         new_bytes = utils.get_firmware_bytes(ldr_target+4, 2)
         new_bytes = bytes.fromhex(new_bytes)
-        new_insns = md.disasm(
+        new_insns = self.disassemble_bytes(
             new_bytes,
             ldr_target+4
         )
@@ -1976,44 +2238,50 @@ class FirmwareDisassembler:
         return disassembled_fw
         
     def mark_last_instruction(self, disassembled_fw):
-        last_good_instruction = common_objs.code_start_address
-        for ins_address in disassembled_fw:
-            if ins_address < common_objs.code_start_address:
-                continue
-            if utils.is_valid_code_address(ins_address) != True:
-                continue
-            if disassembled_fw[ins_address]['insn'].id == 0:
-                continue
-            if disassembled_fw[ins_address]['insn'].id == ARM_INS_NOP:
-                continue
-            if (disassembled_fw[ins_address]['insn'].id 
-                    in [ARM_INS_MOV, ARM_INS_MOVT, ARM_INS_MOVW]):
-                operands = disassembled_fw[ins_address]['insn'].operands
-                if len(operands) == 2:
-                    # Don't mark as data, because NOPs are sometimes used 
-                    #  within functions.
-                    if operands[0].value.reg == operands[1].value.reg:
-                        continue
+        # Every valid instruction (other than NOPs, including moves from 
+        #  a register to itself) is linked to the previous such instruction.
+        # NOPs are not marked as data, because they are sometimes used 
+        #  within functions.
+        instruction_table = common_objs.instruction_table
+        start_index = max(
+            utils.get_instruction_table_index(common_objs.code_start_address),
+            0
+        )
+        indices = numpy.nonzero(
+            instruction_table['is_valid'][start_index:]
+            & ~instruction_table['is_nop'][start_index:]
+        )[0] + start_index
+        if len(indices) == 0:
+            return disassembled_fw
+        
+        ins_addresses = utils.get_instruction_table_address(indices)
+        last_good_instructions = numpy.concatenate((
+            [common_objs.code_start_address],
+            ins_addresses[:-1]
+        ))
+        for (ins_address, last_good_instruction) in zip(
+                ins_addresses.tolist(), last_good_instructions.tolist()):
             disassembled_fw[ins_address]['last_insn_address'] = \
                 last_good_instruction
-            last_good_instruction = ins_address
         return disassembled_fw
         
     def test_arm_arch(self):
         """Test for ARM architecture version. We use this in function matching."""
 
         arch7m_ins = [ARM_INS_UDIV, ARM_INS_TBB, ARM_INS_TBH]
-        all_addresses = list(common_objs.disassembled_firmware.keys())
-        all_addresses.sort()
-        ins_address = common_objs.code_start_address - 2
-        while ins_address <= common_objs.code_end_address:
-            ins_address += 2
-            if utils.is_valid_code_address(ins_address) != True:
+        # Same range as checked previously (i.e., up to the instruction
+        #  after the code end address).
+        end_address = common_objs.code_end_address + 2
+        for ins_address in common_objs.disassembled_firmware:
+            if ((ins_address < common_objs.code_start_address) or 
+                    (ins_address > end_address)):
                 continue
-            if common_objs.disassembled_firmware[ins_address]['insn'].id == 0:
+            if utils.is_valid_code_address(ins_address) != True:
                 continue
-            if common_objs.disassembled_firmware[ins_address]['insn'].id in arch7m_ins:
+            insn = common_objs.disassembled_firmware[ins_address]['insn']
+            if insn.id in arch7m_ins:
                 common_objs.arm_arch = consts.ARMv7M
+                break
         logging.debug('ARM architecture estimated to be ' + common_objs.arm_arch)
                 
     def get_mem_access_pc_value(self, ins_address):
@@ -2042,13 +2310,11 @@ class FirmwareDisassembler:
             init_regs[reg] = None
             
         start_stack_pointer = int(common_objs.application_vector_table['initial_sp'])
-        init_regs[ARM_REG_SP] = '{0:08x}'.format(start_stack_pointer)
+        init_regs[ARM_REG_SP] = start_stack_pointer
         
-        init_regs[ARM_REG_PC] = \
-            '{0:08x}'.format(strand_exec_inst.get_pc_value(trace_start))
+        init_regs[ARM_REG_PC] = strand_exec_inst.get_pc_value(trace_start)
             
-        hex_comp_value = utils.convert_type(np.uint8(comp_val), 'hex')
-        init_regs[comp_reg] = hex_comp_value.zfill(8)
+        init_regs[comp_reg] = comp_val & 0xFF
         
         ## Initialise path.
         current_path = hex(trace_start)
@@ -8,6 +8,7 @@ from argxtract.common import paths as common_paths
 from argxtract.core import utils
 from argxtract.core import consts
 from argxtract.core import binary_operations as binops
+from argxtract.core.call_graph import CallGraph
 from argxtract.common import objects as common_objs
 
 
@@ -20,13 +21,7 @@ class FunctionEvaluator:
             'Performing function block analyses.'
         )
         # Get all instruction addresses.
-        all_addresses = list(common_objs.disassembled_firmware.keys())
-        all_addresses.sort()
-        self.all_addresses = []
-        for address in all_addresses:
-            if address < common_objs.app_code_base:
-                continue
-            self.all_addresses.append(address)
+        self.all_addresses = common_objs.all_addresses
 
         """Find potential function blocks within assembly code.
         
@@ -111,6 +106,7 @@ class FunctionEvaluator:
                     store_msg += hex(item) +'\n'
         logging.trace(debug_msg)
         common_objs.function_blocks = function_blocks
+        utils.build_function_block_index()
         
         if store_path != None:
             self.save_functions_to_file(store_path, store_msg)
@@ -164,8 +160,9 @@ class FunctionEvaluator:
         return xref_to
     
     def get_call_depth_info(self):
+        common_objs.call_graph = CallGraph(common_objs.function_blocks)
         for fb_start in common_objs.function_blocks:
-            call_depth = self.get_fblock_call_depth(fb_start, [fb_start])
+            call_depth = common_objs.call_graph.get_call_depth(fb_start)
             common_objs.function_blocks[fb_start]['call_depth'] = call_depth
             logging.debug(
                 'Call depth for function at '
@@ -174,26 +171,6 @@ class FunctionEvaluator:
                 + str(call_depth)
             )
             
-    def get_fblock_call_depth(self, fb_start_address, checked):
-        all_counters = []
-        fblock_obj = common_objs.function_blocks[fb_start_address]
-        all_xref_tos = fblock_obj['xref_to']
-        for item in checked:
-            if item in all_xref_tos:
-                all_xref_tos.remove(item)
-        if all_xref_tos == []:
-            return 0
-        for xref_to in all_xref_tos:
-            new_checked = copy.deepcopy(checked)
-            new_checked.append(xref_to)
-            new_counter = self.get_fblock_call_depth(
-                xref_to,
-                new_checked
-            )
-            all_counters.append(new_counter+1)
-        counter = max(all_counters)
-        return counter
-                
     def is_valid_function_start(self, address):
         if address < common_objs.code_start_address:
             return False
@@ -230,8 +207,6 @@ class FunctionEvaluator:
             'Checking for high-certainty functions.'
         )
         functions = []
-        all_addresses = list(common_objs.disassembled_firmware.keys())
-        all_addresses.sort()
         ins_address = common_objs.code_start_address - 2
         while ins_address <= common_objs.code_end_address:
             ins_address += 2
@@ -364,10 +339,10 @@ class FunctionEvaluator:
             if idx == (num_functions-1):
                 current_fblock_end = common_objs.code_end_address
             else:
-                all_address_index = self.all_addresses.index(
+                current_fblock_end = utils.get_previous_address(
+                    self.all_addresses,
                     function_block_start_addresses[idx+1]
                 )
-                current_fblock_end = self.all_addresses[all_address_index-1]
             (new_function_blocks, overrun) = self.analyse_function_block_for_exit_ins(
                 fblock_start,
                 current_fblock_end,
@@ -379,10 +354,10 @@ class FunctionEvaluator:
 
                 i = current_index+1
                 for i in range(current_index+1, len(function_block_start_addresses)):
-                    all_address_index = self.all_addresses.index(
+                    new_fblock_end = utils.get_previous_address(
+                        self.all_addresses,
                         function_block_start_addresses[i]
                     )
-                    new_fblock_end = self.all_addresses[all_address_index-1]
                     if overrun < function_block_start_addresses[i]:
                         break
                         
@@ -2,8 +2,12 @@ import os
 import sys
 import copy
 import json
+import queue
 import random
+import signal
 import logging
+import collections
+import multiprocessing
 import numpy as np
 from capstone import *
 from capstone.arm import *
@@ -19,10 +23,22 @@ md = Cs(CS_ARCH_ARM, CS_MODE_THUMB + CS_MODE_LITTLE_ENDIAN)
 md.skipdata = True
 md.detail = True
 
+# Matcher used by pattern matching processes.
+# It is set before the processes are forked, so that they share
+#  the (read-only) disassembly and function blocks with the parent.
+parallel_matcher = None
+
+def match_parallel_candidate(candidate):
+    (pattern_index, function) = candidate
+    is_match = parallel_matcher.match_candidate(pattern_index, function)
+    return (pattern_index, function, is_match)
 
 class FunctionPatternMatcher:
     def __init__(self):
         self.test_sets = {}
+        self.feature_constraints = {}
+        # Function fingerprints (computed once, for all pattern files).
+        self.function_features = {}
         self.interrupt_handlers = []
         for itrpt in common_objs.application_vector_table:
             if itrpt in ['initial_sp', 'systick']: continue
@@ -48,24 +64,19 @@ class FunctionPatternMatcher:
             logging.error('No function pattern files found!')
             return
         
-        all_addresses = list(common_objs.disassembled_firmware.keys())
-        all_addresses.sort()
-        self.all_addresses = all_addresses
+        self.all_addresses = common_objs.all_addresses
         
-        for pattern_file in pattern_files:
-            logging.debug(
-                'Testing against pattern file '
-                + pattern_file
+        if self.can_match_in_parallel() == True:
+            pattern_addresses = self.match_pattern_files_in_parallel(
+                pattern_files
             )
-            self.load_test_set(pattern_file)
-            if self.test_sets == {}:
-                continue
-                
+        else:
+            pattern_addresses = self.match_pattern_files(pattern_files)
+        
+        for pattern_file in pattern_addresses:
             filename = \
                 (os.path.basename(pattern_file)).replace('.json', '')
-            address = self.match_pattern_file(
-                pattern_file
-            )
+            address = pattern_addresses[pattern_file]
             if address != None:
                 matched_functions[filename] = {}
                 matched_functions[filename]['function_address'] = address
@@ -97,26 +108,53 @@ class FunctionPatternMatcher:
         for key in json_file['test_sets']:
             self.test_sets[key] = json_file['test_sets'][key]
             
+        self.feature_constraints = self.get_feature_constraints(
+            pattern_file,
+            json_file
+        )
+            
+    def match_pattern_files(self, pattern_files):
+        pattern_addresses = {}
+        for pattern_file in pattern_files:
+            logging.debug(
+                'Testing against pattern file '
+                + pattern_file
+            )
+            self.load_test_set(pattern_file)
+            if self.test_sets == {}:
+                continue
+            pattern_addresses[pattern_file] = self.match_pattern_file(
+                pattern_file
+            )
+        return pattern_addresses
+        
     def match_pattern_file(self, pattern_file):
         # Check each function for pattern match.
         matches = []
-        sorted_functions = {k: v for k, v in sorted(common_objs.function_blocks.items(), 
-                key = lambda x: getitem(x[1], 'call_depth'))}
-        for function in sorted_functions:
-            to_check = True
-            # If one function matches, then don't consider its callers.
-            # They would automatically match?
-            for match in matches:
-                if match in common_objs.function_blocks[function]['xref_to']:
-                    to_check = False
-                    break
-            if to_check == False:
+        for function in self.get_sorted_functions():
+            if self.is_caller_of_match(function, matches) == True:
                 continue
             is_match = self.match_function_to_pattern(
                 function
             )
             if is_match == True:
                 matches.append(function)
+        return self.select_pattern_match(pattern_file, matches)
+        
+    def get_sorted_functions(self):
+        sorted_functions = {k: v for k, v in sorted(common_objs.function_blocks.items(), 
+                key = lambda x: getitem(x[1], 'call_depth'))}
+        return list(sorted_functions.keys())
+        
+    def is_caller_of_match(self, function, matches):
+        # If one function matches, then don't consider its callers.
+        # They would automatically match?
+        for match in matches:
+            if match in common_objs.function_blocks[function]['xref_to']:
+                return True
+        return False
+        
+    def select_pattern_match(self, pattern_file, matches):
         if matches == []:
             logging.warning('No pattern matches for ' + pattern_file)
             return None
@@ -149,6 +187,16 @@ class FunctionPatternMatcher:
         if has_unsupported_operations == True:
             logging.trace('Unsupported function.')
             return False
+            
+        # Symbolic execution is expensive, so first check that the 
+        #  function could possibly match.
+        is_candidate = self.check_feature_constraints(
+            start_address,
+            end_address
+        )
+        if is_candidate == False:
+            logging.trace('Function features don\'t match pattern.')
+            return False
   
         is_match = self.analyse_function(
             start_address, 
@@ -180,6 +228,294 @@ class FunctionPatternMatcher:
             
         return False
         
+    #======================= Parallel matching =========================#
+    def can_match_in_parallel(self):
+        if common_objs.pattern_matching_processes < 2:
+            return False
+        # Capstone instructions can't be pickled, so the disassembly 
+        #  can only be shared with forked processes.
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            return False
+        return True
+        
+    def match_pattern_files_in_parallel(self, pattern_files):
+        global parallel_matcher
+        
+        # Test sets are carried over between pattern files, 
+        #  as in the serial case.
+        self.pattern_tests = []
+        for pattern_file in pattern_files:
+            self.load_test_set(pattern_file)
+            if self.test_sets == {}:
+                continue
+            self.pattern_tests.append((
+                pattern_file,
+                dict(self.test_sets),
+                self.feature_constraints
+            ))
+        
+        # Candidates are (pattern file, function) pairs, in the order 
+        #  in which the serial matcher would check them.
+        self.sorted_functions = self.get_sorted_functions()
+        candidates = collections.deque()
+        for function in self.sorted_functions:
+            for pattern_index in range(len(self.pattern_tests)):
+                candidates.append((pattern_index, function))
+        self.parallel_results = [{} for x in self.pattern_tests]
+        self.parallel_matches = [[] for x in self.pattern_tests]
+        self.parallel_positions = [0 for x in self.pattern_tests]
+        
+        num_processes = common_objs.pattern_matching_processes
+        logging.debug(
+            'Matching '
+            + str(len(candidates))
+            + ' candidates using '
+            + str(num_processes)
+            + ' processes.'
+        )
+        completed = queue.Queue()
+        in_flight = 0
+        parallel_matcher = self
+        sigterm_handler = None
+        try:
+            context = multiprocessing.get_context('fork')
+            with context.Pool(num_processes) as pool:
+                # If this process is terminated (e.g., on timeout), 
+                #  take the pool processes down with it, rather than
+                #  leaving them orphaned.
+                def terminate_pool(signum, frame):
+                    pool.terminate()
+                    sys.exit(128 + signum)
+                sigterm_handler = signal.signal(signal.SIGTERM, terminate_pool)
+                while True:
+                    # Keep all processes busy, skipping callers of 
+                    #  confirmed matches.
+                    while ((len(candidates) > 0) 
+                            and (in_flight < num_processes)):
+                        candidate = candidates.popleft()
+                        (pattern_index, function) = candidate
+                        if self.is_caller_of_match(
+                                function, 
+                                self.parallel_matches[pattern_index]
+                            ) == True:
+                            self.parallel_results[pattern_index][function] = \
+                                False
+                            continue
+                        pool.apply_async(
+                            match_parallel_candidate, 
+                            (candidate,),
+                            callback=completed.put,
+                            error_callback=completed.put
+                        )
+                        in_flight += 1
+                    if in_flight == 0:
+                        break
+                        
+                    result = completed.get()
+                    in_flight -= 1
+                    if isinstance(result, BaseException):
+                        raise result
+                    (pattern_index, function, is_match) = result
+                    self.parallel_results[pattern_index][function] = is_match
+                    self.confirm_parallel_matches(pattern_index)
+        finally:
+            parallel_matcher = None
+            if sigterm_handler != None:
+                signal.signal(signal.SIGTERM, sigterm_handler)
+        
+        pattern_addresses = {}
+        for pattern_index in range(len(self.pattern_tests)):
+            self.confirm_parallel_matches(pattern_index)
+            pattern_file = self.pattern_tests[pattern_index][0]
+            pattern_addresses[pattern_file] = self.select_pattern_match(
+                pattern_file,
+                self.parallel_matches[pattern_index]
+            )
+        return pattern_addresses
+        
+    def confirm_parallel_matches(self, pattern_index):
+        # Matches are only confirmed in serial order, so that callers 
+        #  are skipped exactly as they would be in the serial case.
+        results = self.parallel_results[pattern_index]
+        matches = self.parallel_matches[pattern_index]
+        position = self.parallel_positions[pattern_index]
+        while position < len(self.sorted_functions):
+            function = self.sorted_functions[position]
+            if function not in results:
+                break
+            if ((results[function] == True) 
+                    and (self.is_caller_of_match(function, matches) == False)):
+                matches.append(function)
+            position += 1
+        self.parallel_positions[pattern_index] = position
+        
+    def match_candidate(self, pattern_index, function):
+        (pattern_file, test_sets, feature_constraints) = \
+            self.pattern_tests[pattern_index]
+        self.test_sets = test_sets
+        self.feature_constraints = feature_constraints
+        return self.match_function_to_pattern(function)
+        
+    #======================= Feature prefilter =========================#
+    def get_feature_constraints(self, pattern_file, json_file):
+        constraints = {}
+        
+        # Constraints declared in the pattern file.
+        declared_features = {}
+        if 'features' in json_file:
+            declared_features = json_file['features']
+        for feature in consts.FUNCTION_FEATURE_COUNTS:
+            for bound in ['min', 'max']:
+                key = bound + '_' + feature
+                if key not in declared_features:
+                    continue
+                if type(declared_features[key]) is not int:
+                    logging.warning(
+                        'Ignoring invalid feature '
+                        + key
+                        + ' in pattern file '
+                        + pattern_file
+                    )
+                    continue
+                constraints[key] = declared_features[key]
+        if 'immediates' in declared_features:
+            try:
+                constraints['immediates'] = set([
+                    int(immediate, 16) 
+                        for immediate in declared_features['immediates']
+                ])
+            except:
+                logging.warning(
+                    'Ignoring invalid immediates in pattern file '
+                    + pattern_file
+                )
+        
+        # Constraints derived from the test sets.
+        constraints['memory_write'] = self.test_sets_require_memory_write()
+        return constraints
+        
+    def test_sets_require_memory_write(self):
+        # Expected memory contents (other than unchanged inputs) 
+        #  can only be present if the function writes to memory.
+        for test_set in self.test_sets:
+            input_memory = {}
+            for mem_key in self.test_sets[test_set]['input']['mem']:
+                input_memory[int(mem_key, 16)] = '{0:02x}'.format(
+                    int(self.test_sets[test_set]['input']['mem'][mem_key], 16)
+                )
+            pattern_memory_obj = self.test_sets[test_set]['output']['mem']
+            for pattern_key in pattern_memory_obj:
+                if pattern_key.startswith('group'):
+                    return True
+                memory_address = int(pattern_key, 16)
+                if memory_address not in input_memory:
+                    return True
+                if (input_memory[memory_address] 
+                        != pattern_memory_obj[pattern_key]):
+                    return True
+        return False
+        
+    def check_feature_constraints(self, start_address, end_address):
+        if start_address not in self.function_features:
+            self.function_features[start_address] = \
+                self.extract_function_features(start_address, end_address)
+        features = self.function_features[start_address]
+        constraints = self.feature_constraints
+        
+        for feature in consts.FUNCTION_FEATURE_COUNTS:
+            if 'min_' + feature in constraints:
+                if features[feature] < constraints['min_' + feature]:
+                    return False
+            if 'max_' + feature in constraints:
+                if features[feature] > constraints['max_' + feature]:
+                    return False
+        if 'immediates' in constraints:
+            if not constraints['immediates'].issubset(features['immediates']):
+                return False
+        # Memory can be written by the function itself, 
+        #  or by any code that it branches to.
+        if constraints['memory_write'] == True:
+            if ((features['stores'] == 0) 
+                    and (features['leaves_function'] == False)):
+                return False
+        return True
+        
+    def extract_function_features(self, start_address, end_address):
+        features = {
+            'instructions': 0,
+            'loads': 0,
+            'stores': 0,
+            'calls': 0,
+            'wide_instructions': 0,
+            'immediates': set(),
+            'leaves_function': False
+        }
+        all_addresses = common_objs.all_addresses
+        
+        address = start_address
+        while ((address != None) and (address <= end_address)):
+            ins_address = address
+            address = utils.get_next_address(all_addresses, address)
+            if common_objs.disassembled_firmware[ins_address]['is_data'] == True:
+                continue
+            insn = common_objs.disassembled_firmware[ins_address]['insn']
+            if insn == None:
+                continue
+            if insn.id == 0:
+                continue
+                
+            opcode_id = insn.id
+            features['instructions'] += 1
+            if insn.size == 4:
+                features['wide_instructions'] += 1
+            if opcode_id in consts.LOAD_INSTRUCTIONS:
+                features['loads'] += 1
+            elif opcode_id in consts.STORE_INSTRUCTIONS:
+                features['stores'] += 1
+            elif opcode_id in consts.CALL_INSTRUCTIONS:
+                features['calls'] += 1
+                features['leaves_function'] = True
+                continue
+            
+            operands = insn.operands
+            # Control flow that may leave the function.
+            if opcode_id in [ARM_INS_B, ARM_INS_CBZ, ARM_INS_CBNZ]:
+                branch_target = operands[-1].value.imm
+                if ((branch_target < start_address) 
+                        or (branch_target > end_address)):
+                    features['leaves_function'] = True
+                continue
+            if opcode_id == ARM_INS_BX:
+                if operands[0].value.reg != ARM_REG_LR:
+                    features['leaves_function'] = True
+                continue
+            if opcode_id in [ARM_INS_TBB, ARM_INS_TBH]:
+                features['leaves_function'] = True
+                continue
+            if ((opcode_id != ARM_INS_POP) and (len(operands) > 0)
+                    and (operands[0].type == ARM_OP_REG)
+                    and (operands[0].value.reg == ARM_REG_PC)):
+                features['leaves_function'] = True
+                
+            # Immediate values, including those loaded from literal pools.
+            for operand in operands:
+                if operand.type == ARM_OP_IMM:
+                    features['immediates'].add(
+                        operand.value.imm & 0xFFFFFFFF
+                    )
+                elif ((operand.type == ARM_OP_MEM) 
+                        and (operand.value.mem.base == ARM_REG_PC)
+                        and (opcode_id == ARM_INS_LDR)):
+                    literal_address = \
+                        ((ins_address + 4) & ~0x3) + operand.value.mem.disp
+                    if (literal_address 
+                            < common_objs.disassembly_start_address):
+                        continue
+                    literal_value = utils.get_firmware_value(literal_address)
+                    if literal_value != None:
+                        features['immediates'].add(literal_value)
+        return features
+        
     def analyse_function(self, start_address, end_address):
         logging.trace(
             '\nAnalysing function starting at ' 
@@ -223,8 +559,7 @@ class FunctionPatternMatcher:
         
     def identify_exits(self, function_start, function_end):
         exits = [function_end]
-        all_addresses = list(common_objs.disassembled_firmware.keys())
-        all_addresses.sort()
+        all_addresses = common_objs.all_addresses
         
         address = function_start-2
         branch_identified = False
@@ -254,14 +589,13 @@ class FunctionPatternMatcher:
         
     #======================= Execution =========================#
     def symbolically_execute_test_set(self, start_address, exits, test_set_input):
-        all_addresses = list(common_objs.disassembled_firmware.keys())
-        all_addresses.sort()
+        all_addresses = common_objs.all_addresses
         
         regs = {}
         for reg in test_set_input['reg']:
             for const_reg in consts.REGISTERS:
                 if reg == consts.REGISTERS[const_reg]:
-                    regs[const_reg] = test_set_input['reg'][reg]
+                    regs[const_reg] = int(test_set_input['reg'][reg], 16)
                     break
         
         (strand_eval_obj, init_regs, condition_flags, current_path) = \
@@ -280,7 +614,7 @@ class FunctionPatternMatcher:
         memory_map = {}
         for mem_key in test_set_input['mem']:
             mem_address = int(mem_key, 16)
-            memory_map[mem_address] = test_set_input['mem'][mem_key]
+            memory_map[mem_address] = int(test_set_input['mem'][mem_key], 16)
             
         (pre_exec_address, memory_map, register_object) = \
             strand_eval_obj.trace_register_values(
@@ -289,6 +623,18 @@ class FunctionPatternMatcher:
                 exits, 
                 init_regs, memory_map, condition_flags, 
                 False, False, True)
+        
+        # Test sets are specified as hex strings.
+        if memory_map != None:
+            memory_map = {
+                address:'{0:02x}'.format(memory_map[address])
+                    for address in memory_map
+            }
+        if register_object != None:
+            for reg in register_object:
+                if register_object[reg] == None: continue
+                register_object[reg] = \
+                    '{0:08x}'.format(register_object[reg])
         output_object = {
             'mem': memory_map,
             'reg': register_object
@@ -306,7 +652,7 @@ class FunctionPatternMatcher:
         for reg in list(consts.REGISTERS.keys()):
             init_regs[reg] = None
             
-        init_regs[ARM_REG_SP] = 'c0002000'
+        init_regs[ARM_REG_SP] = 0xc0002000
         pc_value = strand_eval_obj.get_pc_value(trace_start)
         if pc_value == None:
             if trace_start+4 in all_addresses:
@@ -315,8 +661,7 @@ class FunctionPatternMatcher:
                 pc_value = trace_start+2
             else:
                 return (None, None, None, None)
-        init_regs[ARM_REG_PC] = \
-            '{0:08x}'.format(pc_value)
+        init_regs[ARM_REG_PC] = pc_value
             
         for reg in regs:
             init_regs[reg] = regs[reg]
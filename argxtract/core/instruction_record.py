@@ -0,0 +1,125 @@
+from capstone.arm import *
+
+
+class Record:
+    """Immutable record of plain values, with named (__slots__) fields."""
+    __slots__ = ()
+
+    def __init__(self, *values):
+        for (field, value) in zip(self.__slots__, values):
+            object.__setattr__(self, field, value)
+
+    def __setattr__(self, field, value):
+        raise AttributeError(type(self).__name__ + ' is immutable')
+
+    def __delattr__(self, field):
+        raise AttributeError(type(self).__name__ + ' is immutable')
+
+    def __reduce__(self):
+        return (
+            type(self),
+            tuple([getattr(self, field) for field in self.__slots__])
+        )
+
+    def replace(self, **changes):
+        """Get a copy of the record, with some fields changed."""
+        return type(self)(*[
+            changes[field] if field in changes else getattr(self, field)
+                for field in self.__slots__
+        ])
+
+
+class MemoryOperand(Record):
+    __slots__ = ('base', 'index', 'scale', 'disp', 'lshift')
+
+
+class OperandValue(Record):
+    # As in Capstone, the register, immediate and memory values are
+    #  all read from the same (union) value.
+    __slots__ = ('reg', 'imm', 'mem')
+
+
+class OperandShift(Record):
+    __slots__ = ('type', 'value')
+
+
+class Operand(Record):
+    __slots__ = ('type', 'value', 'shift', 'subtracted')
+
+    # Shorthands for the operand value, as in Capstone.
+    @property
+    def reg(self):
+        return self.value.reg
+
+    @property
+    def imm(self):
+        return self.value.imm
+
+    @property
+    def mem(self):
+        return self.value.mem
+
+
+class Instruction(Record):
+    """Instruction, with the same attributes that we use from Capstone's."""
+    __slots__ = ('address', 'id', 'size', 'bytes', 'mnemonic', 'op_str',
+                    'cc', 'update_flags', 'writeback', 'operands')
+
+
+def lower_instruction(insn):
+    """Convert a Capstone instruction into an Instruction record.
+
+    Capstone's Python binding reads most details through ctypes on
+    every access, whereas the record's fields are plain values.
+    Data (i.e., SKIPDATA) instructions have no details, so they get
+    no operands, and no condition code or flags.
+    """
+    if insn.id == ARM_INS_INVALID:
+        return Instruction(
+            insn.address,
+            insn.id,
+            insn.size,
+            bytes(insn.bytes),
+            insn.mnemonic,
+            insn.op_str,
+            ARM_CC_INVALID,
+            False,
+            False,
+            ()
+        )
+
+    operands = []
+    for operand in insn.operands:
+        value = operand.value
+        mem = value.mem
+        operands.append(Operand(
+            operand.type,
+            OperandValue(
+                value.reg,
+                value.imm,
+                MemoryOperand(
+                    mem.base,
+                    mem.index,
+                    mem.scale,
+                    mem.disp,
+                    mem.lshift
+                )
+            ),
+            OperandShift(
+                operand.shift.type,
+                operand.shift.value
+            ),
+            operand.subtracted
+        ))
+    return Instruction(
+        insn.address,
+        insn.id,
+        insn.size,
+        bytes(insn.bytes),
+        insn.mnemonic,
+        insn.op_str,
+        insn.cc,
+        insn.update_flags,
+        insn.writeback,
+        tuple(operands)
+    )
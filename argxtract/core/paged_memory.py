@@ -0,0 +1,148 @@
+import sys
+import pickle
+import hashlib
+
+
+class PagedMemory:
+    PAGE_BITS = 8
+
+    def __init__(self, memory=None):
+        """Byte-addressed memory map, held as copy-on-write pages.
+
+        Behaves like the {address: byte value} dictionaries it replaces,
+        iterating in address order. A fork shares all pages with the
+        original, and a page is only copied when either of them first
+        writes to it, so forking costs scale with the number of pages
+        rather than with the number of bytes.
+        """
+        self.pages = {}
+        # Pages that only this memory map refers to (i.e., can be
+        #  modified in place).
+        self.owned_pages = set()
+        # Digests of unmodified pages, used for identifying states.
+        self.page_digests = {}
+        if memory != None:
+            for address in memory:
+                self[address] = memory[address]
+
+    def fork(self):
+        forked_memory = PagedMemory()
+        forked_memory.pages = dict(self.pages)
+        forked_memory.page_digests = dict(self.page_digests)
+        # All pages are now shared.
+        self.owned_pages = set()
+        return forked_memory
+
+    def get_writable_page(self, page_number):
+        if page_number in self.owned_pages:
+            page = self.pages[page_number]
+        elif page_number in self.pages:
+            page = dict(self.pages[page_number])
+            self.pages[page_number] = page
+            self.owned_pages.add(page_number)
+        else:
+            page = {}
+            self.pages[page_number] = page
+            self.owned_pages.add(page_number)
+        self.page_digests.pop(page_number, None)
+        return page
+
+    #-------------------- Dictionary interface -----------------------#
+    def __getitem__(self, address):
+        page = self.pages.get(address >> self.PAGE_BITS)
+        if ((page == None) or (address not in page)):
+            raise KeyError(address)
+        return page[address]
+
+    def __setitem__(self, address, value):
+        page = self.get_writable_page(address >> self.PAGE_BITS)
+        page[address] = value
+
+    def __delitem__(self, address):
+        self.pop(address)
+
+    def __contains__(self, address):
+        page = self.pages.get(address >> self.PAGE_BITS)
+        if page == None:
+            return False
+        return (address in page)
+
+    def __len__(self):
+        return sum([len(page) for page in self.pages.values()])
+
+    def __iter__(self):
+        for page_number in sorted(self.pages):
+            for address in sorted(self.pages[page_number]):
+                yield address
+
+    def get(self, address, default=None):
+        if address not in self:
+            return default
+        return self[address]
+
+    def pop(self, address, *default):
+        if address not in self:
+            if len(default) > 0:
+                return default[0]
+            raise KeyError(address)
+        page_number = address >> self.PAGE_BITS
+        page = self.get_writable_page(page_number)
+        value = page.pop(address)
+        # Empty pages are removed, so that equal memory maps
+        #  always have the same pages.
+        if page == {}:
+            del self.pages[page_number]
+            self.owned_pages.discard(page_number)
+        return value
+
+    def keys(self):
+        return list(self)
+
+    def values(self):
+        return [self[address] for address in self]
+
+    def items(self):
+        return [(address, self[address]) for address in self]
+
+    def get_unshared_items(self, memory):
+        """Get (address, value) pairs from pages not shared with memory.
+
+        A page that is shared (i.e., the same object in both memory maps)
+        holds the same values in both, so only the remaining pages need
+        to be compared or copied.
+        """
+        unshared_items = []
+        for page_number in sorted(self.pages):
+            page = self.pages[page_number]
+            if memory.pages.get(page_number) is page:
+                continue
+            for address in sorted(page):
+                unshared_items.append((address, page[address]))
+        return unshared_items
+
+    #-------------------- State identification -----------------------#
+    def get_page_digest(self, page_number):
+        if page_number not in self.page_digests:
+            page = self.pages[page_number]
+            page_bytes = pickle.dumps(sorted(page.items()))
+            self.page_digests[page_number] = \
+                hashlib.sha256(page_bytes).digest()
+        return self.page_digests[page_number]
+
+    def get_digests(self):
+        """Get (page number, page digest) pairs, in address order.
+
+        Equal memory maps have equal digests. Digests are only
+        recomputed for pages that have changed.
+        """
+        return [
+            (page_number, self.get_page_digest(page_number))
+                for page_number in sorted(self.pages)
+        ]
+
+    def get_page_sizes(self):
+        """Get the (approximate) size in bytes of each page, by page id."""
+        return {
+            id(page): sys.getsizeof(page)
+                for page in self.pages.values()
+        }
@@ -0,0 +1,50 @@
+class PathTrie:
+    def __init__(self):
+        """Trie of traced paths (i.e., sequences of branch addresses).
+
+        Nodes are referred to by integer handles, which are what trace
+        states carry as their current path. A node's path is obtained
+        by following parent handles back to the root.
+        """
+        self.parents = []
+        self.elements = []
+        self.depths = []
+        # Child handles, keyed by (parent handle, element).
+        self.child_index = {}
+
+    def add_node(self, parent, element):
+        node = len(self.elements)
+        self.parents.append(parent)
+        self.elements.append(element)
+        if parent == None:
+            self.depths.append(1)
+        else:
+            self.depths.append(self.depths[parent] + 1)
+        self.child_index[(parent, element)] = node
+        return node
+
+    def get_root(self, element):
+        if (None, element) in self.child_index:
+            return self.child_index[(None, element)]
+        return self.add_node(None, element)
+
+    def get_child(self, node, element):
+        """Get the child of a node, adding it if necessary.
+
+        Returns the child handle and whether the child was newly added.
+        """
+        if (node, element) in self.child_index:
+            return (self.child_index[(node, element)], False)
+        return (self.add_node(node, element), True)
+
+    def get_depth(self, node):
+        return self.depths[node]
+
+    def get_path_end(self, node, length):
+        """Get (up to) the last length elements of a node's path."""
+        path_end = []
+        while ((node != None) and (len(path_end) < length)):
+            path_end.append(self.elements[node])
+            node = self.parents[node]
+        path_end.reverse()
+        return path_end
@@ -1,14 +1,14 @@
 import os
 import sys
-import copy
 import json
+import shutil
 import struct
 import timeit
 import pickle
 import logging
 import hashlib
+import functools
 import collections
-import numpy as np
 from capstone import *
 from capstone.arm import *
 from random import getrandbits
@@ -17,6 +17,9 @@ from argxtract.core import consts
 from argxtract.core import binary_operations as binops
 from argxtract.common import paths as common_paths
 from argxtract.common import objects as common_objs
+from argxtract.core.path_trie import PathTrie
+from argxtract.core.paged_memory import PagedMemory
+from argxtract.core.translation_cache import TranslationCache
 
 
 class RegisterEvaluator:
@@ -25,29 +28,39 @@ class RegisterEvaluator:
         self.start_time = None
         self.all_addresses = None
         self.instruction_queue = collections.deque()
-        
-    def estimate_reg_values_for_trace_object(self, trace_obj, coi_processor_instance): 
+        self.queued_states = set()
+        self.queue_memory_store = {}
+        self.queue_memory_used = 0
+        self.queued_pages = {}
+        # Instruction handlers, by opcode id.
+        self.instruction_handlers = self.get_instruction_handlers()
+        # Built per register trace.
+        self.translation_cache = None
+        
+    def estimate_reg_values_for_trace_object(self, trace_obj, coi_processor_instance,
+                                                trace_tree_builder): 
         logging.info('Starting register trace.')
         
-        logging.debug('Trace object:\n' + json.dumps(trace_obj, indent=4))
+        if utils.is_log_enabled(logging.DEBUG):
+            logging.debug('Trace object:\n' + json.dumps(trace_obj, indent=4))
 
         # Start the timer.
         self.start_time = timeit.default_timer()
             
         self.coi_processor = coi_processor_instance
         self.master_trace_obj = trace_obj
+        # Endpoint ids and return parents, indexed by node id.
+        self.trace_tree_builder = trace_tree_builder
         
         # Get starting point for trace from chain.
         start_points = trace_obj.keys()
 
         # Get all instruction addresses.
-        all_addresses = list(common_objs.disassembled_firmware.keys())
-        all_addresses.sort()
-        self.all_addresses = []
-        for address in all_addresses:
-            if address < common_objs.app_code_base:
-                continue
-            self.all_addresses.append(address)
+        self.all_addresses = common_objs.all_addresses
+        
+        # Translated blocks are shared by all traces (from all start
+        #  points), as the disassembly doesn't change from here on.
+        self.translation_cache = TranslationCache(self)
 
         # Keep track of unhandled instructions.
         self.unhandled = []
@@ -61,27 +74,33 @@ class RegisterEvaluator:
                 logging.info('Timeout.')
                 break
                 
-            logging.debug('Start point: ' + hex(start_point))
+            if utils.is_log_enabled(logging.DEBUG):
+                logging.debug('Start point: ' + hex(start_point))
             
             self.per_trace_start_time = timeit.default_timer()
             
             self.expected_endpoints = []
             endpoint_addresses = self.get_endpoint_ids(
-                trace_obj[start_point]['branch_or_end_points']
+                trace_obj[start_point]
             )
             for endpoint_address in endpoint_addresses:
                 self.expected_endpoints.append(endpoint_address)
             self.num_expected_endpoints = len(self.expected_endpoints)
             self.obtained_endpoints = []
             self.num_obtained_endpoints = 0
-            logging.debug('Expected endpoints: ' + str(self.expected_endpoints))
+            if utils.is_log_enabled(logging.DEBUG):
+                logging.debug('Expected endpoints: ' + str(self.expected_endpoints))
             
             # Keep track of checked traces, to avoid repeating.
-            self.checked_paths = {}
+            self.path_trie = PathTrie()
             self.global_counter = 0
             
             # Start up instruction queue.
             self.instruction_queue = collections.deque()
+            self.queued_states = set()
+            self.queue_memory_store = {}
+            self.queue_memory_used = 0
+            self.queued_pages = {}
         
             # Initialise registers at the starting point.
             initialised_regs = {}
@@ -90,16 +109,16 @@ class RegisterEvaluator:
             initialised_regs = self.store_register_bytes(
                 initialised_regs,
                 ARM_REG_PC,
-                '{0:08x}'.format(self.get_pc_value(start_point))
+                self.get_pc_value(start_point)
             )
             initialised_regs = self.store_register_bytes(
                 initialised_regs,
                 ARM_REG_SP,
-                '{0:08x}'.format(start_stack_pointer)
+                start_stack_pointer
             )
             
             # Initialise stack/RAM.
-            initial_memory = {}
+            initial_memory = PagedMemory()
             
             # Keep track of conditional flags.
             condition_flags = self.initialise_condition_flags()
@@ -107,8 +126,7 @@ class RegisterEvaluator:
             # Keep track of a register (or registers) that are null.
             null_registers = {}
             
-            self.checked_paths[hex(start_point)] = {}
-            current_path = hex(start_point)
+            current_path = self.path_trie.get_root(start_point)
             
             # Add item to queue.
             self.add_to_trace_queue(
@@ -135,6 +153,11 @@ class RegisterEvaluator:
     
     def clear_working_files(self):
         logging.debug('Cleaning up...')
+        self.instruction_queue = collections.deque()
+        self.queued_states = set()
+        self.queue_memory_store = {}
+        self.queue_memory_used = 0
+        self.queued_pages = {}
         for filename in os.listdir(common_paths.tmp_path):
             file_path = os.path.join(common_paths.tmp_path, filename)
             try:
@@ -186,19 +209,16 @@ class RegisterEvaluator:
                     obtained_id
                 )
             self.num_obtained_endpoints = len(self.obtained_endpoints)
-            logging.debug(
-                'Expected endpoints: '
-                + str(self.expected_endpoints)
-                + ' obtained endpoints: '
-                + str(self.obtained_endpoints)
-            )
+            if utils.is_log_enabled(logging.DEBUG):
+                logging.debug(
+                    'Expected endpoints: '
+                    + str(self.expected_endpoints)
+                    + ' obtained endpoints: '
+                    + str(self.obtained_endpoints)
+                )
             
             # Process the COI.
             coi_name = end_point_obj[ins_address]
-            memory_map = {
-                key:memory_map[key] 
-                    for key in sorted(memory_map.keys())
-            }
             register_object = {
                 key:register_object[key] 
                     for key in sorted(register_object.keys())
@@ -209,26 +229,24 @@ class RegisterEvaluator:
                 'registers': register_object
             }
             
-            logging.debug(
-                'Endpoint reached for '
-                + coi_name
-                + ' at '
-                + hex(ins_address)
-                + '!\n'
-                + 'memory: '
-                + self.print_memory(memory_map)
-                + '\nregisters: '
-                + self.print_memory(register_object)
-            )
+            if utils.is_log_enabled(logging.DEBUG):
+                logging.debug(
+                    'Endpoint reached for '
+                    + coi_name
+                    + ' at '
+                    + hex(ins_address)
+                    + '!\n'
+                    + 'memory: '
+                    + self.print_memory(memory_map)
+                    + '\nregisters: '
+                    + self.print_memory(register_object)
+                )
             
-            # Process the output and get updated memory map.
+            # Process the output and get updated memory map
+            #  (as copy-on-write pages).
             memory_map = self.coi_processor.process_trace_output(
                 {coi_name:out_obj}
             )
-            memory_map = {
-                key:memory_map[key] 
-                    for key in sorted(memory_map.keys())
-            }
             end_points.remove(ins_address)
             
             # Output of SVC is an error code stored in register r0.
@@ -237,7 +255,7 @@ class RegisterEvaluator:
             register_object = self.store_register_bytes(
                 register_object,
                 ARM_REG_R0,
-                '00000000'
+                0
             )
             # We've done all the processing we want to, 
             #  for the COI call instruction.
@@ -256,180 +274,154 @@ class RegisterEvaluator:
     def trace_register_values(self, start_point, end_points, register_object,  
                             memory_map, condition_flags, trace_obj, branch_points, 
                             current_path, null_registers={}, gc=0, exec_last=False):
-        logging.debug(  
-            'Starting trace at '
-            + hex(start_point)
-            + ', counter: '
-            + str(gc)
-        )
+        if utils.is_log_enabled(logging.DEBUG):
+            logging.debug(  
+                'Starting trace at '
+                + hex(start_point)
+                + ', counter: '
+                + str(gc)
+            )
         
         # Start from the starting point within assembly,
         #  and follow the instructions along the chain.
+        # Instructions are replayed from translated (basic) blocks,
+        #  which are translated the first time they are reached.
         ins_address = start_point
         code_end = common_objs.code_end_address
-        while ins_address <= code_end:
-            register_object[ARM_REG_PC] = self.get_pc_value(ins_address)
-        
-            pre_exec_address = ins_address
-            
-            # If we have arrived at an end point, then
-            #  return the registers and memory map.
-            if exec_last == False:
-                if ins_address in end_points:
-                    return (ins_address, trace_obj, memory_map, register_object)
+        while ((ins_address != None) and (ins_address <= code_end)):
+            block = self.translation_cache.get_block(ins_address)
+            for (ins_address, pc_value, step_type, insn, operation,
+                    next_address, writes_pc) in block:
+                register_object[ARM_REG_PC] = pc_value
                 
-            if ins_address in common_objs.errored_instructions:
-                logging.trace(
-                    'Errored instruction at '
-                    + hex(ins_address)
-                    + '. Skipping.'
-                )
-                (ins_address, register_object) = self.update_pc_register(
-                    ins_address,
-                    register_object
-                )
-                if ins_address == None: break
-                continue
+                # If we have arrived at an end point, then
+                #  return the registers and memory map.
+                if exec_last == False:
+                    if ins_address in end_points:
+                        return (ins_address, trace_obj, memory_map, register_object)
                 
-            # We assume that the code must contain ways to skip inline data
-            #  (such as via branches), so if we encounter inline data, 
-            #  we must have come to end of executable part of function.
-            if common_objs.disassembled_firmware[ins_address]['is_data'] == True:
-                logging.trace(
-                    'Data instruction at '
-                    + hex(ins_address)
-                    + '. Skipping'
-                )
-                return (None, None, None, None)
-
-            # Instructions we needn't process (NOP, etc).
-            skip_insn = self.check_skip_instruction(ins_address)
-            if skip_insn == True:
-                logging.trace(
-                    'Instruction at '
-                    + hex(ins_address)
-                    + ' to be skipped.'
-                )
-                (ins_address, register_object) = self.update_pc_register(
-                    ins_address,
-                    register_object
-                )
-                if ins_address == None: break
-                continue
-            
-            insn = common_objs.disassembled_firmware[ins_address]['insn']
-            opcode_id = insn.id
-
-            # Debug and trace messages.
-            logging.debug('------------------------------------------')
-            logging.debug(hex(ins_address) + '  ' + insn.mnemonic + '  ' + insn.op_str)
-            logging.trace('memory: ' + self.print_memory(memory_map))
-            logging.debug('reg: ' + self.print_memory(register_object))
-            logging.debug('flags: ' + str(condition_flags))
-
-            # Branches require special processing.
-            if opcode_id in [ARM_INS_B, ARM_INS_BL, ARM_INS_BLX, ARM_INS_BX, 
-                    ARM_INS_CBNZ, ARM_INS_CBZ]:
-                (executed_branch, should_execute_next_instruction) = \
-                    self.process_branch_instruction(
-                        register_object,
-                        memory_map,
-                        trace_obj,
-                        current_path,
-                        ins_address,
-                        condition_flags,
-                        branch_points,
-                        null_registers
-                    )
-                if ((opcode_id == ARM_INS_BL) and (executed_branch == False)):
-                    register_object[ARM_REG_R0] = '00000000'
-                if should_execute_next_instruction == True:
-                    (ins_address, register_object) = self.update_pc_register(
-                        ins_address,
-                        register_object
-                    )
-                    if ins_address == None: break
-                    continue
+                if step_type == consts.STEP_ERRORED:
+                    if utils.is_log_enabled(logging.TRACE):
+                        logging.trace(
+                            'Errored instruction at '
+                            + hex(ins_address)
+                            + '. Skipping.'
+                        )
+                # We assume that the code must contain ways to skip inline 
+                #  data (such as via branches), so if we encounter inline 
+                #  data, we must have come to end of executable part of 
+                #  function.
+                elif step_type == consts.STEP_DATA:
+                    if utils.is_log_enabled(logging.TRACE):
+                        logging.trace(
+                            'Data instruction at '
+                            + hex(ins_address)
+                            + '. Skipping'
+                        )
+                    return (None, None, None, None)
+                # Instructions we needn't process (NOP, etc).
+                elif step_type == consts.STEP_SKIP:
+                    if utils.is_log_enabled(logging.TRACE):
+                        logging.trace(
+                            'Instruction at '
+                            + hex(ins_address)
+                            + ' to be skipped.'
+                        )
                 else:
-                    logging.trace(
-                        'Branch processing indicates that next instruction '
-                        + 'should not be executed.'
-                    )
+                    # Debug and trace messages.
+                    if utils.is_log_enabled(logging.DEBUG):
+                        logging.debug('------------------------------------------')
+                        logging.debug(hex(ins_address) + '  ' + insn.mnemonic + '  ' + insn.op_str)
+                        if utils.is_log_enabled(logging.TRACE):
+                            logging.trace('memory: ' + self.print_memory(memory_map))
+                        logging.debug('reg: ' + self.print_memory(register_object))
+                        logging.debug('flags: ' + str(condition_flags))
+                    
+                    # Compute the values of the registers.
+                    if step_type == consts.STEP_EXECUTE:
+                        (register_object, memory_map, condition_flags, 
+                                null_registers) = operation(
+                            register_object,
+                            memory_map,
+                            trace_obj,
+                            current_path,
+                            condition_flags,
+                            null_registers
+                        )
+                        # In the event that PC is passed to POP, there will 
+                        #  be a branch. Presumably we wouldn't continue with 
+                        #  the current trace then.
+                        if register_object == None:
+                            logging.trace(
+                                'Register object returned null. Probably POP {PC}'
+                            )
+                            return (None, None, None, None)
+                    # Branches require special processing.
+                    elif step_type == consts.STEP_BRANCH:
+                        (executed_branch, should_execute_next_instruction) = \
+                            self.process_branch_instruction(
+                                register_object,
+                                memory_map,
+                                trace_obj,
+                                current_path,
+                                ins_address,
+                                condition_flags,
+                                branch_points,
+                                null_registers
+                            )
+                        if ((insn.id == ARM_INS_BL) and (executed_branch == False)):
+                            register_object[ARM_REG_R0] = 0
+                        if should_execute_next_instruction != True:
+                            if utils.is_log_enabled(logging.TRACE):
+                                logging.trace(
+                                    'Branch processing indicates that next instruction '
+                                    + 'should not be executed.'
+                                )
+                            return (None, None, None, None)
+                    # Table Branch instructions require quite a bit of processing.
+                    elif step_type == consts.STEP_TABLE_BRANCH:
+                        self.process_table_branch_instruction(
+                            register_object,
+                            memory_map,
+                            condition_flags,
+                            trace_obj,
+                            current_path,
+                            ins_address,
+                            null_registers
+                        )
+                        return (None, None, None, None)
+                    # IT instructions.
+                    elif step_type == consts.STEP_IT:
+                        self.process_it_instruction(
+                            register_object,
+                            memory_map,
+                            trace_obj,
+                            current_path,
+                            ins_address,
+                            condition_flags,
+                            null_registers
+                        )
+                        return (None, None, None, None)
+                
+                # Move on to the next instruction (as in update_pc_register).
+                if writes_pc == True:
+                    next_address = register_object[ARM_REG_PC]
+                else:
+                    register_object[ARM_REG_PC] = pc_value
+                if next_address == None: 
                     return (None, None, None, None)
-            # Table Branch instructions require quite a bit of processing.
-            elif (opcode_id in [ARM_INS_TBB, ARM_INS_TBH]):
-                self.process_table_branch_instruction(
-                    register_object,
-                    memory_map,
-                    condition_flags,
-                    trace_obj,
-                    current_path,
-                    ins_address,
-                    null_registers
-                )
-                return (None, None, None, None)
-            # IT instructions.
-            elif opcode_id == ARM_INS_IT:
-                self.process_it_instruction(
-                    register_object,
-                    memory_map,
-                    trace_obj,
-                    current_path,
-                    ins_address,
-                    condition_flags,
-                    null_registers
-                )
-                return (None, None, None, None)
                 
-            # Compute the values of the registers.
-            (register_object, memory_map, condition_flags, null_registers) = \
-                self.process_reg_values_for_instruction(
-                    register_object,
-                    memory_map,
-                    trace_obj,
-                    current_path,
-                    ins_address,
-                    condition_flags,
-                    null_registers
-                )
-            # In the event that PC is passed to POP, there will be a branch.
-            #  Presumably we wouldn't continue with the current trace then.
-            if register_object == None:
-                logging.trace(
-                    'Register object returned null. Probably POP {PC}'
-                )
-                return (None, None, None, None)
-            (ins_address, register_object) = self.update_pc_register(
-                ins_address,
-                register_object
-            )
-            if ins_address == None: break
-            
-            if exec_last == True:
-                if pre_exec_address in end_points:
-                    return (pre_exec_address, trace_obj, memory_map, register_object)
+                if ((exec_last == True) and (step_type == consts.STEP_EXECUTE)):
+                    if ins_address in end_points:
+                        return (ins_address, trace_obj, memory_map, register_object)
+            ins_address = next_address
         return (None, None, None, None)
     
     def update_pc_register(self, ins_address, register_object):
-        if utils.is_valid_code_address(ins_address) != True:
-            should_update_pc_value = True
-        else:
-            insn = common_objs.disassembled_firmware[ins_address]['insn']
-            if len(insn.operands) == 0:
-                should_update_pc_value = True
-            else:
-                if ((insn.operands[0].type == ARM_OP_REG) 
-                        and (insn.operands[0].value.reg == ARM_REG_PC)):
-                    should_update_pc_value = False
-                else:
-                    should_update_pc_value = True
-                    
         # This is to handle the case where PC has been overwritten
         #  within the instruction.
-        if should_update_pc_value == False:
+        if self.check_pc_written(ins_address) == True:
             ins_address = register_object[ARM_REG_PC]
-            if type(ins_address) is str:
-                ins_address = int(ins_address, 16)
             return (ins_address, register_object) 
 
         pc_address = self.get_pc_value(ins_address)
@@ -438,6 +430,17 @@ class RegisterEvaluator:
 
         return (ins_address, register_object)
         
+    def check_pc_written(self, ins_address):
+        if utils.is_valid_code_address(ins_address) != True:
+            return False
+        insn = common_objs.disassembled_firmware[ins_address]['insn']
+        if len(insn.operands) == 0:
+            return False
+        if ((insn.operands[0].type == ARM_OP_REG) 
+                and (insn.operands[0].value.reg == ARM_REG_PC)):
+            return True
+        return False
+        
     def get_branch_end_points_from_trace_obj(self, trace_obj):
         branch_or_end_points = trace_obj['branch_or_end_points']
         branch_points = list(branch_or_end_points.keys())
@@ -469,19 +472,20 @@ class RegisterEvaluator:
             branch_register = operands[0].value.reg
             branch_target = self.get_register_bytes(
                 next_reg_values,
-                branch_register,
-                'int'
+                branch_register
             )
             
             # Do we need further processing for ARM/Thumb switch?
             if branch_target != None:
-                logging.trace('Branch target is ' + hex(branch_target))
+                if utils.is_log_enabled(logging.TRACE):
+                    logging.trace('Branch target is ' + hex(branch_target))
                 if branch_target % 2 == 1:
                     branch_target = branch_target - 1
-                    logging.trace(
-                        'BX switch. New branch target is ' 
-                        + hex(branch_target)
-                    )
+                    if utils.is_log_enabled(logging.TRACE):
+                        logging.trace(
+                            'BX switch. New branch target is ' 
+                            + hex(branch_target)
+                        )
         elif opcode_id in [ARM_INS_CBZ, ARM_INS_CBNZ]:
             branch_target = operands[1].value.imm
         
@@ -496,14 +500,14 @@ class RegisterEvaluator:
         # If BL, BLX, get return address and update Link Register.
         if opcode_id in [ARM_INS_BL, ARM_INS_BLX]:
             link_return_address = \
-                self.all_addresses[self.all_addresses.index(ins_address) + 1]
-            register_object[ARM_REG_LR] = \
-                '{0:08x}'.format(link_return_address) 
+                self.get_next_address(self.all_addresses, ins_address)
+            register_object[ARM_REG_LR] = link_return_address
             
-            logging.debug(
-                'Link return address is '
-                + '{0:08x}'.format(link_return_address)
-            )
+            if utils.is_log_enabled(logging.DEBUG):
+                logging.debug(
+                    'Link return address is '
+                    + '{0:08x}'.format(link_return_address)
+                )
             
         # We process certain functions differently.
         if branch_target in common_objs.replace_functions:
@@ -527,14 +531,15 @@ class RegisterEvaluator:
             #  If B is used, then we probably don't want to continue execution.
             if opcode_id == ARM_INS_B:
                 next_address = \
-                    self.all_addresses[self.all_addresses.index(ins_address) + 1]
-                lr_value = int(register_object[ARM_REG_LR], 16)
+                    self.get_next_address(self.all_addresses, ins_address)
+                lr_value = register_object[ARM_REG_LR]
                 if next_address != lr_value:
                     trace_obj = self.get_return_trace_obj(
                         trace_obj,
                         lr_value
                     )
-                    logging.debug('Counter: ' + str(self.global_counter))
+                    if utils.is_log_enabled(logging.DEBUG):
+                        logging.debug('Counter: ' + str(self.global_counter))
                     
                     # Branch.
                     self.add_to_trace_queue(
@@ -607,7 +612,8 @@ class RegisterEvaluator:
                 trace_obj,
                 branch_target
             )
-        logging.debug('Counter: ' + str(self.global_counter))
+        if utils.is_log_enabled(logging.DEBUG):
+            logging.debug('Counter: ' + str(self.global_counter))
         
         # Branch.
         self.add_to_trace_queue(
@@ -648,7 +654,7 @@ class RegisterEvaluator:
         # ----------- Do basic checks first --------------
         
         # If target not in f/w addresses, we can't proceed with branch.
-        if (branch_target not in self.all_addresses):
+        if (branch_target not in common_objs.next_address_index):
             logging.warning(
                 'Branch target '
                 + hex(branch_target)
@@ -673,11 +679,13 @@ class RegisterEvaluator:
         curr_function_block = utils.id_function_block_for_instruction(
             calling_address
         )
-        logging.debug('Current function block: ' + hex(curr_function_block))
+        if utils.is_log_enabled(logging.DEBUG):
+            logging.debug('Current function block: ' + hex(curr_function_block))
         target_function_block = utils.id_function_block_for_instruction(
             branch_target
         )
-        logging.debug('Target function block: ' + hex(target_function_block))
+        if utils.is_log_enabled(logging.DEBUG):
+            logging.debug('Target function block: ' + hex(target_function_block))
         # If the target contains a perpetual self-loop, 
         #  it will have been denylisted.
         if ((target_function_block in common_objs.denylisted_functions)
@@ -721,21 +729,22 @@ class RegisterEvaluator:
                 logging.debug(
                     'Branch point is not present in trace object.'
                 )
-                function_block = \
-                    common_objs.function_blocks[target_function_block]
-                call_depth = function_block['call_depth']
-                logging.debug('Call depth of target is ' + str(call_depth))
-                function_block = None
+                call_depth = common_objs.call_graph.get_call_depth(
+                    target_function_block
+                )
+                if utils.is_log_enabled(logging.DEBUG):
+                    logging.debug('Call depth of target is ' + str(call_depth))
                 # We don't want to waste time on functions that have very 
                 #  high call-depth.
                 if call_depth > common_objs.max_call_depth:
                     logging.debug('Call-depth is too high.')
                     return (False, None)
 
-        logging.debug(
-            'Branching with counter: '  
-            + str(self.global_counter)
-        )
+        if utils.is_log_enabled(logging.DEBUG):
+            logging.debug(
+                'Branching with counter: '  
+                + str(self.global_counter)
+            )
         return (True, new_path)
 
     def initialise_condition_flags(self):
@@ -761,8 +770,7 @@ class RegisterEvaluator:
         if ((opcode_id == ARM_INS_CBZ) or (opcode_id == ARM_INS_CBNZ)):
             (reg_value, _) = self.get_src_reg_value(
                 next_reg_values, 
-                operands[0], 
-                'int'
+                operands[0]
             )
             if reg_value == None:
                 is_branch_condition_satisfied = None
@@ -785,10 +793,11 @@ class RegisterEvaluator:
         return is_branch_condition_satisfied
         
     def check_condition_satisfied(self, condition, flags):
-        logging.trace(
-            'Checking whether condition satisfied for flags: '
-            + str(flags)
-        )
+        if utils.is_log_enabled(logging.TRACE):
+            logging.trace(
+                'Checking whether condition satisfied for flags: '
+                + str(flags)
+            )
         # To bypass conditional checks, we simply return None.
         # This forces the conditional branch to execute both paths.
         if common_objs.bypass_all_conditional_checks == True:
@@ -902,12 +911,9 @@ class RegisterEvaluator:
             condition_flags['c'] = carry
         if overflow != None:
             condition_flags['v'] = overflow
-        result_in_bits = utils.get_binary_representation(result, 32)
-        if result_in_bits[0] == '0':
-            condition_flags['n'] = 0
-        else:
-            condition_flags['n'] = 1
-        if '1' in result_in_bits:
+        result = result & 0xFFFFFFFF
+        condition_flags['n'] = (result >> 31) & 1
+        if result != 0:
             condition_flags['z'] = 0
         else:
             condition_flags['z'] = 1
@@ -929,38 +935,21 @@ class RegisterEvaluator:
         return False
     
     def check_already_traced(self, current_path, calling_address, branch_target):
-        # Create new path string.
-        calling_address = hex(calling_address)
-        branch_target = hex(branch_target)
-        branch_path = calling_address + ',' + branch_target
-        new_path = current_path + ',' + branch_path
+        # Paths are nodes in the path trie. The new path is the current 
+        #  path, followed by the calling address and branch target.
+        (calling_path, is_new_calling_path) = self.path_trie.get_child(
+            current_path,
+            calling_address
+        )
+        (new_path, is_new_path) = self.path_trie.get_child(
+            calling_path,
+            branch_target
+        )
         
         # Check whether this path has been traced before.
-        path_list = new_path.split(',')
-        traced_paths = self.checked_paths
-        counter = 0
         previously_traced = True
-        while len(path_list) > 0:
-            element = path_list[0]
-            if element not in traced_paths.keys():
-                previously_traced = False
-                if len(path_list) == 2:
-                    traced_paths[path_list[0]] = {
-                        path_list[1]: {}
-                    }
-                elif len(path_list) == 1:
-                    traced_paths[path_list[0]] = {}
-                    if element != branch_target:
-                        logging.critical('Invalid trace path!')
-                        if common_objs.allow_loops != True:
-                            return (True, None)
-                else:
-                    logging.critical('Invalid trace path!')
-                    if common_objs.allow_loops != True:
-                        return (True, None)
-            path_list = path_list[1:]
-            traced_paths = traced_paths[element]
-            counter += 1
+        if ((is_new_calling_path == True) or (is_new_path == True)):
+            previously_traced = False
             
         # Do not modify the order of this and subsequent return.
         if common_objs.allow_loops == True:
@@ -973,21 +962,18 @@ class RegisterEvaluator:
         # Loops may be of different lengths and between different functions,
         #  i.e., addressA in funcX calls addressB in funcY, then 
         #  addressC in funcY calls addressD in funcX, and they continue.
-        split_path = current_path.split(',')
-        split_path.append(calling_address)
-        split_path.append(branch_target)
+        # For each loop length i, the last i-1 elements before the 
+        #  branch target are compared against the i-1 elements that 
+        #  precede them (by one element). Only the end of the path 
+        #  is needed for this.
+        path_length = self.path_trie.get_depth(new_path)
+        path_end = self.path_trie.get_path_end(new_path, 30)
+        end_length = len(path_end)
         for i in range(2,16):
-            if len(split_path) < (2*i):
+            if path_length < (2*i):
                 break
-            path_end = split_path[(-1*i):]
-            path_end_str = path_end[0]
-            for x in range(1,(len(path_end)-1)):
-                path_end_str += (',' + path_end[x])
-            remaining_path = split_path[0:(-1*i)]
-            remaining_path_str = remaining_path[0]
-            for y in range(1,(len(remaining_path)-1)):
-                remaining_path_str += (',' + remaining_path[y])
-            if remaining_path_str.endswith(path_end_str):
+            if (path_end[(end_length-2*i):(end_length-i-1)] 
+                    == path_end[(end_length-i):(end_length-1)]):
                 logging.debug('Path is looping. Breaking out.')
                 return (True, None)
         return (False, new_path)
@@ -1029,8 +1015,7 @@ class RegisterEvaluator:
         # Get the actual value of indexing register.
         actual_value = self.get_register_bytes(
             next_reg_values,
-            comp_register,
-            'int'
+            comp_register
         )
         if actual_value == None:
             branch_address = skip_address
@@ -1100,11 +1085,10 @@ class RegisterEvaluator:
         # Get all possible addresses.
         for i in range(num_values+1):
             index_address = pc_address + (mul_factor*i)
-            value = utils.get_firmware_bytes(
+            value = utils.get_firmware_value(
                 index_address, 
                 num_bytes=mul_factor
             )
-            value = int(value, 16)
             branch_address = pc_address + (2*value)
             table_branch_addresses.append(branch_address)
         
@@ -1132,12 +1116,13 @@ class RegisterEvaluator:
                 continue
             comp_address = address
             comparison_value = prev_insn['insn'].operands[1].value.imm
-            logging.debug(
-                'Register '
-                + str(index_register)
-                + ' has been compared with value '
-                + str(comparison_value)
-            )
+            if utils.is_log_enabled(logging.DEBUG):
+                logging.debug(
+                    'Register '
+                    + str(index_register)
+                    + ' has been compared with value '
+                    + str(comparison_value)
+                )
             break
         return (index_register, comparison_value, comp_address)
             
@@ -1163,8 +1148,7 @@ class RegisterEvaluator:
                 branch_register = operands[0].value.reg
                 branch_target = self.get_register_bytes(
                     next_reg_values,
-                    branch_register,
-                    'int'
+                    branch_register
                 )
             elif opcode_id in [ARM_INS_CBZ, ARM_INS_CBNZ]:
                 branch_target = operands[1].value.imm
@@ -1198,10 +1182,11 @@ class RegisterEvaluator:
             execute_else_instructions = True
             
         mnemonic = insn.mnemonic
-        logging.debug(
-            'Processing IT instruction: '
-            + mnemonic
-        )
+        if utils.is_log_enabled(logging.DEBUG):
+            logging.debug(
+                'Processing IT instruction: '
+                + mnemonic
+            )
         
         mnemonic = mnemonic[1:]
         number_of_conditionals = len(mnemonic)
@@ -1221,32 +1206,35 @@ class RegisterEvaluator:
             address
         )
 
+        # Each set of conditionals gets its own copy of the state.
+        # Registers, flags and null registers are flat dicts, memory is 
+        #  copy-on-write, and trace objects are never modified.
         # Execute Then instructions.
         if execute_then_instructions == True:
             self.execute_it_conditionals(
-                copy.deepcopy(register_object),
-                copy.deepcopy(memory_map),
-                copy.deepcopy(condition_flags),
-                copy.deepcopy(trace_obj),
+                dict(register_object),
+                memory_map.fork(),
+                dict(condition_flags),
+                trace_obj,
                 current_path,
                 then_instructions,
                 ins_address,
                 postconditional_ins_address,
-                copy.deepcopy(null_registers)
+                dict(null_registers)
             )
         
         # Execute Else instructions.
         if execute_else_instructions == True:
             self.execute_it_conditionals(
-                copy.deepcopy(register_object),
-                copy.deepcopy(memory_map),
-                copy.deepcopy(condition_flags),
-                copy.deepcopy(trace_obj),
+                dict(register_object),
+                memory_map.fork(),
+                dict(condition_flags),
+                trace_obj,
                 current_path,
                 else_instructions,
                 ins_address,
                 postconditional_ins_address,
-                copy.deepcopy(null_registers)
+                dict(null_registers)
             )
         
     def execute_it_conditionals(self, register_object, memory_map, condition_flags,
@@ -1257,14 +1245,16 @@ class RegisterEvaluator:
             
         for conditional_address in ins_list:
             insn = common_objs.disassembled_firmware[conditional_address]['insn']
-            logging.debug('------------------------------------------')
-            logging.debug(
-                hex(conditional_address) 
-                + '  ' + insn.mnemonic 
-                + '  ' + insn.op_str
-            )
-            logging.trace('memory: ' + self.print_memory(memory_map))
-            logging.debug('reg: ' + self.print_memory(next_reg_values))
+            if utils.is_log_enabled(logging.DEBUG):
+                logging.debug('------------------------------------------')
+                logging.debug(
+                    hex(conditional_address) 
+                    + '  ' + insn.mnemonic 
+                    + '  ' + insn.op_str
+                )
+                if utils.is_log_enabled(logging.TRACE):
+                    logging.trace('memory: ' + self.print_memory(memory_map))
+                logging.debug('reg: ' + self.print_memory(next_reg_values))
             
             opcode_id = insn.id
             if opcode_id in [ARM_INS_B, ARM_INS_BL, ARM_INS_BLX, ARM_INS_BX, 
@@ -1323,391 +1313,259 @@ class RegisterEvaluator:
         
     # =======================================================================  
     # ----------------------- Instruction Processing ------------------------
-    
-    def process_reg_values_for_instruction(self, register_object, memory_map, 
-                                trace_obj, current_path, ins_address, 
-                                condition_flags, null_registers):
-        if ins_address in common_objs.errored_instructions:
-            return (None, None, None, None)
-        instruction = common_objs.disassembled_firmware[ins_address]['insn']
-        if instruction == None:
-            return (None, None, None, None)
-            
-        # If the instruction is to be executed conditionally, first check 
-        #  if the condition is satisfied.
-        if condition_flags != None:
-            if ((instruction.cc != ARM_CC_AL) and (instruction.cc != ARM_CC_INVALID)): 
-                is_condition_satisfied = self.check_condition_satisfied(
-                    instruction.cc,
-                    condition_flags
-                )
-                if is_condition_satisfied == False:
-                    return (register_object, memory_map, condition_flags, null_registers)
-        
-        # Process instruction.        
-        if instruction.id == ARM_INS_ADC:
-            (register_object, condition_flags, null_registers) = self.process_adc(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id in [ARM_INS_ADD, ARM_INS_ADDW]:
-            (register_object, condition_flags, null_registers) = self.process_add(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id == ARM_INS_ADR:
-            (register_object, null_registers) = self.process_adr(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id == ARM_INS_AND:
-            (register_object, condition_flags, null_registers) = self.process_and(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id == ARM_INS_ASR:
-            (register_object, condition_flags, null_registers) = self.process_asr(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id == ARM_INS_BFC:
-            (register_object, null_registers) = self.process_bfc(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id == ARM_INS_BFI:
-            (register_object, null_registers) = self.process_bfi(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id == ARM_INS_BIC:
-            (register_object, condition_flags, null_registers) = self.process_bic(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id == ARM_INS_CLZ:
-            (register_object, null_registers) = self.process_clz(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id in [ARM_INS_CMN, ARM_INS_CMP, ARM_INS_TEQ, ARM_INS_TST]:
-            (condition_flags, null_registers) = self.process_condition(
-                ins_address,
-                register_object,
-                condition_flags,
-                null_registers
-            )
-            if condition_flags == None:
-                register_object = None
-        elif instruction.id == ARM_INS_EOR:
-            (register_object, condition_flags, null_registers) = self.process_eor(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id == ARM_INS_LDM:
-            (register_object, memory_map, null_registers) = self.process_ldm(
-                ins_address,
-                instruction,
-                register_object,
-                memory_map,
-                trace_obj,
-                current_path,
-                condition_flags,
-                null_registers
-            ) 
-        elif instruction.id in [ARM_INS_LDR, ARM_INS_LDREX, 
-                    ARM_INS_LDRH, ARM_INS_LDRSH, ARM_INS_LDREXH, 
-                    ARM_INS_LDRB, ARM_INS_LDRSB, ARM_INS_LDREXB]:
-            (register_object, memory_map, null_registers) = self.process_ldr(
-                ins_address,
-                instruction,
-                register_object,
-                memory_map,
-                trace_obj,
-                current_path,
-                condition_flags,
-                null_registers
-            ) 
-        elif instruction.id == ARM_INS_LDRD:
-            (register_object, memory_map, null_registers) = self.process_ldrd(
-                ins_address,
-                instruction,
-                register_object,
-                memory_map,
-                trace_obj,
-                current_path,
-                condition_flags,
-                null_registers
-            ) 
-        elif instruction.id == ARM_INS_LSL:
-            (register_object, condition_flags, null_registers) = self.process_lsl(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id == ARM_INS_LSR:
-            (register_object, condition_flags, null_registers) = self.process_lsr(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id == ARM_INS_MLA:
-            (register_object, condition_flags, null_registers) = self.process_mla(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id == ARM_INS_MLS:
-            (register_object, condition_flags, null_registers) = self.process_mls(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id in [ARM_INS_MOV, ARM_INS_MOVW]:
-            (register_object, condition_flags, null_registers) = self.process_mov(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id == ARM_INS_MUL:
-            (register_object, condition_flags, null_registers) = self.process_mul(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id == ARM_INS_MVN:
-            (register_object, condition_flags, null_registers) = self.process_mvn(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id == ARM_INS_ORN:
-            (register_object, condition_flags, null_registers) = self.process_orn(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id == ARM_INS_ORR:
-            (register_object, condition_flags, null_registers) = self.process_orr(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id == ARM_INS_POP:
-            (register_object, memory_map, null_registers) = self.process_pop(
-                register_object,
-                trace_obj,
-                ins_address,
-                instruction,
-                memory_map,
-                current_path,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id == ARM_INS_PUSH:
-            (register_object, memory_map, null_registers) = self.process_push(
-                ins_address,
-                instruction,
-                register_object,
-                memory_map,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id == ARM_INS_RBIT:
-            (register_object, null_registers) = self.process_rbit(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id == ARM_INS_REV:
-            (register_object, null_registers) = self.process_rev(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id == ARM_INS_REV16:
-            (register_object, null_registers) = self.process_rev16(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id == ARM_INS_ROR:
-            (register_object, condition_flags, null_registers) = self.process_ror(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id == ARM_INS_RRX:
-            (register_object, condition_flags, null_registers) = self.process_rrx(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id == ARM_INS_RSB:
-            (register_object, condition_flags, null_registers) = self.process_rsb(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id == ARM_INS_SBC:
-            (register_object, condition_flags, null_registers) = self.process_sbc(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id == ARM_INS_SDIV:
-            (register_object, null_registers) = self.process_sdiv(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id in [ARM_INS_STR, ARM_INS_STREX, 
-                ARM_INS_STRH, ARM_INS_STREXH, 
-                ARM_INS_STRB, ARM_INS_STREXB]:
-            (register_object, memory_map, null_registers) = self.process_str(
-                ins_address,
-                instruction,
-                register_object,
-                memory_map,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id == ARM_INS_STRD:
-            (register_object, memory_map, null_registers) = self.process_strd(
-                ins_address,
-                instruction,
-                register_object,
-                memory_map,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id == ARM_INS_STM:
-            (register_object, memory_map, null_registers) = self.process_stm(
-                ins_address,
-                instruction,
-                register_object,
-                memory_map,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id in [ARM_INS_SUB, ARM_INS_SUBW]:
-            (register_object, condition_flags, null_registers) = self.process_sub(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id in [ARM_INS_SXTB, ARM_INS_SXTH]:
-            (register_object, null_registers) = self.process_sxt(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id == ARM_INS_UBFX:
-            (register_object, null_registers) = self.process_ubfx(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id == ARM_INS_UDIV:
-            (register_object, null_registers) = self.process_udiv(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id in [ARM_INS_UXTB, ARM_INS_UXTH]:
-            (register_object, null_registers) = self.process_uxt(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags,
-                null_registers
-            )
-        elif instruction.id == ARM_INS_SVC:
-            # We assume that all SVC calls return 0 (i.e., no error).
-            register_object = self.store_register_bytes(
-                register_object,
-                ARM_REG_R0,
-                '00000000'
+    
+    def get_instruction_handlers(self):
+        """Map opcode ids to instruction handlers.
+
+        All handlers take (ins_address, instruction, register_object, 
+        memory_map, trace_obj, current_path, condition_flags, 
+        null_registers) and return (register_object, memory_map, 
+        condition_flags, null_registers).
+        """
+        flag_setting_handlers = {
+            ARM_INS_ADC: self.process_adc,
+            ARM_INS_ADD: self.process_add,
+            ARM_INS_ADDW: self.process_add,
+            ARM_INS_AND: self.process_and,
+            ARM_INS_ASR: self.process_asr,
+            ARM_INS_BIC: self.process_bic,
+            ARM_INS_EOR: self.process_eor,
+            ARM_INS_LSL: self.process_lsl,
+            ARM_INS_LSR: self.process_lsr,
+            ARM_INS_MLA: self.process_mla,
+            ARM_INS_MLS: self.process_mls,
+            ARM_INS_MOV: self.process_mov,
+            ARM_INS_MOVW: self.process_mov,
+            ARM_INS_MUL: self.process_mul,
+            ARM_INS_MVN: self.process_mvn,
+            ARM_INS_ORN: self.process_orn,
+            ARM_INS_ORR: self.process_orr,
+            ARM_INS_ROR: self.process_ror,
+            ARM_INS_RRX: self.process_rrx,
+            ARM_INS_RSB: self.process_rsb,
+            ARM_INS_SBC: self.process_sbc,
+            ARM_INS_SUB: self.process_sub,
+            ARM_INS_SUBW: self.process_sub
+        }
+        register_handlers = {
+            ARM_INS_ADR: self.process_adr,
+            ARM_INS_BFC: self.process_bfc,
+            ARM_INS_BFI: self.process_bfi,
+            ARM_INS_CLZ: self.process_clz,
+            ARM_INS_RBIT: self.process_rbit,
+            ARM_INS_REV: self.process_rev,
+            ARM_INS_REV16: self.process_rev16,
+            ARM_INS_SDIV: self.process_sdiv,
+            ARM_INS_SXTB: self.process_sxt,
+            ARM_INS_SXTH: self.process_sxt,
+            ARM_INS_UBFX: self.process_ubfx,
+            ARM_INS_UDIV: self.process_udiv,
+            ARM_INS_UXTB: self.process_uxt,
+            ARM_INS_UXTH: self.process_uxt
+        }
+        load_handlers = {
+            ARM_INS_LDM: self.process_ldm,
+            ARM_INS_LDR: self.process_ldr,
+            ARM_INS_LDREX: self.process_ldr,
+            ARM_INS_LDRH: self.process_ldr,
+            ARM_INS_LDRSH: self.process_ldr,
+            ARM_INS_LDREXH: self.process_ldr,
+            ARM_INS_LDRB: self.process_ldr,
+            ARM_INS_LDRSB: self.process_ldr,
+            ARM_INS_LDREXB: self.process_ldr,
+            ARM_INS_LDRD: self.process_ldrd
+        }
+        store_handlers = {
+            ARM_INS_PUSH: self.process_push,
+            ARM_INS_STR: self.process_str,
+            ARM_INS_STREX: self.process_str,
+            ARM_INS_STRH: self.process_str,
+            ARM_INS_STREXH: self.process_str,
+            ARM_INS_STRB: self.process_str,
+            ARM_INS_STREXB: self.process_str,
+            ARM_INS_STRD: self.process_strd,
+            ARM_INS_STM: self.process_stm
+        }
+        
+        # Handlers are bound to an adapter for their argument/return shape.
+        instruction_handlers = {}
+        for (handlers, adapter) in [
+                (flag_setting_handlers, self.execute_flag_setting_instruction),
+                (register_handlers, self.execute_register_instruction),
+                (load_handlers, self.execute_load_instruction),
+                (store_handlers, self.execute_store_instruction)]:
+            for opcode_id in handlers:
+                instruction_handlers[opcode_id] = functools.partial(
+                    adapter,
+                    handlers[opcode_id]
+                )
+        for opcode_id in [ARM_INS_CMN, ARM_INS_CMP, ARM_INS_TEQ, ARM_INS_TST]:
+            instruction_handlers[opcode_id] = self.execute_condition_instruction
+        instruction_handlers[ARM_INS_POP] = self.execute_pop_instruction
+        instruction_handlers[ARM_INS_SVC] = self.execute_svc_instruction
+        return instruction_handlers
+        
+    def process_reg_values_for_instruction(self, register_object, memory_map, 
+                                trace_obj, current_path, ins_address, 
+                                condition_flags, null_registers):
+        if ins_address in common_objs.errored_instructions:
+            return (None, None, None, None)
+        instruction = common_objs.disassembled_firmware[ins_address]['insn']
+        if instruction == None:
+            return (None, None, None, None)
+            
+        # If the instruction is to be executed conditionally, first check 
+        #  if the condition is satisfied.
+        if condition_flags != None:
+            if ((instruction.cc != ARM_CC_AL) and (instruction.cc != ARM_CC_INVALID)): 
+                is_condition_satisfied = self.check_condition_satisfied(
+                    instruction.cc,
+                    condition_flags
+                )
+                if is_condition_satisfied == False:
+                    return (register_object, memory_map, condition_flags, null_registers)
+        
+        # Process instruction.
+        instruction_handler = self.instruction_handlers.get(
+            instruction.id,
+            self.execute_unhandled_instruction
+        )
+        return instruction_handler(
+            ins_address,
+            instruction,
+            register_object,
+            memory_map,
+            trace_obj,
+            current_path,
+            condition_flags,
+            null_registers
+        )
+
+    # ---------------------- Instruction Handler Adapters ---------------------
+    def execute_flag_setting_instruction(self, handler, ins_address, 
+                                instruction, register_object, memory_map, 
+                                trace_obj, current_path, condition_flags, 
+                                null_registers):
+        (register_object, condition_flags, null_registers) = handler(
+            ins_address,
+            instruction,
+            register_object,
+            condition_flags,
+            null_registers
+        )
+        return (register_object, memory_map, condition_flags, null_registers)
+        
+    def execute_register_instruction(self, handler, ins_address, 
+                                instruction, register_object, memory_map, 
+                                trace_obj, current_path, condition_flags, 
+                                null_registers):
+        (register_object, null_registers) = handler(
+            ins_address,
+            instruction,
+            register_object,
+            condition_flags,
+            null_registers
+        )
+        return (register_object, memory_map, condition_flags, null_registers)
+        
+    def execute_load_instruction(self, handler, ins_address, 
+                                instruction, register_object, memory_map, 
+                                trace_obj, current_path, condition_flags, 
+                                null_registers):
+        (register_object, memory_map, null_registers) = handler(
+            ins_address,
+            instruction,
+            register_object,
+            memory_map,
+            trace_obj,
+            current_path,
+            condition_flags,
+            null_registers
+        )
+        return (register_object, memory_map, condition_flags, null_registers)
+        
+    def execute_store_instruction(self, handler, ins_address, 
+                                instruction, register_object, memory_map, 
+                                trace_obj, current_path, condition_flags, 
+                                null_registers):
+        (register_object, memory_map, null_registers) = handler(
+            ins_address,
+            instruction,
+            register_object,
+            memory_map,
+            condition_flags,
+            null_registers
+        )
+        return (register_object, memory_map, condition_flags, null_registers)
+        
+    def execute_pop_instruction(self, ins_address, instruction, 
+                                register_object, memory_map, trace_obj, 
+                                current_path, condition_flags, null_registers):
+        (register_object, memory_map, null_registers) = self.process_pop(
+            register_object,
+            trace_obj,
+            ins_address,
+            instruction,
+            memory_map,
+            current_path,
+            condition_flags,
+            null_registers
+        )
+        return (register_object, memory_map, condition_flags, null_registers)
+        
+    def execute_condition_instruction(self, ins_address, instruction, 
+                                register_object, memory_map, trace_obj, 
+                                current_path, condition_flags, null_registers):
+        (condition_flags, null_registers) = self.process_condition(
+            ins_address,
+            register_object,
+            condition_flags,
+            null_registers
+        )
+        if condition_flags == None:
+            register_object = None
+        return (register_object, memory_map, condition_flags, null_registers)
+        
+    def execute_svc_instruction(self, ins_address, instruction, 
+                                register_object, memory_map, trace_obj, 
+                                current_path, condition_flags, null_registers):
+        # We assume that all SVC calls return 0 (i.e., no error).
+        register_object = self.store_register_bytes(
+            register_object,
+            ARM_REG_R0,
+            0
+        )
+        # If we don't do this, R0 retains old taints.
+        if ARM_REG_R0 in null_registers: del null_registers[ARM_REG_R0]
+        return (register_object, memory_map, condition_flags, null_registers)
+        
+    def execute_conditional_instruction(self, condition, operation, 
+                                register_object, memory_map, trace_obj, 
+                                current_path, condition_flags, null_registers):
+        # Operation is a (translated) instruction handler, bound to 
+        #  its instruction.
+        if condition_flags != None:
+            is_condition_satisfied = self.check_condition_satisfied(
+                condition,
+                condition_flags
             )
-            # If we don't do this, R0 retains old taints.
-            if ARM_REG_R0 in null_registers: del null_registers[ARM_REG_R0]
-        else:
-            if ('dsb' not in instruction.mnemonic):
-                if instruction.mnemonic not in self.unhandled:
-                    self.unhandled.append(instruction.mnemonic)
-            return (register_object, memory_map, condition_flags, null_registers)
+            if is_condition_satisfied == False:
+                return (register_object, memory_map, condition_flags, null_registers)
+        return operation(
+            register_object,
+            memory_map,
+            trace_obj,
+            current_path,
+            condition_flags,
+            null_registers
+        )
+        
+    def execute_unhandled_instruction(self, ins_address, instruction, 
+                                register_object, memory_map, trace_obj, 
+                                current_path, condition_flags, null_registers):
+        if ('dsb' not in instruction.mnemonic):
+            if instruction.mnemonic not in self.unhandled:
+                self.unhandled.append(instruction.mnemonic)
         return (register_object, memory_map, condition_flags, null_registers)
 
     def update_null_registers(self, null_registers, src_ops, dst_ops):
@@ -1726,12 +1584,13 @@ class RegisterEvaluator:
             if src_op in list(null_registers.keys()):
                 tainted = True
                 for dst_op in dst_ops:
-                    logging.debug(
-                        'Register '
-                        + str(dst_op)
-                        + ' tainted by null register '
-                        + str(src_op)
-                    )
+                    if utils.is_log_enabled(logging.DEBUG):
+                        logging.debug(
+                            'Register '
+                            + str(dst_op)
+                            + ' tainted by null register '
+                            + str(src_op)
+                        )
                     null_registers[dst_op] = {}
                 break
         return (null_registers, tainted)
@@ -1764,16 +1623,14 @@ class RegisterEvaluator:
         # Get values.
         (start_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            start_operand, 
-            'int'
+            start_operand
         )
         if start_value == None: 
             null_registers[dst_operand] = {}
             return (next_reg_values, condition_flags, null_registers)
         (add_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            add_operand, 
-            'int',
+            add_operand,
             condition_flags['c']
         )
         if add_value == None: 
@@ -1831,8 +1688,7 @@ class RegisterEvaluator:
         # Get values.
         (start_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            start_operand, 
-            'int'
+            start_operand
         )
         if start_value == None: 
             null_registers[dst_operand] = {}
@@ -1840,7 +1696,6 @@ class RegisterEvaluator:
         (add_value, _) = self.get_src_reg_value(
             next_reg_values,
             add_operand,
-            'int',
             condition_flags['c']
         )
         if add_value == None: 
@@ -1884,8 +1739,7 @@ class RegisterEvaluator:
         pc_value = self.get_mem_access_pc_value(ins_address)
         (add_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            operands[1], 
-            'int'
+            operands[1]
         )        
         if add_value == None: 
             null_registers[dst_operand] = {}
@@ -1930,29 +1784,21 @@ class RegisterEvaluator:
         
         (start_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            start_operand, 
-            'int'
+            start_operand
         )
         if start_value == None: 
             null_registers[dst_operand] = {}
             return (next_reg_values, condition_flags, null_registers)
         (and_value, carry) = self.get_src_reg_value(
             next_reg_values, 
-            and_operand, 
-            'int',
+            and_operand,
             condition_flags['c']
         )
         if and_value == None:
             null_registers[dst_operand] = {}
             return (next_reg_values, condition_flags, null_registers)
         
-        np_dtype = utils.get_numpy_type([start_value, and_value])
-        result = np.bitwise_and(
-            start_value.astype(np_dtype),
-            and_value.astype(np_dtype),
-            dtype=np_dtype,
-            casting='safe'
-        )
+        result = start_value & and_value
 
         next_reg_values = self.store_register_bytes(
             next_reg_values,
@@ -1992,7 +1838,7 @@ class RegisterEvaluator:
         if tainted == True: 
             condition_flags = self.initialise_condition_flags()
 
-        (src_value, carry) = self.get_src_reg_value(next_reg_values, src_operand, 'int')
+        (src_value, carry) = self.get_src_reg_value(next_reg_values, src_operand)
         if src_value == None: 
             null_registers[dst_operand] = {}
             return (next_reg_values, condition_flags, null_registers)
@@ -2032,28 +1878,16 @@ class RegisterEvaluator:
         
         (src_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            operands[0], 
-            'int'
+            operands[0]
         )
         if src_value == None: 
             null_registers[dst_operand] = {}
             return (next_reg_values, null_registers)
         
-        (lsb, _) = self.get_src_reg_value(next_reg_values, operands[1], 'int')
-        (width, _) = self.get_src_reg_value(next_reg_values, operands[2], 'int')
-        bit_length = utils.get_bit_length(src_value)
-        bits = utils.get_binary_representation(src_value, bit_length)
-        end_idx = bit_length - lsb -1
-        start_idx = bit_length - lsb - width
-        
-        new_bits = ''
-        for i in range(bit_length):
-            if i in range(start_idx, (end_idx+1)):
-                new_bits += '0'
-            else:
-                new_bits += bits[i]
-
-        new_value = utils.convert_bits_to_type(new_bits, type(src_value))
+        (lsb, _) = self.get_src_reg_value(next_reg_values, operands[1])
+        (width, _) = self.get_src_reg_value(next_reg_values, operands[2])
+        clear_mask = ((1 << width) - 1) << lsb
+        new_value = src_value & ~clear_mask & 0xFFFFFFFF
         next_reg_values = self.store_register_bytes(
             next_reg_values,
             dst_operand,
@@ -2081,8 +1915,7 @@ class RegisterEvaluator:
         
         (original_value, _) = self.get_src_reg_value(
             next_reg_values,
-            operands[0],
-            'int'
+            operands[0]
         )
         if original_value == None: 
             null_registers[dst_operand] = {}
@@ -2090,33 +1923,18 @@ class RegisterEvaluator:
         
         (src_value, _) = self.get_src_reg_value(
             next_reg_values,
-            operands[1],
-            'int'
+            operands[1]
         )
         if src_value == None: 
             null_registers[dst_operand] = {}
             return (next_reg_values, null_registers)
         
-        (lsb, _) = self.get_src_reg_value(next_reg_values, operands[2], 'int')
-        (width, _) = self.get_src_reg_value(next_reg_values, operands[3], 'int')
-        bit_length = utils.get_bit_length(src_value)
-        original_bits = utils.get_binary_representation(original_value, bit_length)
-        src_bits = utils.get_binary_representation(src_value, bit_length)
-        
-        insert_bits = src_bits[(-1*width):]
-        end_idx = bit_length - lsb -1
-        start_idx = bit_length - lsb - width
-        
-        new_bits = ''
-        insert_ctr = 0
-        for i in range(bit_length):
-            if i in range(start_idx, (end_idx+1)):
-                new_bits += insert_bits[insert_ctr]
-                insert_ctr += 1
-            else:
-                new_bits += original_bits[i]
-
-        new_value = utils.convert_bits_to_type(new_bits, type(original_value))
+        (lsb, _) = self.get_src_reg_value(next_reg_values, operands[2])
+        (width, _) = self.get_src_reg_value(next_reg_values, operands[3])
+        insert_mask = ((1 << width) - 1) << lsb
+        new_value = (original_value & ~insert_mask) \
+            | ((src_value << lsb) & insert_mask)
+        new_value = new_value & 0xFFFFFFFF
         next_reg_values = self.store_register_bytes(
             next_reg_values,
             dst_operand,
@@ -2151,34 +1969,21 @@ class RegisterEvaluator:
         
         (start_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            start_operand, 
-            'int'
+            start_operand
         )
         if start_value == None: 
             null_registers[dst_operand] = {}
             return (next_reg_values, condition_flags, null_registers)
         (not_value, carry) = self.get_src_reg_value(
             next_reg_values, 
-            not_operand, 
-            'int',
+            not_operand,
             condition_flags['c']
         )
         if not_value == None: 
             null_registers[dst_operand] = {}
             return (next_reg_values, condition_flags, null_registers)
 
-        np_dtype = utils.get_numpy_type([start_value, not_value])
-        inverted_not_value = np.bitwise_not(
-            not_value.astype(np_dtype),
-            dtype=np_dtype,
-            casting='safe'
-        )
-        result = np.bitwise_and(
-            start_value.astype(np_dtype),
-            inverted_not_value.astype(np_dtype),
-            dtype=np_dtype,
-            casting='safe'
-        )
+        result = start_value & ~not_value & 0xFFFFFFFF
             
         next_reg_values = self.store_register_bytes(
             next_reg_values,
@@ -2215,24 +2020,13 @@ class RegisterEvaluator:
         
         (src_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            src_operand, 
-            'hex'
+            src_operand
         )
         if src_value == None: 
             null_registers[dst_operand] = {}
             return (next_reg_values, null_registers)
         
-        num_bits = int(len(src_value) * 2)
-        result_in_bits = utils.get_binary_representation(src_value, num_bits)
-        
-        num_leading_zeros = 0
-        for i in range(num_bits):
-            if result_in_bits[i] == '0':
-                num_leading_zeros += 1
-            else:
-                break
-        result = utils.convert_type(num_leading_zeros, 'hex')
-        result = result.zfill(8)
+        result = 32 - src_value.bit_length()
         next_reg_values = self.store_register_bytes(
             next_reg_values,
             dst_operand,
@@ -2248,16 +2042,14 @@ class RegisterEvaluator:
         
         (operand1, _) = self.get_src_reg_value(
             register_object, 
-            operands[0], 
-            'int'
+            operands[0]
         )
         if operand1 == None: 
             condition_flags = self.initialise_condition_flags()
             return (condition_flags, null_registers)
         (operand2, carry) = self.get_src_reg_value(
             register_object, 
-            operands[1], 
-            'int',
+            operands[1],
             condition_flags['c']
         )
         if operand2 == None: 
@@ -2283,21 +2075,9 @@ class RegisterEvaluator:
             (result, carry, overflow) = \
                 binops.add_with_carry(operand1, operand2, 1, sub=True)
         elif opcode_id == ARM_INS_TST:
-            np_dtype = utils.get_numpy_type([operand1, operand2])
-            result = np.bitwise_and(
-                operand1.astype(np_dtype),
-                operand2.astype(np_dtype),
-                dtype=np_dtype,
-                casting='safe'
-            )
+            result = operand1 & operand2
         elif opcode_id == ARM_INS_TEQ:
-            np_dtype = utils.get_numpy_type([operand1, operand2])
-            result = np.bitwise_xor(
-                operand1.astype(np_dtype),
-                operand2.astype(np_dtype),
-                dtype=np_dtype,
-                casting='safe'
-            )
+            result = operand1 ^ operand2
         # Update flags.
         condition_flags = self.update_condition_flags(
             condition_flags,
@@ -2334,29 +2114,21 @@ class RegisterEvaluator:
         
         (start_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            start_operand, 
-            'int'
+            start_operand
         )
         if start_value == None: 
             null_registers[dst_operand] = {}
             return (next_reg_values, condition_flags, null_registers)
         (orr_value, carry) = self.get_src_reg_value(
             next_reg_values, 
-            orr_operand, 
-            'int',
+            orr_operand,
             condition_flags['c']
         )
         if orr_value == None: 
             null_registers[dst_operand] = {}
             return (next_reg_values, condition_flags, null_registers)
         
-        np_dtype = utils.get_numpy_type([start_value, orr_value])
-        result = np.bitwise_xor(
-            start_value.astype(np_dtype),
-            orr_value.astype(np_dtype),
-            dtype=np_dtype,
-            casting='safe'
-        )  
+        result = start_value ^ orr_value
 
         next_reg_values = self.store_register_bytes(
             next_reg_values,
@@ -2381,18 +2153,20 @@ class RegisterEvaluator:
                 if ((address_type != consts.ADDRESS_FIRMWARE) 
                         and (address_type != consts.ADDRESS_DATA) 
                         and (address_type != consts.ADDRESS_RAM)):
+                    if utils.is_log_enabled(logging.DEBUG):
+                        logging.debug(
+                            'LDR source is unavailable. Register '
+                            + str(dst_operand)
+                            + ' marked as null.'
+                        )
+                    null_registers[dst_operand] = {}
+            elif common_objs.null_value_handling == consts.NULL_HANDLING_STRICT:
+                if utils.is_log_enabled(logging.DEBUG):
                     logging.debug(
                         'LDR source is unavailable. Register '
                         + str(dst_operand)
                         + ' marked as null.'
                     )
-                    null_registers[dst_operand] = {}
-            elif common_objs.null_value_handling == consts.NULL_HANDLING_STRICT:
-                logging.debug(
-                    'LDR source is unavailable. Register '
-                    + str(dst_operand)
-                    + ' marked as null.'
-                )
                 null_registers[dst_operand] = {}
         return null_registers
                 
@@ -2403,7 +2177,7 @@ class RegisterEvaluator:
         operands = instruction.operands
         
         src_register = operands[0]
-        (address, _) = self.get_src_reg_value(next_reg_values, src_register, 'int')
+        (address, _) = self.get_src_reg_value(next_reg_values, src_register)
         if address == None: 
             return (next_reg_values, memory_map, null_registers)
         
@@ -2422,9 +2196,7 @@ class RegisterEvaluator:
                 null_value,
                 address
             )
-        
-            if reg_value != None:
-                if reg_value.strip() == '': reg_value = None
+
             next_reg_values = self.store_register_bytes(
                 next_reg_values,
                 dst_operand,
@@ -2437,7 +2209,8 @@ class RegisterEvaluator:
                 if pc_target != None:
                     if pc_target % 2 == 1:
                         pc_target = pc_target - 1
-                logging.debug('PC branch to ' + hex(pc_target))
+                if utils.is_log_enabled(logging.DEBUG):
+                    logging.debug('PC branch to ' + hex(pc_target))
                 trace_obj = self.get_return_trace_obj(
                     trace_obj,
                     pc_target
@@ -2495,11 +2268,12 @@ class RegisterEvaluator:
 
         # If dst_operand is PC, then it causes branch.
         if dst_operand == ARM_REG_PC:
-            pc_target = self.get_register_bytes(next_reg_values, dst_operand, 'int')
+            pc_target = self.get_register_bytes(next_reg_values, dst_operand)
             if pc_target != None:
                 if pc_target % 2 == 1:
                     pc_target = pc_target -1
-            logging.debug('PC branch to ' + hex(pc_target))
+            if utils.is_log_enabled(logging.DEBUG):
+                logging.debug('PC branch to ' + hex(pc_target))
             trace_obj = self.get_return_trace_obj(
                 trace_obj,
                 pc_target
@@ -2517,9 +2291,10 @@ class RegisterEvaluator:
             )
             return(None, None, null_registers)
             
-        logging.debug(
-            'LDR address: ' + hex(src_memory_address)
-        )
+        if utils.is_log_enabled(logging.DEBUG):
+            logging.debug(
+                'LDR address: ' + hex(src_memory_address)
+            )
         
         num_bytes = 4
         if opcode_id in [ARM_INS_LDRB, ARM_INS_LDRSB, ARM_INS_LDREXB]:
@@ -2533,14 +2308,13 @@ class RegisterEvaluator:
                 + ' and LDR src address '
                 + hex(src_memory_address)
             )
-        num_halfbytes = int(num_bytes*2)
-        
         (src_value, null_value) = self.get_value_from_memory(
             memory_map,
             src_memory_address,
             unprocessed=True
         )
-        logging.debug('Loaded value: ' + str(src_value))
+        if utils.is_log_enabled(logging.DEBUG):
+            logging.debug('Loaded value: ' + str(src_value))
         
         # Hacky method to ensure both branches are
         #  taken if an LDR value is used for comparison, 
@@ -2555,10 +2329,7 @@ class RegisterEvaluator:
             src_memory_address
         )
          
-        # Handle cases where None is returned (this will only happen 
-        #  if dtype is not hex.
-        if src_value != None:
-            if src_value.strip() == '': src_value = None
+        # Handle cases where None is returned.
         if src_value == None:
             logging.warning(
                 'LDR destination not present in memory: '
@@ -2572,19 +2343,16 @@ class RegisterEvaluator:
             return (next_reg_values, memory_map, null_registers)
                     
         # Get the required bytes.
-        src_value = src_value.zfill(8)
-        
-        src_value = src_value[(-1*num_halfbytes):]
+        src_value = src_value & ((1 << (8*num_bytes)) - 1)
 
-        if ((opcode_id == ARM_INS_LDRB) 
-                or (opcode_id == ARM_INS_LDRH)
-                or (opcode_id == ARM_INS_LDREXB) 
-                or (opcode_id == ARM_INS_LDREXH)):
-            src_value = src_value.zfill(8)
-        elif ((opcode_id == ARM_INS_LDRSB) or (opcode_id == ARM_INS_LDRSH)):
-            src_value = binops.sign_extend(src_value)
-        
-        logging.trace('Value to load: ' + str(src_value))
+        if ((opcode_id == ARM_INS_LDRSB) or (opcode_id == ARM_INS_LDRSH)):
+            src_value = binops.sign_extend(
+                src_value,
+                bit_length=(8*num_bytes)
+            )
+        
+        if utils.is_log_enabled(logging.TRACE):
+            logging.trace('Value to load: ' + str(src_value))
         next_reg_values = self.store_register_bytes(
             next_reg_values,
             dst_operand,
@@ -2625,25 +2393,21 @@ class RegisterEvaluator:
             return (next_reg_values, memory_map, null_registers)
             
         #Operand1.
-        logging.debug(
-            'LDR address: ' + hex(src_memory_address)
-        )        
+        if utils.is_log_enabled(logging.DEBUG):
+            logging.debug(
+                'LDR address: ' + hex(src_memory_address)
+            )        
         (src_value1, null_value) = self.get_value_from_memory(
             memory_map,
             src_memory_address,
             unprocessed=True,
             num_bytes=4
         )
-        if src_value1 != None:
-            if src_value1.strip() == '': src_value1 = None
         if src_value1 == None:
             logging.warning(
                 'LDR destination not present in memory: '
                 + hex(src_memory_address)
             )
-        else:
-            # Get the required bytes.
-            src_value1 = src_value1.strip().zfill(8)
             
         null_registers = self.process_null_registers_ldr(
             null_registers,
@@ -2652,7 +2416,8 @@ class RegisterEvaluator:
             src_memory_address
         )
             
-        logging.trace('Value to load: ' + str(src_value1))
+        if utils.is_log_enabled(logging.TRACE):
+            logging.trace('Value to load: ' + str(src_value1))
         next_reg_values = self.store_register_bytes(
             next_reg_values,
             dst_operand1,
@@ -2660,25 +2425,21 @@ class RegisterEvaluator:
         )
         
         # Operand2
-        logging.debug(
-            'LDR address: ' + hex(src_memory_address+4)
-        )  
+        if utils.is_log_enabled(logging.DEBUG):
+            logging.debug(
+                'LDR address: ' + hex(src_memory_address+4)
+            )  
         (src_value2, _) = self.get_value_from_memory(
             memory_map,
             src_memory_address+4,
             unprocessed=True,
             num_bytes=4
         )
-        if src_value2 != None:
-            if src_value2.strip() == '': src_value2 = None
         if src_value2 == None:
             logging.warning(
                 'LDR destination not present in memory: '
                 + hex(src_memory_address+4)
             )
-        else:
-            # Get the required bytes.
-            src_value2 = src_value2.strip().zfill(8)
         
         null_registers = self.process_null_registers_ldr(
             null_registers,
@@ -2687,7 +2448,8 @@ class RegisterEvaluator:
             src_memory_address+4
         )
         
-        logging.trace('Value to load: ' + str(src_value2))
+        if utils.is_log_enabled(logging.TRACE):
+            logging.trace('Value to load: ' + str(src_value2))
         next_reg_values = self.store_register_bytes(
             next_reg_values,
             dst_operand2,
@@ -2720,7 +2482,7 @@ class RegisterEvaluator:
         if tainted == True: 
             condition_flags = self.initialise_condition_flags()
 
-        (src_value, carry) = self.get_src_reg_value(next_reg_values, src_operand, 'int')
+        (src_value, carry) = self.get_src_reg_value(next_reg_values, src_operand)
         if src_value == None: 
             null_registers[dst_operand] = {}
             return (next_reg_values, condition_flags, null_registers)
@@ -2772,7 +2534,7 @@ class RegisterEvaluator:
         if tainted == True: 
             condition_flags = self.initialise_condition_flags()
 
-        (src_value, carry) = self.get_src_reg_value(next_reg_values, src_operand, 'int')
+        (src_value, carry) = self.get_src_reg_value(next_reg_values, src_operand)
         if src_value == None: 
             null_registers[dst_operand] = {}
             return (next_reg_values, condition_flags, null_registers)
@@ -2821,27 +2583,22 @@ class RegisterEvaluator:
         if tainted == True: 
             condition_flags = self.initialise_condition_flags()
         
-        (value1, _) = self.get_src_reg_value(next_reg_values, operand1, 'int')
+        (value1, _) = self.get_src_reg_value(next_reg_values, operand1)
         if value1 == None: 
             null_registers[dst_operand] = {}
             return (next_reg_values, condition_flags, null_registers)
-        (value2, _) = self.get_src_reg_value(next_reg_values, operand2, 'int')
+        (value2, _) = self.get_src_reg_value(next_reg_values, operand2)
         if value2 == None: 
             null_registers[dst_operand] = {}
             return (next_reg_values, condition_flags, null_registers)
-        (accumulate, _) = self.get_src_reg_value(next_reg_values, accumulateop, 'int')
+        (accumulate, _) = self.get_src_reg_value(next_reg_values, accumulateop)
         if accumulate == None: 
             null_registers[dst_operand] = {}
             return (next_reg_values, condition_flags, null_registers)
 
-        value1 = getattr(value1, "tolist", lambda: value1)()
-        value2 = getattr(value2, "tolist", lambda: value2)()
-        accumulate = getattr(accumulate, "tolist", lambda: accumulate)()
         mul_value = value1 * value2
         mul_value = mul_value + accumulate
-        mul_value = '{0:08x}'.format(mul_value)
-        mul_value = mul_value.zfill(8)
-        result = mul_value[-8:]
+        result = mul_value & 0xFFFFFFFF
 
         next_reg_values = self.store_register_bytes(
             next_reg_values,
@@ -2877,31 +2634,22 @@ class RegisterEvaluator:
         if tainted == True: 
             condition_flags = self.initialise_condition_flags()
         
-        (value1, _) = self.get_src_reg_value(next_reg_values, operand1, 'int')
+        (value1, _) = self.get_src_reg_value(next_reg_values, operand1)
         if value1 == None: 
             null_registers[dst_operand] = {}
             return (next_reg_values, condition_flags, null_registers)
-        (value2, _) = self.get_src_reg_value(next_reg_values, operand2, 'int')
+        (value2, _) = self.get_src_reg_value(next_reg_values, operand2)
         if value2 == None: 
             null_registers[dst_operand] = {}
             return (next_reg_values, condition_flags, null_registers)
-        (accumulate, _) = self.get_src_reg_value(next_reg_values, accumulateop, 'int')
+        (accumulate, _) = self.get_src_reg_value(next_reg_values, accumulateop)
         if accumulate == None: 
             null_registers[dst_operand] = {}
             return (next_reg_values, condition_flags, null_registers)
 
-        value1 = getattr(value1, "tolist", lambda: value1)()
-        value2 = getattr(value2, "tolist", lambda: value2)()
-        accumulate = getattr(accumulate, "tolist", lambda: accumulate)()
         mul_value = value1 * value2
         mul_value = accumulate - mul_value 
-        if abs(mul_value) > 2147483647:
-            mul_value = np.uint32(mul_value)
-        else:
-            mul_value = np.int32(mul_value)
-        mul_value = '{0:08x}'.format(mul_value)
-        mul_value = mul_value.zfill(8)
-        result = mul_value[-8:]
+        result = mul_value & 0xFFFFFFFF
 
         next_reg_values = self.store_register_bytes(
             next_reg_values,
@@ -2974,21 +2722,17 @@ class RegisterEvaluator:
         if tainted == True: 
             condition_flags = self.initialise_condition_flags()
         
-        (value1, _) = self.get_src_reg_value(next_reg_values, operand1, 'int')
+        (value1, _) = self.get_src_reg_value(next_reg_values, operand1)
         if value1 == None: 
             null_registers[dst_operand] = {}
             return (next_reg_values, condition_flags, null_registers)
-        (value2, _) = self.get_src_reg_value(next_reg_values, operand2, 'int')
+        (value2, _) = self.get_src_reg_value(next_reg_values, operand2)
         if value2 == None: 
             null_registers[dst_operand] = {}
             return (next_reg_values, condition_flags, null_registers)
 
-        value1 = getattr(value1, "tolist", lambda: value1)()
-        value2 = getattr(value2, "tolist", lambda: value2)()
         mul_value = value1 * value2
-        mul_value = '{0:08x}'.format(mul_value)
-        mul_value = mul_value.zfill(8)
-        result = mul_value[-8:]
+        result = mul_value & 0xFFFFFFFF
 
         next_reg_values = self.store_register_bytes(
             next_reg_values,
@@ -3024,21 +2768,14 @@ class RegisterEvaluator:
         
         (src_value, carry) = self.get_src_reg_value(
             next_reg_values, 
-            operands[1], 
-            'int',
+            operands[1],
             condition_flags['c']
         )
         if src_value == None: 
             null_registers[dst_operand] = {}
             return (next_reg_values, condition_flags, null_registers)
         
-        bit_length = utils.get_bit_length(src_value)
-        mult = 0xFFFFFFFF
-        if bit_length == 8:
-            mult = 0xFF
-        elif bit_length == 16:
-            mult = 0xFFFF
-        result = (~src_value & mult)
+        result = (~src_value & 0xFFFFFFFF)
         
         next_reg_values = self.store_register_bytes(
             next_reg_values,
@@ -3080,34 +2817,21 @@ class RegisterEvaluator:
         
         (start_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            start_operand, 
-            'int'
+            start_operand
         )
         if start_value == None: 
             null_registers[dst_operand] = {}
             return (next_reg_values, condition_flags, null_registers)
         (orr_value, carry) = self.get_src_reg_value(
             next_reg_values, 
-            orr_operand, 
-            'int',
+            orr_operand,
             condition_flags['c']
         )
         if orr_value == None: 
             null_registers[dst_operand] = {}
             return (next_reg_values, condition_flags, null_registers)
         
-        np_dtype = utils.get_numpy_type([start_value, orr_value])
-        orr_value = np.bitwise_not(
-            orr_value.astype(np_dtype),
-            dtype=np_dtype,
-            casting='safe'
-        )
-        result = np.bitwise_or(
-            start_value.astype(np_dtype),
-            orr_value.astype(np_dtype),
-            dtype=np_dtype,
-            casting='safe'
-        )  
+        result = start_value | (~orr_value & 0xFFFFFFFF)
 
         next_reg_values = self.store_register_bytes(
             next_reg_values,
@@ -3149,29 +2873,21 @@ class RegisterEvaluator:
         
         (start_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            start_operand, 
-            'int'
+            start_operand
         )
         if start_value == None: 
             null_registers[dst_operand] = {}
             return (next_reg_values, condition_flags, null_registers)
         (orr_value, carry) = self.get_src_reg_value(
             next_reg_values, 
-            orr_operand, 
-            'int',
+            orr_operand,
             condition_flags['c']
         )
         if orr_value == None: 
             null_registers[dst_operand] = {}
             return (next_reg_values, condition_flags, null_registers)
         
-        np_dtype = utils.get_numpy_type([start_value, orr_value])
-        result = np.bitwise_or(
-            start_value.astype(np_dtype),
-            orr_value.astype(np_dtype),
-            dtype=np_dtype,
-            casting='safe'
-        )  
+        result = start_value | orr_value
 
         next_reg_values = self.store_register_bytes(
             next_reg_values,
@@ -3192,7 +2908,7 @@ class RegisterEvaluator:
         next_reg_values = current_reg_values
         operands = instruction.operands
 
-        current_sp = self.get_register_bytes(next_reg_values, ARM_REG_SP, 'int')
+        current_sp = self.get_register_bytes(next_reg_values, ARM_REG_SP)
         address = current_sp
         new_sp = current_sp + (4*len(operands))
         next_reg_values = self.store_register_bytes(
@@ -3210,17 +2926,15 @@ class RegisterEvaluator:
             )
             memory_map.pop(address, None)
             address += 4
-            
-        # Sort the stack.
-        memory_map = {key:memory_map[key] for key in sorted(memory_map.keys())}
 
         last_register = operands[-1].value.reg
         if last_register == ARM_REG_PC:
-            pc_target = self.get_register_bytes(next_reg_values, last_register, 'int')
+            pc_target = self.get_register_bytes(next_reg_values, last_register)
             if pc_target != None:
                 if pc_target % 2 == 1:
                     pc_target = pc_target - 1
-            logging.debug('Returning to ' + str(pc_target) + ' (POP PC)')
+            if utils.is_log_enabled(logging.DEBUG):
+                logging.debug('Returning to ' + str(pc_target) + ' (POP PC)')
             # Since POP is essentially returning, we needn't do a branch check?
             # We need to get a revised trace_obj.
             trace_obj = self.get_return_trace_obj(
@@ -3245,7 +2959,7 @@ class RegisterEvaluator:
         next_reg_values = current_reg_values
         operands = instruction.operands
         
-        current_sp = self.get_register_bytes(next_reg_values, ARM_REG_SP, 'int')
+        current_sp = self.get_register_bytes(next_reg_values, ARM_REG_SP)
         address = current_sp - (4*len(operands))
         
         for operand in operands:
@@ -3264,10 +2978,6 @@ class RegisterEvaluator:
             ARM_REG_SP,
             new_sp
         )
-        
-        # Sort the stack.
-        memory_map = {key:memory_map[key] for key in sorted(memory_map.keys())}
-
         return (next_reg_values, memory_map, null_registers)
         
     def process_rbit(self, ins_address, instruction, current_reg_values,
@@ -3294,10 +3004,9 @@ class RegisterEvaluator:
             return (next_reg_values, null_registers)
         
         # reversed_bits.
-        src_bits = utils.get_binary_representation(src_value, 32)
+        src_bits = '{0:032b}'.format(src_value)
         reversed_bits = src_bits[::-1]
-            
-        reversed_bytes = utils.convert_bits_to_type(reversed_bits, 'hex')
+        reversed_bytes = int(reversed_bits, 2)
         
         next_reg_values = self.store_register_bytes(
             next_reg_values,
@@ -3324,22 +3033,16 @@ class RegisterEvaluator:
         if tainted == True: 
             condition_flags = self.initialise_condition_flags()
         
-        (src_value, _) = self.get_src_reg_value(next_reg_values, operands[1], 'hex')
+        (src_value, _) = self.get_src_reg_value(next_reg_values, operands[1])
         if src_value == None: 
             null_registers[dst_operand] = {}
             return (next_reg_values, null_registers)
         
         # reversed_bits.
-        if len(src_value) != 8:
-            logging.error(
-                'Reverse operand is not the correct length'
-            )
-            src_value = src_value.zfill(8)
-            
-        reversed_bytes = src_value[6:8] \
-                         + src_value[4:6] \
-                         + src_value[2:4] \
-                         + src_value[0:2]
+        reversed_bytes = int.from_bytes(
+            src_value.to_bytes(4, byteorder='little'),
+            byteorder='big'
+        )
         
         next_reg_values = self.store_register_bytes(
             next_reg_values,
@@ -3366,22 +3069,14 @@ class RegisterEvaluator:
         if tainted == True: 
             condition_flags = self.initialise_condition_flags()
         
-        (src_value, _) = self.get_src_reg_value(next_reg_values, operands[1], 'hex')
+        (src_value, _) = self.get_src_reg_value(next_reg_values, operands[1])
         if src_value == None: 
             null_registers[dst_operand] = {}
             return (next_reg_values, null_registers)
         
         # reversed_bits.
-        if len(src_value) != 8:
-            logging.error(
-                'Reverse operand is not the correct length'
-            )
-            src_value = src_value.zfill(8)
-            
-        reversed_bytes = src_value[2:4] \
-                         + src_value[0:2] \
-                         + src_value[6:8] \
-                         + src_value[4:6] 
+        reversed_bytes = ((src_value & 0x00FF00FF) << 8) \
+                         | ((src_value >> 8) & 0x00FF00FF)
         
         next_reg_values = self.store_register_bytes(
             next_reg_values,
@@ -3415,7 +3110,7 @@ class RegisterEvaluator:
         if tainted == True: 
             condition_flags = self.initialise_condition_flags()
 
-        (src_value, carry) = self.get_src_reg_value(next_reg_values, src_operand, 'int')
+        (src_value, carry) = self.get_src_reg_value(next_reg_values, src_operand)
         if src_value == None: 
             null_registers[dst_operand] = {}
             return (next_reg_values, condition_flags, null_registers)
@@ -3462,8 +3157,7 @@ class RegisterEvaluator:
         
         (src_value, carry) = self.get_src_reg_value(
             next_reg_values, 
-            operands[1], 
-            'int'
+            operands[1]
         )
         if src_value == None: 
             null_registers[dst_operand] = {}
@@ -3514,16 +3208,14 @@ class RegisterEvaluator:
         
         (start_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            start_operand, 
-            'int'
+            start_operand
         )
         if start_value == None: 
             null_registers[dst_operand] = {}
             return (next_reg_values, condition_flags, null_registers)
         (add_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            add_operand, 
-            'int',
+            add_operand,
             condition_flags['c']
         )
         if add_value == None: 
@@ -3574,16 +3266,14 @@ class RegisterEvaluator:
         
         (start_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            start_operand, 
-            'int'
+            start_operand
         )
         if start_value == None: 
             null_registers[dst_operand] = {}
             return (next_reg_values, condition_flags, null_registers)
         (add_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            add_operand, 
-            'int',
+            add_operand,
             condition_flags['c']
         )
         if add_value == None: 
@@ -3636,26 +3326,15 @@ class RegisterEvaluator:
             null_registers[dst_operand] = {}
             return (next_reg_values, null_registers)
         
-        (lsb, _) = self.get_src_reg_value(next_reg_values, operands[2], 'int')
-        (width, _) = self.get_src_reg_value(next_reg_values, operands[3], 'int')
-        src_bits = utils.get_binary_representation(src_value, 32)
-        msb = lsb + width - 1
-        new_bits = src_bits[msb:lsb]
-        top_bit = new_bits[0]
-        if msb <= 31:
-            extended_bits = ''
-            for i in range(32):
-                extended_bits += top_bit
-            extended_bits += new_bits
-            new_bits = extended_bits[-32:]
-            
-        new_value = utils.convert_bits_to_type(new_bits, 'hex')
+        (lsb, _) = self.get_src_reg_value(next_reg_values, operands[2])
+        (width, _) = self.get_src_reg_value(next_reg_values, operands[3])
+        field_value = (src_value >> lsb) & ((1 << width) - 1)
+        new_value = binops.sign_extend(field_value, bit_length=width)
         
         next_reg_values = self.store_register_bytes(
             next_reg_values,
             dst_operand,
-            new_value,
-            True
+            new_value
         )
         return (next_reg_values, null_registers)
         
@@ -3687,8 +3366,7 @@ class RegisterEvaluator:
             
         (numerator, _) = self.get_src_reg_value(
             next_reg_values, 
-            numerator_operand, 
-            'int',
+            numerator_operand,
             signed=True
         )
         if numerator == None: 
@@ -3696,8 +3374,7 @@ class RegisterEvaluator:
             return (next_reg_values, null_registers)
         (denominator, _) = self.get_src_reg_value(
             next_reg_values, 
-            denominator_operand, 
-            'int',
+            denominator_operand,
             signed=True
         )
         if denominator == None: 
@@ -3707,17 +3384,12 @@ class RegisterEvaluator:
             value = 0
         else:
             value = numerator//denominator
-        if abs(value) > 2147483647:
-            value = np.uint32(value)
-        else:
-            value = np.int32(value)
-        value = '{0:08x}'.format(value)
+        value = value & 0xFFFFFFFF
         
         next_reg_values = self.store_register_bytes(
             next_reg_values,
             dst_operand,
-            value,
-            True
+            value
         )
         return (next_reg_values, null_registers)
         
@@ -3727,7 +3399,7 @@ class RegisterEvaluator:
         operands = instruction.operands
 
         dst_register = operands[0]
-        (address, _) = self.get_src_reg_value(next_reg_values, dst_register, 'int')
+        (address, _) = self.get_src_reg_value(next_reg_values, dst_register)
         if address == None: 
             return (next_reg_values, memory_map, null_registers)
         
@@ -3755,18 +3427,19 @@ class RegisterEvaluator:
         opcode_id = instruction.id
         operands = instruction.operands
 
-        (src_value, _) = self.get_src_reg_value(next_reg_values, operands[0], 'hex')
+        (src_value, _) = self.get_src_reg_value(next_reg_values, operands[0])
         if src_value == None: 
             return (next_reg_values, memory_map, null_registers)
         
         num_bytes = 4
         if opcode_id in [ARM_INS_STRB, ARM_INS_STREXB]:
-            src_value = src_value[-2:]
+            src_value = src_value & 0xFF
             num_bytes = 1
         elif opcode_id in [ARM_INS_STRH, ARM_INS_STREXH]:
-            src_value = src_value[-4:]
+            src_value = src_value & 0xFFFF
             num_bytes = 2
-        logging.trace('Value to store: ' + str(src_value))
+        if utils.is_log_enabled(logging.TRACE):
+            logging.trace('Value to store: ' + str(src_value))
 
         post_index_reg = None
         if len(operands) == 3:
@@ -3792,7 +3465,7 @@ class RegisterEvaluator:
         if opcode_id in [ARM_INS_STREX, ARM_INS_STREXB, ARM_INS_STREXH]:
             # We assume the executing processor always has exclusive access 
             #  to the memory addressed.
-            new_reg_value = '00000000'
+            new_reg_value = 0
             next_reg_values = self.store_register_bytes(
                 next_reg_values,
                 operands[0].value.reg,
@@ -3807,17 +3480,18 @@ class RegisterEvaluator:
         opcode_id = instruction.id
         operands = instruction.operands
 
-        (src_value1, _) = self.get_src_reg_value(next_reg_values, operands[0], 'hex')
-        (src_value2, _) = self.get_src_reg_value(next_reg_values, operands[1], 'hex')
+        (src_value1, _) = self.get_src_reg_value(next_reg_values, operands[0])
+        (src_value2, _) = self.get_src_reg_value(next_reg_values, operands[1])
         if ((src_value1 == None) and (src_value2 == None)):
             return (next_reg_values, memory_map, null_registers)
             
-        logging.trace(
-            'Values to store: ' 
-            + str(src_value1) 
-            + ' and ' 
-            + str(src_value2)
-        )
+        if utils.is_log_enabled(logging.TRACE):
+            logging.trace(
+                'Values to store: ' 
+                + str(src_value1) 
+                + ' and ' 
+                + str(src_value2)
+            )
 
         post_index_reg = None
         if len(operands) == 4:
@@ -3877,16 +3551,14 @@ class RegisterEvaluator:
         
         (start_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            start_operand, 
-            'int'
+            start_operand
         )
         if start_value == None: 
             null_registers[dst_operand] = {}
             return (next_reg_values, condition_flags, null_registers)
         (add_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            add_operand, 
-            'int',
+            add_operand,
             condition_flags['c']
         )
         if add_value == None: 
@@ -3933,23 +3605,21 @@ class RegisterEvaluator:
         
         (src_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            src_operand, 
-            'hex'
+            src_operand
         )
         if src_value == None: 
             null_registers[dst_operand] = {}
             return (next_reg_values, null_registers)
         
         # This is to make sure we get the correct bytes.
-        src_value = src_value.zfill(8)
-
+        bit_length = 32
         if opcode_id == ARM_INS_SXTB:
-            src_value = src_value[-2:]
+            bit_length = 8
         elif opcode_id == ARM_INS_SXTH:
-            src_value = src_value[-4:]
+            bit_length = 16
         
         # This is the actual extension.
-        extended_value = binops.sign_extend(src_value)
+        extended_value = binops.sign_extend(src_value, bit_length=bit_length)
         
         next_reg_values = self.store_register_bytes(
             next_reg_values,
@@ -3985,21 +3655,14 @@ class RegisterEvaluator:
             null_registers[dst_operand] = {}
             return (next_reg_values, null_registers)
         
-        (lsb, _) = self.get_src_reg_value(next_reg_values, operands[2], 'int')
-        (width, _) = self.get_src_reg_value(next_reg_values, operands[3], 'int')
-        src_bits = utils.get_binary_representation(src_value, 32)
-        msb = lsb + width - 1
-        new_bits = src_bits[msb:lsb]
-        if msb <= 31:
-            new_bits = new_bits.zfill(32)
-            
-        new_value = utils.convert_bits_to_type(new_bits, 'hex')
+        (lsb, _) = self.get_src_reg_value(next_reg_values, operands[2])
+        (width, _) = self.get_src_reg_value(next_reg_values, operands[3])
+        new_value = (src_value >> lsb) & ((1 << width) - 1)
         
         next_reg_values = self.store_register_bytes(
             next_reg_values,
             dst_operand,
-            new_value,
-            True
+            new_value
         )
         return (next_reg_values, null_registers)
             
@@ -4031,16 +3694,14 @@ class RegisterEvaluator:
             
         (numerator, _) = self.get_src_reg_value(
             next_reg_values, 
-            numerator_operand, 
-            'int'
+            numerator_operand
         )
         if numerator == None: 
             null_registers[dst_operand] = {}
             return (next_reg_values, null_registers)
         (denominator, _) = self.get_src_reg_value(
             next_reg_values, 
-            denominator_operand, 
-            'int'
+            denominator_operand
         )
         if denominator == None: 
             null_registers[dst_operand] = {}
@@ -4053,8 +3714,7 @@ class RegisterEvaluator:
         next_reg_values = self.store_register_bytes(
             next_reg_values,
             dst_operand,
-            value,
-            True
+            value
         )
         return (next_reg_values, null_registers)
             
@@ -4081,29 +3741,25 @@ class RegisterEvaluator:
         
         (src_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            src_operand, 
-            'hex'
+            src_operand
         )
         if src_value == None: 
             null_registers[dst_operand] = {}
             return (next_reg_values, null_registers)
         
         # This is to make sure we get the correct bytes.
-        src_value = src_value.zfill(8)
-
         if opcode_id == ARM_INS_UXTB:
-            src_value = src_value[-2:]
+            src_value = src_value & 0xFF
         elif opcode_id == ARM_INS_UXTH:
-            src_value = src_value[-4:]
+            src_value = src_value & 0xFFFF
         
         # This is the actual extension.
-        extended_value = src_value.zfill(8)
+        extended_value = src_value
         
         next_reg_values = self.store_register_bytes(
             next_reg_values,
             dst_operand,
-            extended_value,
-            True
+            extended_value
         )
         return (next_reg_values, null_registers)
     
@@ -4111,17 +3767,21 @@ class RegisterEvaluator:
     
     def get_return_trace_obj(self, trace_obj, address):
         prev_address = utils.get_previous_address(self.all_addresses, address)
-        trace_obj_list = self.generate_return_trace_obj(
-            self.master_trace_obj,
-            prev_address,
-            trace_obj,
-            []
-        )
-        if len(trace_obj_list) > 0:
-            trace_obj = trace_obj_list[0]
-            if common_objs.bypass_all_conditional_checks == True:
-                return trace_obj
-                
+        
+        # Trace objects may be copies (from the trace queue), 
+        #  so they are looked up by node id.
+        if ((trace_obj == None) or ('node_id' not in trace_obj)):
+            return trace_obj
+        return_parent = \
+            self.trace_tree_builder.return_parents[trace_obj['node_id']]
+        if ((return_parent == None) or (return_parent[1] != prev_address)):
+            return trace_obj
+        
+        trace_obj = return_parent[0]
+        if common_objs.bypass_all_conditional_checks == True:
+            return trace_obj
+            
+        if utils.is_log_enabled(logging.DEBUG):
             logging.debug(
                 'Re-evaluating endpoints based on reachability '
                 + 'for trace object '
@@ -4129,45 +3789,22 @@ class RegisterEvaluator:
                 + ' and address '
                 + str(prev_address)
             )
-            address_obj = trace_obj['branch_or_end_points'][prev_address]
-            branch_target = list(address_obj['branch_target'].keys())[0]
-            expected_obj = address_obj['branch_target'][branch_target]
-            expected_obj = expected_obj['branch_or_end_points']
-            expected_ids = self.get_endpoint_ids(expected_obj)
-            for expected_id in expected_ids:
-                if expected_id not in self.obtained_endpoints:
-                    if expected_id in self.expected_endpoints:
-                        self.expected_endpoints.remove(expected_id)
-            self.num_expected_endpoints = len(self.expected_endpoints)
+        address_obj = trace_obj['branch_or_end_points'][prev_address]
+        branch_target = list(address_obj['branch_target'].keys())[0]
+        expected_obj = address_obj['branch_target'][branch_target]
+        expected_ids = self.get_endpoint_ids(expected_obj)
+        for expected_id in expected_ids:
+            if expected_id not in self.obtained_endpoints:
+                if expected_id in self.expected_endpoints:
+                    self.expected_endpoints.remove(expected_id)
+        self.num_expected_endpoints = len(self.expected_endpoints)
+        if utils.is_log_enabled(logging.DEBUG):
             logging.debug(
                 'Re-evaluated expected endpoints: '
                 + str(self.expected_endpoints)
             )
         return trace_obj
 
-    def generate_return_trace_obj(self, json_tree, branchpoint, trace_obj, output_list):
-        for key in json_tree:
-            if 'branch_or_end_points' not in json_tree[key]:
-                continue
-            next_level = json_tree[key]['branch_or_end_points']
-            if branchpoint in list(next_level.keys()):
-                end_target_obj = next_level[branchpoint]['branch_target']
-                for target in end_target_obj:
-                    if end_target_obj[target] == trace_obj:
-                        new_trace_obj = json_tree[key]
-                        if new_trace_obj not in output_list:
-                            output_list.append(new_trace_obj)
-            else:
-                for next_key in next_level:
-                    b_target_obj = next_level[next_key]['branch_target']
-                    output_list = self.generate_return_trace_obj(
-                        b_target_obj,
-                        branchpoint,
-                        trace_obj,
-                        output_list
-                    )
-        return output_list
-                    
     def get_dst_operand(self, operand):
         # This should never actually happen.
         if operand.type != ARM_OP_REG:
@@ -4176,38 +3813,24 @@ class RegisterEvaluator:
         dst_operand = operand.value.reg
         return dst_operand
         
-    def get_src_reg_value(self, current_reg_values, src_operand, dtype='hex',
-                            carry_in=None, signed=None):
+    def get_src_reg_value(self, current_reg_values, src_operand, 
+                            carry_in=None, signed=False):
         if src_operand.type == ARM_OP_IMM:
-            src_value = src_operand.value.imm
-            if src_value < 0:
-                src_value = '{:08x}'.format(src_value & (2**32-1))
-            else:
-                src_value = np.uint32(src_value)
-                src_value = '{:08x}'.format(src_value & (2**32-1))
+            src_value = src_operand.value.imm & 0xFFFFFFFF
         elif src_operand.type == ARM_OP_REG:
             src_register = src_operand.value.reg
             if current_reg_values[src_register] == None:
                 return (None, None)
             src_value = self.get_register_bytes(
                 current_reg_values,
-                src_register,
-                dtype
+                src_register
             )
-            if src_register == ARM_REG_PC:
-                if type(src_value) is int:
-                    src_value = np.uint32(src_value)
         else:
             logging.critical('Non imm/reg src ' + instruction.op_str)
             return (None, None)
 
-        if carry_in == None:
-            src_value = utils.convert_type(src_value, dtype, signed=signed)        
-            return (src_value, carry_in)
-        
         carry = carry_in
-        if src_operand.shift.value != 0:
-            src_value = utils.convert_type(src_value, 'int', signed=signed)
+        if ((carry_in != None) and (src_operand.shift.value != 0)):
             shift_value = src_operand.shift.value
             shift_type = src_operand.shift.type
             if shift_type == ARM_SFT_ASR:
@@ -4222,9 +3845,9 @@ class RegisterEvaluator:
                 (src_value, carry) = binops.rotate_right_with_extend(
                     src_value, carry_in
                 )
-        else:
-            carry = carry_in
-        src_value = utils.convert_type(src_value, dtype, signed=signed)        
+        if ((signed == True) and (src_value != None)):
+            if src_value & 0x80000000:
+                src_value = src_value - 0x100000000
         return (src_value, carry)
         
     def get_shift_value(self, current_reg_values, shift_operand):
@@ -4236,8 +3859,7 @@ class RegisterEvaluator:
                 return None
             shift_value = self.get_register_bytes(
                 current_reg_values,
-                src_register,
-                'int'
+                src_register
             )
         else:
             logging.critical('Non imm src ' + instruction.op_str)
@@ -4268,8 +3890,7 @@ class RegisterEvaluator:
                 return(src_memory_address, next_reg_values)
             base_value = self.get_register_bytes(
                 current_reg_values,
-                base_register,
-                'int'
+                base_register
             )
         
         # Register offset.
@@ -4284,8 +3905,7 @@ class RegisterEvaluator:
                 
             offset_value = self.get_register_bytes(
                 current_reg_values,
-                index_register,
-                'int'
+                index_register
             )
             (offset_value, _) = binops.logical_shift_left(offset_value, lshift)
         # Immediate offset.
@@ -4301,20 +3921,21 @@ class RegisterEvaluator:
             if post_index_reg != None:
                 (post_index_val, _) = self.get_src_reg_value(
                     next_reg_values,
-                    post_index_reg,
-                    'int'
+                    post_index_reg
                 )
                 register_wback += post_index_val
             if base_register != ARM_REG_PC:
                 next_reg_values = self.store_register_bytes(
                     next_reg_values,
                     base_register,
-                    '{0:08x}'.format(register_wback)
+                    register_wback
                 )
 
         return(src_memory_address, next_reg_values)
        
     def get_pc_value(self, ins_address):
+        if self.all_addresses is common_objs.all_addresses:
+            return common_objs.pc_address_index.get(ins_address)
         pc_address_1 = self.get_next_address(self.all_addresses, ins_address)
         pc_address = self.get_next_address(self.all_addresses, pc_address_1)
         return pc_address
@@ -4359,64 +3980,58 @@ class RegisterEvaluator:
         # Default to RAM.
         return consts.ADDRESS_RAM
     
-    def get_register_bytes(self, registers, address, dtype='hex'):
+    def get_register_bytes(self, registers, address):
         value = None
         if address in registers:
             value = registers[address]
-        else:
-            return value
-            
-        # Type conversion
-        value = utils.convert_type(value, dtype)
         return value
         
     def get_value_from_memory(self, memory_map, address, 
-                                num_bytes=4, dtype='hex', unprocessed=False):
+                                num_bytes=4, unprocessed=False):
         address_type = self.get_address_type(address, memory_map)
         src_value = None
         ret_none = False
         if address_type == consts.ADDRESS_DATA:
-            src_value = self.get_data_bytes(address, num_bytes, dtype)
+            src_value = self.get_data_value(address, num_bytes)
         elif address_type == consts.ADDRESS_FIRMWARE:
-            src_value = utils.get_firmware_bytes(address, num_bytes, dtype)
+            src_value = utils.get_firmware_value(address, num_bytes)
         else:
             src_value = self.get_memory_bytes(
                 memory_map,
                 address,
                 num_bytes,
-                dtype,
                 unprocessed
             )
             
         # If we get unusable values, return all-0s.
         # This is EXTREMELY IMPORTANT! DO NOT MODIFY OR DELETE!
-        if (((src_value == None) 
-                or (src_value == '')) 
-                and (dtype == 'hex')):
+        if src_value == None:
             logging.debug('Returned value is empty or None.')
-            src_value = ''.zfill(num_bytes*2)
+            src_value = 0
             ret_none = True
         return (src_value, ret_none)
         
     def get_data_bytes(self, address, num_bytes=4, dtype='hex',
             endian=common_objs.endian):
-        logging.debug(
-            'Getting ' 
-            + str(num_bytes)
-            + ' bytes from data region '
-            + ' starting at memory address '
-            + hex(address)
-        )
+        if utils.is_log_enabled(logging.DEBUG):
+            logging.debug(
+                'Getting ' 
+                + str(num_bytes)
+                + ' bytes from data region '
+                + ' starting at memory address '
+                + hex(address)
+            )
         offset = address - common_objs.data_segment_start_address
         address_in_firmware = \
             common_objs.data_segment_start_firmware_address + offset
-        logging.debug(
-            'Address '
-            + hex(address)
-            + ' translates to '
-            + hex(address_in_firmware)
-            + ' in firmware.'
-        )
+        if utils.is_log_enabled(logging.DEBUG):
+            logging.debug(
+                'Address '
+                + hex(address)
+                + ' translates to '
+                + hex(address_in_firmware)
+                + ' in firmware.'
+            )
         value = utils.get_firmware_bytes(
                     address_in_firmware, 
                     num_bytes,
@@ -4425,29 +4040,36 @@ class RegisterEvaluator:
         if endian == 'little':
             value = utils.reverse_bytes(utils.convert_type(value, 'bytes'))
             value = utils.convert_type(value, 'hex')
-        logging.debug('Read bytes ' + value)
+        if utils.is_log_enabled(logging.DEBUG):
+            logging.debug('Read bytes ' + value)
         # Type conversion.
         value = utils.convert_type(value, dtype)
         return value
-        
 
-    def get_memory_bytes(self, memory_map, address, num_bytes=4, dtype='hex', 
+    def get_data_value(self, address, num_bytes=4):
+        offset = address - common_objs.data_segment_start_address
+        address_in_firmware = \
+            common_objs.data_segment_start_firmware_address + offset
+        value = utils.get_firmware_value(address_in_firmware, num_bytes)
+        return value
+
+    def get_memory_bytes(self, memory_map, address, num_bytes=4, 
                             unprocessed=False, endian=common_objs.endian):
         # If we want raw values, then use this.
         if unprocessed == True:
             value = self.get_unprocessed_memory_bytes(
                 memory_map,
                 address,
-                num_bytes,
-                dtype
+                num_bytes
             )
             return value
         
-        logging.debug(
-            'Reading ' + str(num_bytes) + ' bytes '
-            + 'from address ' + '{0:08x}'.format(address) 
-            + ' in memory'
-        )
+        if utils.is_log_enabled(logging.DEBUG):
+            logging.debug(
+                'Reading ' + str(num_bytes) + ' bytes '
+                + 'from address ' + '{0:08x}'.format(address) 
+                + ' in memory'
+            )
         # If the values are required by register_evaluator.
         if (num_bytes == 4):
             if (address%4 != 0):
@@ -4459,86 +4081,66 @@ class RegisterEvaluator:
             value = self.get_memory_halfword(memory_map, address, endian)
         elif (num_bytes == 1):
             if address not in memory_map:
-                value = '00'
+                value = 0
             else:
                 value = memory_map[address]
         else:
             logging.error('Invalid number of bytes.')
-        value = utils.convert_type(value, dtype)
         return value
         
     def get_memory_word(self, memory_map, address, endian=common_objs.endian):
-        logging.debug(
-            'Reading word '
-            + 'from address ' + '{0:08x}'.format(address) 
-            + ' in memory'
-        )
-        if endian == None: endian = common_objs.endian
-        out_value = ''
-        for i in range(4):
-            if (address+i) in memory_map:
-                concat_value = memory_map[address+i]
-            else:
-                concat_value = '00'
-            if endian == 'little':
-                out_value = concat_value + out_value
-            else:
-                out_value = out_value + concat_value
-        return out_value
+        if utils.is_log_enabled(logging.DEBUG):
+            logging.debug(
+                'Reading word '
+                + 'from address ' + '{0:08x}'.format(address) 
+                + ' in memory'
+            )
+        return self.get_memory_value(memory_map, address, 4, endian)
         
     def get_memory_halfword(self, memory_map, address, endian=common_objs.endian):
-        logging.debug(
-            'Reading halfword '
-            + 'from address ' + '{0:08x}'.format(address) 
-            + ' in memory'
-        )
+        if utils.is_log_enabled(logging.DEBUG):
+            logging.debug(
+                'Reading halfword '
+                + 'from address ' + '{0:08x}'.format(address) 
+                + ' in memory'
+            )
+        return self.get_memory_value(memory_map, address, 2, endian)
+        
+    def get_memory_value(self, memory_map, address, num_bytes, 
+                            endian=common_objs.endian):
         if endian == None: endian = common_objs.endian
-        out_value = ''
-        for i in range(2):
+        out_value = 0
+        for i in range(num_bytes):
             if (address+i) in memory_map:
-                concat_value = memory_map[address+i]
+                byte_value = memory_map[address+i]
             else:
-                concat_value = '00'
+                byte_value = 0
             if endian == 'little':
-                out_value = concat_value + out_value
+                out_value = out_value | (byte_value << (8*i))
             else:
-                out_value = out_value + concat_value
+                out_value = (out_value << 8) | byte_value
         return out_value
     
-    def get_unprocessed_memory_bytes(self, memory_map, address, 
-                                        num_bytes=4, dtype='hex'):
-        logging.debug(
-            'Reading ' + str(num_bytes) + ' unprocessed bytes '
-            + 'from address ' + '{0:08x}'.format(address) 
-            + ' in memory'
-        )
-        out_value = ''
+    def get_unprocessed_memory_bytes(self, memory_map, address, num_bytes=4):
+        if utils.is_log_enabled(logging.DEBUG):
+            logging.debug(
+                'Reading ' + str(num_bytes) + ' unprocessed bytes '
+                + 'from address ' + '{0:08x}'.format(address) 
+                + ' in memory'
+            )
+        out_value = None
         for i in range(num_bytes):
-            if (address+i) in memory_map:
-                out_value = memory_map[address+i] + out_value
-            else:
+            if (address+i) not in memory_map:
                 break
+            if out_value == None: out_value = 0
+            out_value = out_value | (memory_map[address+i] << (8*i))
         return out_value
-    
-    def available_bytes_at_memory_location(self, memory_map, address, dtype):
-        temp_bytes = 0
-        if address in memory_map:
-            temp_value = memory_map[address]
-            if temp_value != None:
-                if dtype == 'hex':
-                    temp_value = utils.convert_type(temp_value, 'hex')
-                    temp_halfbytes = len(temp_value)
-                    temp_bytes = int(temp_halfbytes/2)
-        return temp_bytes
 
-    def store_register_bytes(self, registers, address, value, force_word_length=False):
+    def store_register_bytes(self, registers, address, value):
         if address not in registers:
             return registers
-        
-        value = utils.convert_type(value, 'hex')
-        if force_word_length == True: 
-            value = value.zfill(8)
-            value = value[-8:]
+        if value != None:
+            value = value & 0xFFFFFFFF
         registers[address] = value
         return registers
         
@@ -4551,49 +4153,35 @@ class RegisterEvaluator:
             )
             return memory_map
 
-        value = utils.convert_type(value, 'hex')
         if value == None:
-            value = '00' * num_bytes
-        value = value.zfill(2*num_bytes)
-
+            value = 0
         for i in range(num_bytes):
-            byte0 = (i*-2) - 1
-            byte1 = (i*-2) - 2
-            concat = value[byte1] + value[byte0]
-            memory_map[address+i] = concat
+            memory_map[address+i] = (value >> (8*i)) & 0xFF
         
-        logging.debug(
-            'Storing data: ' 
-            + str(value) 
-            + ' to memory address: ' 
-            + hex(address)
-        )
+        if utils.is_log_enabled(logging.DEBUG):
+            logging.debug(
+                'Storing data: ' 
+                + hex(value) 
+                + ' to memory address: ' 
+                + hex(address)
+            )
         return memory_map
 
-    def store_memory_bytes(self, memory_map, address, value, 
-                               force_word_length=False):
-        value = utils.convert_type(value, 'hex')
-        if force_word_length == True: value = value.zfill(8)
-        
+    def store_memory_bytes(self, memory_map, address, value, num_bytes=4):
         if value == None:
-            memory_map[address] = '00'
+            memory_map[address] = 0
             return memory_map
             
-        if len(value) % 2 != 0:
-            value = '0' + value
-        num_bytes = int(len(value)/2)
         for i in range(num_bytes):
-            byte0 = (i*-2) - 1
-            byte1 = (i*-2) - 2
-            concat = value[byte1] + value[byte0]
-            memory_map[address+i] = concat
-        
-        logging.debug(
-            'Storing data: ' 
-            + str(value) 
-            + ' to memory address: ' 
-            + hex(address)
-        )                 
+            memory_map[address+i] = (value >> (8*i)) & 0xFF
+        
+        if utils.is_log_enabled(logging.DEBUG):
+            logging.debug(
+                'Storing data: ' 
+                + hex(value) 
+                + ' to memory address: ' 
+                + hex(address)
+            )                 
         return memory_map
 
     def process_memset(self, memory_map, register_object, memset_obj, address):
@@ -4609,8 +4197,6 @@ class RegisterEvaluator:
                 or (length == None)):
             logging.warning('At least one of the 3 parameters is null.')
             return memory_map
-        if type(length) == str:
-            length = int(length, 16)
         if length == 0:
             logging.warning('memset len specified as 0 at ' + hex(address))
             return memory_map
@@ -4619,18 +4205,14 @@ class RegisterEvaluator:
         # We choose the length as the maximum length specified in 
         #  COI definitions.
         if length > 125:
-            logging.debug(
-                'Over-large value for length '
-                + str(length)
-            )
+            if utils.is_log_enabled(logging.DEBUG):
+                logging.debug(
+                    'Over-large value for length '
+                    + str(length)
+                )
             return memory_map
-        value = utils.convert_type(value, 'hex')
-        value = value.zfill(8)
-        if value[0:6] != '000000':
+        if ((value < 0) or (value > 0xFF)):
             return memory_map
-        value = value[-2:]
-        if type(ptr_address) == str:
-            ptr_address = int(ptr_address, 16)
             
         address = ptr_address
         while length > 0:
@@ -4638,31 +4220,32 @@ class RegisterEvaluator:
                 fill_length = length
             else:
                 fill_length = 4
-            mul_value = ''
+            mul_value = 0
             for i in range(fill_length):
-                mul_value += value
+                mul_value = (mul_value << 8) | value
             memory_map = self.store_memory_bytes(
                 memory_map,
                 address,
-                mul_value
+                mul_value,
+                fill_length
             )
             address = address + 4
             length = length - 4
         return memory_map
         
     def process_software_udiv(self, register_object):
-        numerator = utils.convert_type(register_object[ARM_REG_R0], 'int')
-        denominator = utils.convert_type(register_object[ARM_REG_R1], 'int')
+        numerator = register_object[ARM_REG_R0]
+        denominator = register_object[ARM_REG_R1]
         if ((numerator == None) or (denominator == None)):
             return register_object
         if denominator == 0:
-            register_object[ARM_REG_R1] = utils.convert_type(numerator, 'hex')
-            register_object[ARM_REG_R0] = '00000000'
+            register_object[ARM_REG_R1] = numerator
+            register_object[ARM_REG_R0] = 0
             return register_object
         quotient = numerator//denominator
         remainder = numerator%denominator
-        register_object[ARM_REG_R0] = utils.convert_type(quotient, 'hex')
-        register_object[ARM_REG_R1] = utils.convert_type(remainder, 'hex')
+        register_object[ARM_REG_R0] = quotient
+        register_object[ARM_REG_R1] = remainder
         return register_object
         
     # =======================================================================  
@@ -4672,6 +4255,10 @@ class RegisterEvaluator:
         if address_obj == None: return None
         if ins_address == None: return None
         
+        # Use the address index where possible.
+        if address_obj is common_objs.all_addresses:
+            return common_objs.next_address_index.get(ins_address)
+        
         if type(address_obj) is dict:
             address_obj = list(address_obj.keys())
             address_obj.sort()
@@ -4692,7 +4279,9 @@ class RegisterEvaluator:
         for address in memory:
             string_mem += hex(address)
             string_mem += ':'
-            value = utils.convert_type(memory[address], 'hex')
+            value = memory[address]
+            if value != None:
+                value = hex(value)
             string_mem += str(value)
             string_mem += ','
         string_mem += '}'
@@ -4704,43 +4293,71 @@ class RegisterEvaluator:
                                 memory_map, condition_flags, trace_obj, 
                                 current_path, null_registers):
         """Check whether a trace item is to be added to queue."""
-        # Generate pickle file.
         # Generate dictionary. Do not include elements that *will* change
         #  with every new path (i.e., counter and traced path).
-        pickle_object = {
+        # Memory is identified by its page digests, which are only
+        #  recomputed for pages that have changed.
+        state_object = {
             'source': source,
             'start': target,
             'reg': utils.sort_dict_keys(register_object),
-            'ram': utils.sort_dict_keys(memory_map),
+            'ram': memory_map.get_digests(),
             'condition': utils.sort_dict_keys(condition_flags),
             'null': utils.sort_dict_keys(null_registers)
         }
 
-        pickle_bytes = pickle.dumps(pickle_object)
-        m = hashlib.sha256(pickle_bytes)
+        state_bytes = pickle.dumps(state_object)
+        m = hashlib.sha256(state_bytes)
         pickle_name = m.hexdigest()
         
-        # Add the counter and path.
-        pickle_object['counter'] = self.global_counter
-        pickle_object['path'] =  current_path
-        pickle_object['trace'] = trace_obj
-        
-        pickle_file = os.path.join(
-            common_paths.tmp_path,
-            pickle_name + '.pkl'
-        )
-        
         # If we have run the same trace before, with same set of parameters,
         #  then don't re-run.
-        if pickle_file in self.instruction_queue:
+        if pickle_name in self.queued_states:
             return
         
-        # Write pickled representation of data to file.
-        with open(pickle_file, 'wb') as f:
-            pickle.dump(pickle_object, f)
+        # The queued state shares memory pages with the current state,
+        #  so only pages that either of them goes on to modify are copied.
+        # The trace object is never modified, so it is not copied.
+        queued_state = {
+            'start': target,
+            'reg': state_object['reg'],
+            'ram': memory_map.fork(),
+            'condition': state_object['condition'],
+            'trace': trace_obj,
+            'path': current_path,
+            'null': state_object['null'],
+            'counter': self.global_counter
+        }
+        
+        # Keep the state in memory, unless that would take us over the 
+        #  configured limit, in which case spill to file.
+        # Pages already held by queued states aren't counted again.
+        state_size = len(state_bytes)
+        page_sizes = queued_state['ram'].get_page_sizes()
+        for page_id in page_sizes:
+            if page_id not in self.queued_pages:
+                state_size += page_sizes[page_id]
+        max_memory = common_objs.trace_queue_max_memory * 1024 * 1024
+        if ((self.queue_memory_used + state_size) <= max_memory):
+            self.queue_memory_store[pickle_name] = \
+                (queued_state, len(state_bytes))
+            self.queue_memory_used += state_size
+            for page_id in page_sizes:
+                if page_id not in self.queued_pages:
+                    self.queued_pages[page_id] = 0
+                self.queued_pages[page_id] += 1
+        else:
+            pickle_file = os.path.join(
+                common_paths.tmp_path,
+                pickle_name + '.pkl'
+            )
+            # Write pickled representation of data to file.
+            with open(pickle_file, 'wb') as f:
+                pickle.dump(queued_state, f)
             
         # Add to queue.
-        self.instruction_queue.append(pickle_file)
+        self.instruction_queue.append(pickle_name)
+        self.queued_states.add(pickle_name)
         self.global_counter += 1
             
     def queue_handler(self):
@@ -4775,42 +4392,47 @@ class RegisterEvaluator:
     def handle_queue(self):
         """Pop first function object and execute. """            
         # Get the arguments
-        pickle_path = self.instruction_queue.popleft()
-        argument_list = self.get_pickled_arguments(pickle_path)
+        pickle_name = self.instruction_queue.popleft()
+        self.queued_states.discard(pickle_name)
+        argument_list = self.get_queued_arguments(pickle_name)
         
         # Execute the method with the provided arguments.
         self.trace_cois(*argument_list)
         
-    def get_pickled_arguments(self, pickle_path):
-        """Load pickled data from file."""
-        # Get pickled data.
-        with open(pickle_path, 'rb') as f:
-            pickled_data = pickle.load(f)
+    def get_queued_arguments(self, pickle_name):
+        """Load queued state from memory or file."""
+        if pickle_name in self.queue_memory_store:
+            (queued_state, state_size) = \
+                self.queue_memory_store.pop(pickle_name)
+            self.queue_memory_used -= state_size
+            # Release the pages that no other queued state holds.
+            page_sizes = queued_state['ram'].get_page_sizes()
+            for page_id in page_sizes:
+                self.queued_pages[page_id] -= 1
+                if self.queued_pages[page_id] == 0:
+                    del self.queued_pages[page_id]
+                    self.queue_memory_used -= page_sizes[page_id]
+        else:
+            pickle_path = os.path.join(
+                common_paths.tmp_path,
+                pickle_name + '.pkl'
+            )
+            with open(pickle_path, 'rb') as f:
+                queued_state = pickle.load(f)
+            # We no longer need the file. Delete it to save space.
+            os.remove(pickle_path)
         
         # Build the argument list.
         argument_list = []
-        argument_list.append(pickled_data['start'])
-        argument_list.append(pickled_data['reg'])
-        argument_list.append(pickled_data['ram'])
-        argument_list.append(pickled_data['condition'])
-        argument_list.append(pickled_data['trace'])
-        argument_list.append(pickled_data['path'])
-        argument_list.append(pickled_data['null'])
-        argument_list.append(pickled_data['counter'])
-        
-        # We no longer need the file. Delete it to save space.
-        os.remove(pickle_path)
+        argument_list.append(queued_state['start'])
+        argument_list.append(queued_state['reg'])
+        argument_list.append(queued_state['ram'])
+        argument_list.append(queued_state['condition'])
+        argument_list.append(queued_state['trace'])
+        argument_list.append(queued_state['path'])
+        argument_list.append(queued_state['null'])
+        argument_list.append(queued_state['counter'])
         return argument_list
         
-    def get_endpoint_ids(self, dictionary):
-        endpoints = []
-        for k in dictionary:
-            if dictionary[k]['is_end'] == False:
-                for branch in dictionary[k]['branch_target']:
-                    endpoints = endpoints + self.get_endpoint_ids(
-                        dictionary[k]['branch_target'][branch]['branch_or_end_points']
-                    )
-            else:
-                endpoints.append(dictionary[k]['id'])
-        return endpoints
-        
\ No newline at end of file
+    def get_endpoint_ids(self, trace_obj):
+        return self.trace_tree_builder.endpoint_ids[trace_obj['node_id']]
@@ -1,14 +1,13 @@
 import os
 import sys
-import copy
 import json
 import struct
 import timeit
 import pickle
 import logging
 import hashlib
+import functools
 import collections
-import numpy as np
 from capstone import *
 from capstone.arm import *
 from random import getrandbits
@@ -17,6 +16,7 @@ from argxtract.core import consts
 from argxtract.core import binary_operations as binops
 from argxtract.common import paths as common_paths
 from argxtract.common import objects as common_objs
+from argxtract.core.paged_memory import PagedMemory
 
 
 class StrandExecution:
@@ -28,21 +28,29 @@ class StrandExecution:
         self.all_addresses = all_addresses
         self.check_error = True
         self.stop_on_none = False
+        # Instruction handlers, by opcode id.
+        self.instruction_handlers = self.get_instruction_handlers()
         
     def trace_register_values(self, insn_object, start_point, end_points, 
             register_object, memory_map, condition_flags, exec_last=False, 
             check_error=True, stop_on_none=False):
-        logging.debug(  
-            'Starting strand trace at '
-            + hex(start_point)
-            + ' with end points '
-            + str(end_points)
-            + ' and '
-            + str(register_object)
-        )
+        if utils.is_log_enabled(logging.DEBUG):
+            logging.debug(  
+                'Starting strand trace at '
+                + hex(start_point)
+                + ' with end points '
+                + str(end_points)
+                + ' and '
+                + str(register_object)
+            )
         
         self.stop_on_none = stop_on_none
         
+        # Memory is held as copy-on-write pages, so that IT blocks
+        #  needn't copy all of it.
+        if type(memory_map) is dict:
+            memory_map = PagedMemory(memory_map)
+        
         start_time = timeit.default_timer()
         self.check_error = check_error
         
@@ -66,11 +74,12 @@ class StrandExecution:
             # Instructions we needn't process (NOP, etc).
             skip_insn = self.check_skip_instruction(ins_address, insn_object)
             if skip_insn == True:
-                logging.trace(
-                    'Instruction at '
-                    + hex(ins_address)
-                    + ' to be skipped.'
-                )
+                if utils.is_log_enabled(logging.TRACE):
+                    logging.trace(
+                        'Instruction at '
+                        + hex(ins_address)
+                        + ' to be skipped.'
+                    )
                 (ins_address, register_object) = self.update_pc_register(
                     insn_object,
                     ins_address,
@@ -83,10 +92,12 @@ class StrandExecution:
             opcode_id = insn.id
 
             # Debug and trace messages.
-            logging.debug('------------------------------------------')
-            logging.trace('memory: ' + self.print_memory(memory_map))
-            logging.debug('reg: ' + self.print_memory(register_object))
-            logging.debug(hex(ins_address) + '  ' + insn.mnemonic + '  ' + insn.op_str)
+            if utils.is_log_enabled(logging.DEBUG):
+                logging.debug('------------------------------------------')
+                if utils.is_log_enabled(logging.TRACE):
+                    logging.trace('memory: ' + self.print_memory(memory_map))
+                logging.debug('reg: ' + self.print_memory(register_object))
+                logging.debug(hex(ins_address) + '  ' + insn.mnemonic + '  ' + insn.op_str)
 
             # Branches require special processing.
             if opcode_id in [ARM_INS_B, ARM_INS_BX, ARM_INS_BL, ARM_INS_BLX,
@@ -94,14 +105,14 @@ class StrandExecution:
                 # If BL, BLX, get return address and update Link Register.
                 if opcode_id in [ARM_INS_BL, ARM_INS_BLX]:
                     link_return_address = \
-                        self.all_addresses[self.all_addresses.index(ins_address) + 1]
-                    register_object[ARM_REG_LR] = \
-                        '{0:08x}'.format(link_return_address) 
+                        self.get_next_address(self.all_addresses, ins_address)
+                    register_object[ARM_REG_LR] = link_return_address
                     
-                    logging.debug(
-                        'Link return address is '
-                        + '{0:08x}'.format(link_return_address)
-                    )
+                    if utils.is_log_enabled(logging.DEBUG):
+                        logging.debug(
+                            'Link return address is '
+                            + '{0:08x}'.format(link_return_address)
+                        )
                 # We process certain functions differently.
                 if opcode_id == ARM_INS_BL:
                     branch_target = insn_object[ins_address]['insn'].operands[0].value.imm
@@ -208,8 +219,6 @@ class StrandExecution:
         #  within the instruction.
         if should_update_pc_value == False:
             ins_address = register_object[ARM_REG_PC]
-            if type(ins_address) is str:
-                ins_address = int(ins_address, 16)
             return (ins_address, register_object) 
 
         pc_address = self.get_pc_value(ins_address)
@@ -233,19 +242,20 @@ class StrandExecution:
             branch_register = operands[0].value.reg
             branch_target = self.get_register_bytes(
                 next_reg_values,
-                branch_register,
-                'int'
+                branch_register
             )
             
             # Do we need further processing for ARM/Thumb switch?
             if branch_target != None:
-                logging.trace('Branch target is ' + hex(branch_target))
+                if utils.is_log_enabled(logging.TRACE):
+                    logging.trace('Branch target is ' + hex(branch_target))
                 if branch_target % 2 == 1:
                     branch_target = branch_target - 1
-                    logging.trace(
-                        'BX switch. New branch target is ' 
-                        + hex(branch_target)
-                    )
+                    if utils.is_log_enabled(logging.TRACE):
+                        logging.trace(
+                            'BX switch. New branch target is ' 
+                            + hex(branch_target)
+                        )
         elif opcode_id in [ARM_INS_CBZ, ARM_INS_CBNZ]:
             branch_target = operands[1].value.imm
         
@@ -354,8 +364,7 @@ class StrandExecution:
         if ((opcode_id == ARM_INS_CBZ) or (opcode_id == ARM_INS_CBNZ)):
             (reg_value, _) = self.get_src_reg_value(
                 next_reg_values, 
-                operands[0], 
-                'int'
+                operands[0]
             )
             if reg_value == None:
                 is_branch_condition_satisfied = None
@@ -378,10 +387,11 @@ class StrandExecution:
         return is_branch_condition_satisfied
         
     def check_condition_satisfied(self, condition, flags):
-        logging.trace(
-            'Checking whether condition satisfied for flags: '
-            + str(flags)
-        )
+        if utils.is_log_enabled(logging.TRACE):
+            logging.trace(
+                'Checking whether condition satisfied for flags: '
+                + str(flags)
+            )
         # To bypass conditional checks, we simply return None.
         # This forces the conditional branch to execute both paths.
         if common_objs.bypass_all_conditional_checks == True:
@@ -495,12 +505,9 @@ class StrandExecution:
             condition_flags['c'] = carry
         if overflow != None:
             condition_flags['v'] = overflow
-        result_in_bits = utils.get_binary_representation(result, 32)
-        if result_in_bits[0] == '0':
-            condition_flags['n'] = 0
-        else:
-            condition_flags['n'] = 1
-        if '1' in result_in_bits:
+        result = result & 0xFFFFFFFF
+        condition_flags['n'] = (result >> 31) & 1
+        if result != 0:
             condition_flags['z'] = 0
         else:
             condition_flags['z'] = 1
@@ -562,8 +569,7 @@ class StrandExecution:
         # Get the actual value of indexing register.
         actual_value = self.get_register_bytes(
             next_reg_values,
-            comp_register,
-            'int'
+            comp_register
         )
         if actual_value == None:
             branch_address = skip_address
@@ -590,10 +596,11 @@ class StrandExecution:
         if should_branch != True:
             branch_address = skip_address
             
-        logging.debug(
-            'Table branch to ' 
-            + hex(branch_address)
-        )
+        if utils.is_log_enabled(logging.DEBUG):
+            logging.debug(
+                'Table branch to ' 
+                + hex(branch_address)
+            )
         
         return (branch_address, next_reg_values, memory_map, condition_flags)
             
@@ -610,11 +617,10 @@ class StrandExecution:
         # Get all possible addresses.
         for i in range(num_values+1):
             index_address = pc_address + (mul_factor*i)
-            value = utils.get_firmware_bytes(
+            value = utils.get_firmware_value(
                 index_address, 
                 num_bytes=mul_factor
             )
-            value = int(value, 16)
             branch_address = pc_address + (2*value)
             table_branch_addresses.append(branch_address)
         
@@ -647,8 +653,7 @@ class StrandExecution:
                 branch_register = operands[0].value.reg
                 branch_target = self.get_register_bytes(
                     next_reg_values,
-                    branch_register,
-                    'int'
+                    branch_register
                 )
             elif opcode_id in [ARM_INS_CBZ, ARM_INS_CBNZ]:
                 branch_target = operands[1].value.imm
@@ -681,10 +686,11 @@ class StrandExecution:
             execute_else_instructions = True
             
         mnemonic = insn.mnemonic
-        logging.debug(
-            'Processing IT instruction: '
-            + mnemonic
-        )
+        if utils.is_log_enabled(logging.DEBUG):
+            logging.debug(
+                'Processing IT instruction: '
+                + mnemonic
+            )
         
         mnemonic = mnemonic[1:]
         number_of_conditionals = len(mnemonic)
@@ -707,9 +713,9 @@ class StrandExecution:
         # Execute Then instructions.
         if execute_then_instructions == True:
             ins_address = self.execute_it_conditionals(
-                copy.deepcopy(register_object),
-                copy.deepcopy(memory_map),
-                copy.deepcopy(condition_flags),
+                dict(register_object),
+                memory_map.fork(),
+                dict(condition_flags),
                 insn_object,
                 then_instructions,
                 ins_address,
@@ -719,9 +725,9 @@ class StrandExecution:
         # Execute Else instructions.
         if execute_else_instructions == True:
             ins_address = self.execute_it_conditionals(
-                copy.deepcopy(register_object),
-                copy.deepcopy(memory_map),
-                copy.deepcopy(condition_flags),
+                dict(register_object),
+                memory_map.fork(),
+                dict(condition_flags),
                 insn_object,
                 else_instructions,
                 ins_address,
@@ -737,14 +743,16 @@ class StrandExecution:
             
         for conditional_address in ins_list:
             insn = insn_object[conditional_address]['insn']
-            logging.debug('------------------------------------------')
-            logging.debug('memory: ' + self.print_memory(memory_map))
-            logging.debug('reg: ' + self.print_memory(next_reg_values))
-            logging.debug(
-                hex(conditional_address) 
-                + '  ' + insn.mnemonic 
-                + '  ' + insn.op_str
-            )
+            if utils.is_log_enabled(logging.DEBUG):
+                logging.debug('------------------------------------------')
+                logging.debug('memory: ' + self.print_memory(memory_map))
+                logging.debug('reg: ' + self.print_memory(next_reg_values))
+            if utils.is_log_enabled(logging.DEBUG):
+                logging.debug(
+                    hex(conditional_address) 
+                    + '  ' + insn.mnemonic 
+                    + '  ' + insn.op_str
+                )
             opcode_id = insn.id
             if opcode_id in [ARM_INS_B, ARM_INS_BX, 
                                 ARM_INS_CBNZ, ARM_INS_CBZ]:            
@@ -779,6 +787,93 @@ class StrandExecution:
     # =======================================================================  
     # ----------------------- Instruction Processing ------------------------
     
+    def get_instruction_handlers(self):
+        """Map opcode ids to instruction handlers.
+
+        All handlers take (ins_address, instruction, register_object, 
+        memory_map, insn_object, condition_flags) and return 
+        (register_object, memory_map, condition_flags).
+        """
+        flag_setting_handlers = {
+            ARM_INS_ADC: self.process_adc,
+            ARM_INS_ADD: self.process_add,
+            ARM_INS_ADDW: self.process_add,
+            ARM_INS_AND: self.process_and,
+            ARM_INS_ASR: self.process_asr,
+            ARM_INS_BIC: self.process_bic,
+            ARM_INS_EOR: self.process_eor,
+            ARM_INS_LSL: self.process_lsl,
+            ARM_INS_LSR: self.process_lsr,
+            ARM_INS_MLA: self.process_mla,
+            ARM_INS_MLS: self.process_mls,
+            ARM_INS_MOV: self.process_mov,
+            ARM_INS_MOVW: self.process_mov,
+            ARM_INS_MUL: self.process_mul,
+            ARM_INS_MVN: self.process_mvn,
+            ARM_INS_ORN: self.process_orn,
+            ARM_INS_ORR: self.process_orr,
+            ARM_INS_ROR: self.process_ror,
+            ARM_INS_RRX: self.process_rrx,
+            ARM_INS_RSB: self.process_rsb,
+            ARM_INS_SBC: self.process_sbc,
+            ARM_INS_SUB: self.process_sub,
+            ARM_INS_SUBW: self.process_sub
+        }
+        register_handlers = {
+            ARM_INS_ADR: self.process_adr,
+            ARM_INS_BFC: self.process_bfc,
+            ARM_INS_BFI: self.process_bfi,
+            ARM_INS_CLZ: self.process_clz,
+            ARM_INS_RBIT: self.process_rbit,
+            ARM_INS_REV: self.process_rev,
+            ARM_INS_REV16: self.process_rev16,
+            ARM_INS_SDIV: self.process_sdiv,
+            ARM_INS_SXTB: self.process_sxt,
+            ARM_INS_SXTH: self.process_sxt,
+            ARM_INS_UBFX: self.process_ubfx,
+            ARM_INS_UDIV: self.process_udiv,
+            ARM_INS_UXTB: self.process_uxt,
+            ARM_INS_UXTH: self.process_uxt
+        }
+        memory_handlers = {
+            ARM_INS_LDM: self.process_ldm,
+            ARM_INS_LDR: self.process_ldr,
+            ARM_INS_LDREX: self.process_ldr,
+            ARM_INS_LDRH: self.process_ldr,
+            ARM_INS_LDRSH: self.process_ldr,
+            ARM_INS_LDREXH: self.process_ldr,
+            ARM_INS_LDRB: self.process_ldr,
+            ARM_INS_LDRSB: self.process_ldr,
+            ARM_INS_LDREXB: self.process_ldr,
+            ARM_INS_LDRD: self.process_ldrd,
+            ARM_INS_PUSH: self.process_push,
+            ARM_INS_STR: self.process_str,
+            ARM_INS_STREX: self.process_str,
+            ARM_INS_STRH: self.process_str,
+            ARM_INS_STREXH: self.process_str,
+            ARM_INS_STRB: self.process_str,
+            ARM_INS_STREXB: self.process_str,
+            ARM_INS_STRD: self.process_strd,
+            ARM_INS_STM: self.process_stm
+        }
+        
+        # Handlers are bound to an adapter for their argument/return shape.
+        instruction_handlers = {}
+        for (handlers, adapter) in [
+                (flag_setting_handlers, self.execute_flag_setting_instruction),
+                (register_handlers, self.execute_register_instruction),
+                (memory_handlers, self.execute_memory_instruction)]:
+            for opcode_id in handlers:
+                instruction_handlers[opcode_id] = functools.partial(
+                    adapter,
+                    handlers[opcode_id]
+                )
+        for opcode_id in [ARM_INS_CMN, ARM_INS_CMP, ARM_INS_TEQ, ARM_INS_TST]:
+            instruction_handlers[opcode_id] = self.execute_condition_instruction
+        instruction_handlers[ARM_INS_POP] = self.execute_pop_instruction
+        instruction_handlers[ARM_INS_SVC] = self.execute_svc_instruction
+        return instruction_handlers
+        
     def process_reg_values_for_instruction(self, register_object, memory_map, 
                                 insn_object, ins_address, condition_flags):
         if self.check_error == True:
@@ -799,322 +894,100 @@ class StrandExecution:
                 if is_condition_satisfied == False:
                     return (register_object, memory_map, condition_flags)
         
-        # Process instruction.        
-        if instruction.id == ARM_INS_ADC:
-            (register_object, condition_flags) = self.process_adc(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags
-            )
-        elif instruction.id in [ARM_INS_ADD, ARM_INS_ADDW]:
-            (register_object, condition_flags) = self.process_add(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags
-            )
-        elif instruction.id == ARM_INS_ADR:
-            (register_object) = self.process_adr(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags
-            )
-        elif instruction.id == ARM_INS_AND:
-            (register_object, condition_flags) = self.process_and(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags
-            )
-        elif instruction.id == ARM_INS_ASR:
-            (register_object, condition_flags) = self.process_asr(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags
-            )
-        elif instruction.id == ARM_INS_BFC:
-            (register_object) = self.process_bfc(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags
-            )
-        elif instruction.id == ARM_INS_BFI:
-            (register_object) = self.process_bfi(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags
-            )
-        elif instruction.id == ARM_INS_BIC:
-            (register_object, condition_flags) = self.process_bic(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags
-            )
-        elif instruction.id == ARM_INS_CLZ:
-            (register_object) = self.process_clz(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags
-            )
-        elif instruction.id in [ARM_INS_CMN, ARM_INS_CMP, ARM_INS_TEQ, ARM_INS_TST]:
-            (condition_flags) = self.process_condition(
-                ins_address,
-                register_object,
-                condition_flags,
-                insn_object
-            )
-            if condition_flags == None:
-                register_object = None
-        elif instruction.id == ARM_INS_EOR:
-            (register_object, condition_flags) = self.process_eor(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags
-            )
-        elif instruction.id == ARM_INS_LDM:
-            (register_object, memory_map) = self.process_ldm(
-                ins_address,
-                instruction,
-                register_object,
-                memory_map,
-                condition_flags
-            ) 
-        elif instruction.id in [ARM_INS_LDR, ARM_INS_LDREX, 
-                    ARM_INS_LDRH, ARM_INS_LDRSH, ARM_INS_LDREXH, 
-                    ARM_INS_LDRB, ARM_INS_LDRSB, ARM_INS_LDREXB]:
-            (register_object, memory_map) = self.process_ldr(
-                ins_address,
-                instruction,
-                register_object,
-                memory_map,
-                condition_flags
-            ) 
-        elif instruction.id == ARM_INS_LDRD:
-            (register_object, memory_map) = self.process_ldrd(
-                ins_address,
-                instruction,
-                register_object,
-                memory_map,
-                condition_flags
-            ) 
-        elif instruction.id == ARM_INS_LSL:
-            (register_object, condition_flags) = self.process_lsl(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags
-            )
-        elif instruction.id == ARM_INS_LSR:
-            (register_object, condition_flags) = self.process_lsr(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags
-            )
-        elif instruction.id == ARM_INS_MLA:
-            (register_object, condition_flags) = self.process_mla(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags
-            )
-        elif instruction.id == ARM_INS_MLS:
-            (register_object, condition_flags) = self.process_mls(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags
-            )
-        elif instruction.id in [ARM_INS_MOV, ARM_INS_MOVW]:
-            (register_object, condition_flags) = self.process_mov(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags
-            )
-        elif instruction.id == ARM_INS_MUL:
-            (register_object, condition_flags) = self.process_mul(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags
-            )
-        elif instruction.id == ARM_INS_MVN:
-            (register_object, condition_flags) = self.process_mvn(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags
-            )
-        elif instruction.id == ARM_INS_ORN:
-            (register_object, condition_flags) = self.process_orn(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags
-            )
-        elif instruction.id == ARM_INS_ORR:
-            (register_object, condition_flags) = self.process_orr(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags
-            )
-        elif instruction.id == ARM_INS_POP:
-            (register_object, memory_map) = self.process_pop(
-                register_object,
-                ins_address,
-                instruction,
-                memory_map,
-                condition_flags
-            )
-        elif instruction.id == ARM_INS_PUSH:
-            (register_object, memory_map) = self.process_push(
-                ins_address,
-                instruction,
-                register_object,
-                memory_map,
-                condition_flags
-            )
-        elif instruction.id == ARM_INS_RBIT:
-            (register_object) = self.process_rbit(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags
-            )
-        elif instruction.id == ARM_INS_REV:
-            (register_object) = self.process_rev(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags
-            )
-        elif instruction.id == ARM_INS_REV16:
-            (register_object) = self.process_rev16(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags
-            )
-        elif instruction.id == ARM_INS_ROR:
-            (register_object, condition_flags) = self.process_ror(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags
-            )
-        elif instruction.id == ARM_INS_RRX:
-            (register_object, condition_flags) = self.process_rrx(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags
-            )
-        elif instruction.id == ARM_INS_RSB:
-            (register_object, condition_flags) = self.process_rsb(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags
-            )
-        elif instruction.id == ARM_INS_SBC:
-            (register_object, condition_flags) = self.process_sbc(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags
-            )
-        elif instruction.id == ARM_INS_SDIV:
-            (register_object) = self.process_sdiv(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags
-            )
-        elif instruction.id in [ARM_INS_STR, ARM_INS_STREX, 
-                ARM_INS_STRH, ARM_INS_STREXH, 
-                ARM_INS_STRB, ARM_INS_STREXB]:
-            (register_object, memory_map) = self.process_str(
-                ins_address,
-                instruction,
-                register_object,
-                memory_map,
-                condition_flags
-            )
-        elif instruction.id == ARM_INS_STRD:
-            (register_object, memory_map) = self.process_strd(
-                ins_address,
-                instruction,
-                register_object,
-                memory_map,
-                condition_flags
-            )
-        elif instruction.id == ARM_INS_STM:
-            (register_object, memory_map) = self.process_stm(
-                ins_address,
-                instruction,
-                register_object,
-                memory_map,
-                condition_flags
-            )
-        elif instruction.id in [ARM_INS_SUB, ARM_INS_SUBW]:
-            (register_object, condition_flags) = self.process_sub(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags
-            )
-        elif instruction.id in [ARM_INS_SXTB, ARM_INS_SXTH]:
-            (register_object) = self.process_sxt(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags
-            )
-        elif instruction.id == ARM_INS_UBFX:
-            (register_object) = self.process_ubfx(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags
-            )
-        elif instruction.id == ARM_INS_UDIV:
-            (register_object) = self.process_udiv(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags
-            )
-        elif instruction.id in [ARM_INS_UXTB, ARM_INS_UXTH]:
-            (register_object) = self.process_uxt(
-                ins_address,
-                instruction,
-                register_object,
-                condition_flags
-            )
-        elif instruction.id == ARM_INS_SVC:
-            # We assume that all SVC calls return 0 (i.e., no error).
-            register_object = self.store_register_bytes(
-                register_object,
-                ARM_REG_R0,
-                '00000000'
-            )
-        else:
-            if ('dsb' not in instruction.mnemonic):
+        # Process instruction.
+        instruction_handler = self.instruction_handlers.get(
+            instruction.id,
+            self.execute_unhandled_instruction
+        )
+        return instruction_handler(
+            ins_address,
+            instruction,
+            register_object,
+            memory_map,
+            insn_object,
+            condition_flags
+        )
+
+    # ---------------------- Instruction Handler Adapters ---------------------
+    def execute_flag_setting_instruction(self, handler, ins_address, 
+                                instruction, register_object, memory_map, 
+                                insn_object, condition_flags):
+        (register_object, condition_flags) = handler(
+            ins_address,
+            instruction,
+            register_object,
+            condition_flags
+        )
+        return (register_object, memory_map, condition_flags)
+        
+    def execute_register_instruction(self, handler, ins_address, 
+                                instruction, register_object, memory_map, 
+                                insn_object, condition_flags):
+        register_object = handler(
+            ins_address,
+            instruction,
+            register_object,
+            condition_flags
+        )
+        return (register_object, memory_map, condition_flags)
+        
+    def execute_memory_instruction(self, handler, ins_address, 
+                                instruction, register_object, memory_map, 
+                                insn_object, condition_flags):
+        (register_object, memory_map) = handler(
+            ins_address,
+            instruction,
+            register_object,
+            memory_map,
+            condition_flags
+        )
+        return (register_object, memory_map, condition_flags)
+        
+    def execute_pop_instruction(self, ins_address, instruction, 
+                                register_object, memory_map, insn_object, 
+                                condition_flags):
+        (register_object, memory_map) = self.process_pop(
+            register_object,
+            ins_address,
+            instruction,
+            memory_map,
+            condition_flags
+        )
+        return (register_object, memory_map, condition_flags)
+        
+    def execute_condition_instruction(self, ins_address, instruction, 
+                                register_object, memory_map, insn_object, 
+                                condition_flags):
+        condition_flags = self.process_condition(
+            ins_address,
+            register_object,
+            condition_flags,
+            insn_object
+        )
+        if condition_flags == None:
+            register_object = None
+        return (register_object, memory_map, condition_flags)
+        
+    def execute_svc_instruction(self, ins_address, instruction, 
+                                register_object, memory_map, insn_object, 
+                                condition_flags):
+        # We assume that all SVC calls return 0 (i.e., no error).
+        register_object = self.store_register_bytes(
+            register_object,
+            ARM_REG_R0,
+            0
+        )
+        return (register_object, memory_map, condition_flags)
+        
+    def execute_unhandled_instruction(self, ins_address, instruction, 
+                                register_object, memory_map, insn_object, 
+                                condition_flags):
+        if ('dsb' not in instruction.mnemonic):
+            if utils.is_log_enabled(logging.TRACE):
                 logging.trace(
                     'Unhandled instruction: '
                     + instruction.mnemonic
                 )
-            return (register_object, memory_map, condition_flags)
         return (register_object, memory_map, condition_flags)
     
     def process_adc(self, ins_address, instruction, current_reg_values,
@@ -1136,16 +1009,14 @@ class StrandExecution:
         # Get values.
         (start_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            start_operand, 
-            'int'
+            start_operand
         )
         if start_value == None:
             if self.stop_on_none == True: return (next_reg_values, None)
             return (next_reg_values, condition_flags)
         (add_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            add_operand, 
-            'int',
+            add_operand,
             condition_flags['c']
         )
         if add_value == None:
@@ -1194,8 +1065,7 @@ class StrandExecution:
         # Get values.
         (start_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            start_operand, 
-            'int'
+            start_operand
         )
         if start_value == None: 
             if self.stop_on_none == True: return (next_reg_values, None)
@@ -1203,7 +1073,6 @@ class StrandExecution:
         (add_value, _) = self.get_src_reg_value(
             next_reg_values,
             add_operand,
-            'int',
             condition_flags['c']
         )
         if add_value == None: 
@@ -1238,8 +1107,7 @@ class StrandExecution:
         pc_value = self.get_mem_access_pc_value(ins_address)
         (add_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            operands[1], 
-            'int'
+            operands[1]
         )        
         if add_value == None:
             return (next_reg_values)
@@ -1274,29 +1142,21 @@ class StrandExecution:
 
         (start_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            start_operand, 
-            'int'
+            start_operand
         )
         if start_value == None:
             if self.stop_on_none == True: return (next_reg_values, None)
             return (next_reg_values, condition_flags)
         (and_value, carry) = self.get_src_reg_value(
             next_reg_values, 
-            and_operand, 
-            'int',
+            and_operand,
             condition_flags['c']
         )
         if and_value == None:
             if self.stop_on_none == True: return (next_reg_values, None)
             return (next_reg_values, condition_flags)
         
-        np_dtype = utils.get_numpy_type([start_value, and_value])
-        result = np.bitwise_and(
-            start_value.astype(np_dtype),
-            and_value.astype(np_dtype),
-            dtype=np_dtype,
-            casting='safe'
-        )
+        result = start_value & and_value
 
         next_reg_values = self.store_register_bytes(
             next_reg_values,
@@ -1327,7 +1187,7 @@ class StrandExecution:
             src_operand = operands[1]
             shift_operand = operands[2]
 
-        (src_value, carry) = self.get_src_reg_value(next_reg_values, src_operand, 'int')
+        (src_value, carry) = self.get_src_reg_value(next_reg_values, src_operand)
         if src_value == None:
             if self.stop_on_none == True: return (next_reg_values, None)
             return (next_reg_values, condition_flags)
@@ -1363,27 +1223,15 @@ class StrandExecution:
 
         (src_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            operands[0], 
-            'int'
+            operands[0]
         )
         if src_value == None:
             return (next_reg_values)
         
-        (lsb, _) = self.get_src_reg_value(next_reg_values, operands[1], 'int')
-        (width, _) = self.get_src_reg_value(next_reg_values, operands[2], 'int')
-        bit_length = utils.get_bit_length(src_value)
-        bits = utils.get_binary_representation(src_value, bit_length)
-        end_idx = bit_length - lsb -1
-        start_idx = bit_length - lsb - width
-        
-        new_bits = ''
-        for i in range(bit_length):
-            if i in range(start_idx, (end_idx+1)):
-                new_bits += '0'
-            else:
-                new_bits += bits[i]
-
-        new_value = utils.convert_bits_to_type(new_bits, type(src_value))
+        (lsb, _) = self.get_src_reg_value(next_reg_values, operands[1])
+        (width, _) = self.get_src_reg_value(next_reg_values, operands[2])
+        clear_mask = ((1 << width) - 1) << lsb
+        new_value = src_value & ~clear_mask & 0xFFFFFFFF
         next_reg_values = self.store_register_bytes(
             next_reg_values,
             dst_operand,
@@ -1402,40 +1250,24 @@ class StrandExecution:
 
         (original_value, _) = self.get_src_reg_value(
             next_reg_values,
-            operands[0],
-            'int'
+            operands[0]
         )
         if original_value == None:
             return (next_reg_values)
         
         (src_value, _) = self.get_src_reg_value(
             next_reg_values,
-            operands[1],
-            'int'
+            operands[1]
         )
         if src_value == None:
             return (next_reg_values)
         
-        (lsb, _) = self.get_src_reg_value(next_reg_values, operands[2], 'int')
-        (width, _) = self.get_src_reg_value(next_reg_values, operands[3], 'int')
-        bit_length = utils.get_bit_length(src_value)
-        original_bits = utils.get_binary_representation(original_value, bit_length)
-        src_bits = utils.get_binary_representation(src_value, bit_length)
-        
-        insert_bits = src_bits[(-1*width):]
-        end_idx = bit_length - lsb -1
-        start_idx = bit_length - lsb - width
-        
-        new_bits = ''
-        insert_ctr = 0
-        for i in range(bit_length):
-            if i in range(start_idx, (end_idx+1)):
-                new_bits += insert_bits[insert_ctr]
-                insert_ctr += 1
-            else:
-                new_bits += original_bits[i]
-
-        new_value = utils.convert_bits_to_type(new_bits, type(original_value))
+        (lsb, _) = self.get_src_reg_value(next_reg_values, operands[2])
+        (width, _) = self.get_src_reg_value(next_reg_values, operands[3])
+        insert_mask = ((1 << width) - 1) << lsb
+        new_value = (original_value & ~insert_mask) \
+            | ((src_value << lsb) & insert_mask)
+        new_value = new_value & 0xFFFFFFFF
         next_reg_values = self.store_register_bytes(
             next_reg_values,
             dst_operand,
@@ -1461,34 +1293,21 @@ class StrandExecution:
 
         (start_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            start_operand, 
-            'int'
+            start_operand
         )
         if start_value == None:
             if self.stop_on_none == True: return (next_reg_values, None)
             return (next_reg_values, condition_flags)
         (not_value, carry) = self.get_src_reg_value(
             next_reg_values, 
-            not_operand, 
-            'int',
+            not_operand,
             condition_flags['c']
         )
         if not_value == None:
             if self.stop_on_none == True: return (next_reg_values, None)
             return (next_reg_values, condition_flags)
 
-        np_dtype = utils.get_numpy_type([start_value, not_value])
-        inverted_not_value = np.bitwise_not(
-            not_value.astype(np_dtype),
-            dtype=np_dtype,
-            casting='safe'
-        )
-        result = np.bitwise_and(
-            start_value.astype(np_dtype),
-            inverted_not_value.astype(np_dtype),
-            dtype=np_dtype,
-            casting='safe'
-        )
+        result = start_value & ~not_value & 0xFFFFFFFF
             
         next_reg_values = self.store_register_bytes(
             next_reg_values,
@@ -1516,23 +1335,12 @@ class StrandExecution:
 
         (src_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            src_operand, 
-            'hex'
+            src_operand
         )
         if src_value == None:
             return (next_reg_values)
         
-        num_bits = int(len(src_value) * 2)
-        result_in_bits = utils.get_binary_representation(src_value, num_bits)
-        
-        num_leading_zeros = 0
-        for i in range(num_bits):
-            if result_in_bits[i] == '0':
-                num_leading_zeros += 1
-            else:
-                break
-        result = utils.convert_type(num_leading_zeros, 'hex')
-        result = result.zfill(8)
+        result = 32 - src_value.bit_length()
         next_reg_values = self.store_register_bytes(
             next_reg_values,
             dst_operand,
@@ -1547,16 +1355,14 @@ class StrandExecution:
         
         (operand1, _) = self.get_src_reg_value(
             register_object, 
-            operands[0], 
-            'int'
+            operands[0]
         )
         if operand1 == None: 
             condition_flags = self.initialise_condition_flags()
             return (condition_flags)
         (operand2, carry) = self.get_src_reg_value(
             register_object, 
-            operands[1], 
-            'int',
+            operands[1],
             condition_flags['c']
         )
         if operand2 == None: 
@@ -1572,21 +1378,9 @@ class StrandExecution:
             (result, carry, overflow) = \
                 binops.add_with_carry(operand1, operand2, 1, sub=True)
         elif opcode_id == ARM_INS_TST:
-            np_dtype = utils.get_numpy_type([operand1, operand2])
-            result = np.bitwise_and(
-                operand1.astype(np_dtype),
-                operand2.astype(np_dtype),
-                dtype=np_dtype,
-                casting='safe'
-            )
+            result = operand1 & operand2
         elif opcode_id == ARM_INS_TEQ:
-            np_dtype = utils.get_numpy_type([operand1, operand2])
-            result = np.bitwise_xor(
-                operand1.astype(np_dtype),
-                operand2.astype(np_dtype),
-                dtype=np_dtype,
-                casting='safe'
-            )
+            result = operand1 ^ operand2
         # Update flags.
         condition_flags = self.update_condition_flags(
             condition_flags,
@@ -1614,29 +1408,21 @@ class StrandExecution:
 
         (start_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            start_operand, 
-            'int'
+            start_operand
         )
         if start_value == None:
             if self.stop_on_none == True: return (next_reg_values, None)
             return (next_reg_values, condition_flags)
         (orr_value, carry) = self.get_src_reg_value(
             next_reg_values, 
-            orr_operand, 
-            'int',
+            orr_operand,
             condition_flags['c']
         )
         if orr_value == None:
             if self.stop_on_none == True: return (next_reg_values, None)
             return (next_reg_values, condition_flags)
         
-        np_dtype = utils.get_numpy_type([start_value, orr_value])
-        result = np.bitwise_xor(
-            start_value.astype(np_dtype),
-            orr_value.astype(np_dtype),
-            dtype=np_dtype,
-            casting='safe'
-        )  
+        result = start_value ^ orr_value
 
         next_reg_values = self.store_register_bytes(
             next_reg_values,
@@ -1657,7 +1443,7 @@ class StrandExecution:
         operands = instruction.operands
         
         src_register = operands[0]
-        (address, _) = self.get_src_reg_value(next_reg_values, src_register, 'int')
+        (address, _) = self.get_src_reg_value(next_reg_values, src_register)
         if address == None: 
             ins_address = self.get_next_address(self.all_addresses, ins_address)
             next_reg_values = self.store_register_bytes(
@@ -1681,9 +1467,7 @@ class StrandExecution:
                 memory_map,
                 address
             )
-            
-            if reg_value != None:
-                if reg_value.strip() == '': reg_value = None
+
             next_reg_values = self.store_register_bytes(
                 next_reg_values,
                 dst_operand,
@@ -1696,7 +1480,8 @@ class StrandExecution:
                 if pc_target != None:
                     if pc_target % 2 == 1:
                         pc_target = pc_target - 1
-                logging.debug('PC branch to ' + hex(pc_target))
+                if utils.is_log_enabled(logging.DEBUG):
+                    logging.debug('PC branch to ' + hex(pc_target))
                 # Always follow branch?
                 next_reg_values = self.store_register_bytes(
                     next_reg_values,
@@ -1760,11 +1545,12 @@ class StrandExecution:
 
         # If dst_operand is PC, then it causes branch.
         if dst_operand == ARM_REG_PC:
-            pc_target = self.get_register_bytes(next_reg_values, dst_operand, 'int')
+            pc_target = self.get_register_bytes(next_reg_values, dst_operand)
             if pc_target != None:
                 if pc_target % 2 == 1:
                     pc_target = pc_target -1
-            logging.debug('PC branch to ' + hex(pc_target))
+            if utils.is_log_enabled(logging.DEBUG):
+                logging.debug('PC branch to ' + hex(pc_target))
             next_reg_values = self.store_register_bytes(
                 next_reg_values,
                 ARM_REG_PC,
@@ -1772,9 +1558,10 @@ class StrandExecution:
             )
             return(next_reg_values, memory_map)
             
-        logging.debug(
-            'LDR address: ' + hex(src_memory_address)
-        )
+        if utils.is_log_enabled(logging.DEBUG):
+            logging.debug(
+                'LDR address: ' + hex(src_memory_address)
+            )
         
         num_bytes = 4
         if opcode_id in [ARM_INS_LDRB, ARM_INS_LDRSB, ARM_INS_LDREXB]:
@@ -1788,19 +1575,15 @@ class StrandExecution:
                 + ' and LDR src address '
                 + hex(src_memory_address)
             )
-        num_halfbytes = int(num_bytes*2)
-        
         (src_value) = self.get_value_from_memory(
             memory_map,
             src_memory_address,
             unprocessed=True
         )
-        logging.debug('Loaded value: ' + str(src_value))
+        if utils.is_log_enabled(logging.DEBUG):
+            logging.debug('Loaded value: ' + str(src_value))
          
-        # Handle cases where None is returned (this will only happen 
-        #  if dtype is not hex.
-        if src_value != None:
-            if src_value.strip() == '': src_value = None
+        # Handle cases where None is returned.
         if src_value == None:
             logging.warning(
                 'LDR destination not present in memory: '
@@ -1820,19 +1603,16 @@ class StrandExecution:
             return (next_reg_values, memory_map)
                     
         # Get the required bytes.
-        src_value = src_value.zfill(8)
-        
-        src_value = src_value[(-1*num_halfbytes):]
+        src_value = src_value & ((1 << (8*num_bytes)) - 1)
 
-        if ((opcode_id == ARM_INS_LDRB) 
-                or (opcode_id == ARM_INS_LDRH)
-                or (opcode_id == ARM_INS_LDREXB) 
-                or (opcode_id == ARM_INS_LDREXH)):
-            src_value = src_value.zfill(8)
-        elif ((opcode_id == ARM_INS_LDRSB) or (opcode_id == ARM_INS_LDRSH)):
-            src_value = binops.sign_extend(src_value)
+        if ((opcode_id == ARM_INS_LDRSB) or (opcode_id == ARM_INS_LDRSH)):
+            src_value = binops.sign_extend(
+                src_value,
+                bit_length=(8*num_bytes)
+            )
         
-        logging.trace('Value to load: ' + str(src_value))
+        if utils.is_log_enabled(logging.TRACE):
+            logging.trace('Value to load: ' + str(src_value))
         next_reg_values = self.store_register_bytes(
             next_reg_values,
             dst_operand,
@@ -1876,27 +1656,24 @@ class StrandExecution:
             return (next_reg_values, memory_map)
             
         #Operand1.
-        logging.debug(
-            'LDR address: ' + hex(src_memory_address)
-        )        
+        if utils.is_log_enabled(logging.DEBUG):
+            logging.debug(
+                'LDR address: ' + hex(src_memory_address)
+            )        
         (src_value1) = self.get_value_from_memory(
             memory_map,
             src_memory_address,
             unprocessed=True,
             num_bytes=4
         )
-        if src_value1 != None:
-            if src_value1.strip() == '': src_value1 = None
         if src_value1 == None:
             logging.warning(
                 'LDR destination not present in memory: '
                 + hex(src_memory_address)
             )
-        else:
-            # Get the required bytes.
-            src_value1 = src_value1.strip().zfill(8)
 
-        logging.trace('Value to load: ' + str(src_value1))
+        if utils.is_log_enabled(logging.TRACE):
+            logging.trace('Value to load: ' + str(src_value1))
         next_reg_values = self.store_register_bytes(
             next_reg_values,
             dst_operand1,
@@ -1904,27 +1681,24 @@ class StrandExecution:
         )
         
         # Operand2
-        logging.debug(
-            'LDR address: ' + hex(src_memory_address+4)
-        )  
+        if utils.is_log_enabled(logging.DEBUG):
+            logging.debug(
+                'LDR address: ' + hex(src_memory_address+4)
+            )  
         (src_value2) = self.get_value_from_memory(
             memory_map,
             src_memory_address+4,
             unprocessed=True,
             num_bytes=4
         )
-        if src_value2 != None:
-            if src_value2.strip() == '': src_value2 = None
         if src_value2 == None:
             logging.warning(
                 'LDR destination not present in memory: '
                 + hex(src_memory_address+4)
             )
-        else:
-            # Get the required bytes.
-            src_value2 = src_value2.strip().zfill(8)
         
-        logging.trace('Value to load: ' + str(src_value2))
+        if utils.is_log_enabled(logging.TRACE):
+            logging.trace('Value to load: ' + str(src_value2))
         next_reg_values = self.store_register_bytes(
             next_reg_values,
             dst_operand2,
@@ -1948,7 +1722,7 @@ class StrandExecution:
             src_operand = operands[1]
             shift_operand = operands[2]
 
-        (src_value, carry) = self.get_src_reg_value(next_reg_values, src_operand, 'int')
+        (src_value, carry) = self.get_src_reg_value(next_reg_values, src_operand)
         if src_value == None:
             if self.stop_on_none == True: return (next_reg_values, None)
             return (next_reg_values, condition_flags)
@@ -1989,7 +1763,7 @@ class StrandExecution:
             src_operand = operands[1]
             shift_operand = operands[2]
 
-        (src_value, carry) = self.get_src_reg_value(next_reg_values, src_operand, 'int')
+        (src_value, carry) = self.get_src_reg_value(next_reg_values, src_operand)
         if src_value == None:
             if self.stop_on_none == True: return (next_reg_values, None)
             return (next_reg_values, condition_flags)
@@ -2027,27 +1801,22 @@ class StrandExecution:
         operand2 = operands[2]
         accumulateop = operands[3]
 
-        (value1, _) = self.get_src_reg_value(next_reg_values, operand1, 'int')
+        (value1, _) = self.get_src_reg_value(next_reg_values, operand1)
         if value1 == None:
             if self.stop_on_none == True: return (next_reg_values, None)
             return (next_reg_values, condition_flags)
-        (value2, _) = self.get_src_reg_value(next_reg_values, operand2, 'int')
+        (value2, _) = self.get_src_reg_value(next_reg_values, operand2)
         if value2 == None:
             if self.stop_on_none == True: return (next_reg_values, None)
             return (next_reg_values, condition_flags)
-        (accumulate, _) = self.get_src_reg_value(next_reg_values, accumulateop, 'int')
+        (accumulate, _) = self.get_src_reg_value(next_reg_values, accumulateop)
         if accumulate == None:
             if self.stop_on_none == True: return (next_reg_values, None)
             return (next_reg_values, condition_flags)
 
-        value1 = getattr(value1, "tolist", lambda: value1)()
-        value2 = getattr(value2, "tolist", lambda: value2)()
-        accumulate = getattr(accumulate, "tolist", lambda: accumulate)()
         mul_value = value1 * value2
         mul_value = mul_value + accumulate
-        mul_value = '{0:08x}'.format(mul_value)
-        mul_value = mul_value.zfill(8)
-        result = mul_value[-8:]
+        result = mul_value & 0xFFFFFFFF
 
         next_reg_values = self.store_register_bytes(
             next_reg_values,
@@ -2074,31 +1843,22 @@ class StrandExecution:
         operand2 = operands[2]
         accumulateop = operands[3]
 
-        (value1, _) = self.get_src_reg_value(next_reg_values, operand1, 'int')
+        (value1, _) = self.get_src_reg_value(next_reg_values, operand1)
         if value1 == None:
             if self.stop_on_none == True: return (next_reg_values, None)
             return (next_reg_values, condition_flags)
-        (value2, _) = self.get_src_reg_value(next_reg_values, operand2, 'int')
+        (value2, _) = self.get_src_reg_value(next_reg_values, operand2)
         if value2 == None:
             if self.stop_on_none == True: return (next_reg_values, None)
             return (next_reg_values, condition_flags)
-        (accumulate, _) = self.get_src_reg_value(next_reg_values, accumulateop, 'int')
+        (accumulate, _) = self.get_src_reg_value(next_reg_values, accumulateop)
         if accumulate == None:
             if self.stop_on_none == True: return (next_reg_values, None)
             return (next_reg_values, condition_flags)
 
-        value1 = getattr(value1, "tolist", lambda: value1)()
-        value2 = getattr(value2, "tolist", lambda: value2)()
-        accumulate = getattr(accumulate, "tolist", lambda: accumulate)()
         mul_value = value1 * value2
         mul_value = accumulate - mul_value 
-        if abs(mul_value) > 2147483647:
-            mul_value = np.uint32(mul_value)
-        else:
-            mul_value = np.int32(mul_value)
-        mul_value = '{0:08x}'.format(mul_value)
-        mul_value = mul_value.zfill(8)
-        result = mul_value[-8:]
+        result = mul_value & 0xFFFFFFFF
 
         next_reg_values = self.store_register_bytes(
             next_reg_values,
@@ -2149,21 +1909,17 @@ class StrandExecution:
             operand1 = operands[1]
             operand2 = operands[2]
 
-        (value1, _) = self.get_src_reg_value(next_reg_values, operand1, 'int')
+        (value1, _) = self.get_src_reg_value(next_reg_values, operand1)
         if value1 == None:
             if self.stop_on_none == True: return (next_reg_values, None)
             return (next_reg_values, condition_flags)
-        (value2, _) = self.get_src_reg_value(next_reg_values, operand2, 'int')
+        (value2, _) = self.get_src_reg_value(next_reg_values, operand2)
         if value2 == None:
             if self.stop_on_none == True: return (next_reg_values, None)
             return (next_reg_values, condition_flags)
 
-        value1 = getattr(value1, "tolist", lambda: value1)()
-        value2 = getattr(value2, "tolist", lambda: value2)()
         mul_value = value1 * value2
-        mul_value = '{0:08x}'.format(mul_value)
-        mul_value = mul_value.zfill(8)
-        result = mul_value[-8:]
+        result = mul_value & 0xFFFFFFFF
 
         next_reg_values = self.store_register_bytes(
             next_reg_values,
@@ -2190,21 +1946,14 @@ class StrandExecution:
 
         (src_value, carry) = self.get_src_reg_value(
             next_reg_values, 
-            operands[1], 
-            'int',
+            operands[1],
             condition_flags['c']
         )
         if src_value == None:
             if self.stop_on_none == True: return (next_reg_values, None)
             return (next_reg_values, condition_flags)
         
-        bit_length = utils.get_bit_length(src_value)
-        mult = 0xFFFFFFFF
-        if bit_length == 8:
-            mult = 0xFF
-        elif bit_length == 16:
-            mult = 0xFFFF
-        result = (~src_value & mult)
+        result = (~src_value & 0xFFFFFFFF)
         next_reg_values = self.store_register_bytes(
             next_reg_values,
             dst_operand,
@@ -2236,34 +1985,21 @@ class StrandExecution:
 
         (start_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            start_operand, 
-            'int'
+            start_operand
         )
         if start_value == None:
             if self.stop_on_none == True: return (next_reg_values, None)
             return (next_reg_values, condition_flags)
         (orr_value, carry) = self.get_src_reg_value(
             next_reg_values, 
-            orr_operand, 
-            'int',
+            orr_operand,
             condition_flags['c']
         )
         if orr_value == None:
             if self.stop_on_none == True: return (next_reg_values, None)
             return (next_reg_values, condition_flags)
         
-        np_dtype = utils.get_numpy_type([start_value, orr_value])
-        orr_value = np.bitwise_not(
-            orr_value.astype(np_dtype),
-            dtype=np_dtype,
-            casting='safe'
-        )
-        result = np.bitwise_or(
-            start_value.astype(np_dtype),
-            orr_value.astype(np_dtype),
-            dtype=np_dtype,
-            casting='safe'
-        )  
+        result = start_value | (~orr_value & 0xFFFFFFFF)
 
         next_reg_values = self.store_register_bytes(
             next_reg_values,
@@ -2296,29 +2032,21 @@ class StrandExecution:
             
         (start_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            start_operand, 
-            'int'
+            start_operand
         )
         if start_value == None:
             if self.stop_on_none == True: return (next_reg_values, None)
             return (next_reg_values, condition_flags)
         (orr_value, carry) = self.get_src_reg_value(
             next_reg_values, 
-            orr_operand, 
-            'int',
+            orr_operand,
             condition_flags['c']
         )
         if orr_value == None:
             if self.stop_on_none == True: return (next_reg_values, None)
             return (next_reg_values, condition_flags)
         
-        np_dtype = utils.get_numpy_type([start_value, orr_value])
-        result = np.bitwise_or(
-            start_value.astype(np_dtype),
-            orr_value.astype(np_dtype),
-            dtype=np_dtype,
-            casting='safe'
-        )  
+        result = start_value | orr_value
 
         next_reg_values = self.store_register_bytes(
             next_reg_values,
@@ -2338,7 +2066,7 @@ class StrandExecution:
         next_reg_values = current_reg_values
         operands = instruction.operands
 
-        current_sp = self.get_register_bytes(next_reg_values, ARM_REG_SP, 'int')
+        current_sp = self.get_register_bytes(next_reg_values, ARM_REG_SP)
         address = current_sp
         new_sp = current_sp + (4*len(operands))
         next_reg_values = self.store_register_bytes(
@@ -2356,17 +2084,15 @@ class StrandExecution:
             )
             memory_map.pop(address, None)
             address += 4
-            
-        # Sort the stack.
-        memory_map = {key:memory_map[key] for key in sorted(memory_map.keys())}
 
         last_register = operands[-1].value.reg
         if last_register == ARM_REG_PC:
-            pc_target = self.get_register_bytes(next_reg_values, last_register, 'int')
+            pc_target = self.get_register_bytes(next_reg_values, last_register)
             if pc_target != None:
                 if pc_target % 2 == 1:
                     pc_target = pc_target - 1
-            logging.debug('Returning to ' + str(pc_target) + ' (POP PC)')
+            if utils.is_log_enabled(logging.DEBUG):
+                logging.debug('Returning to ' + str(pc_target) + ' (POP PC)')
             next_reg_values = self.store_register_bytes(
                 next_reg_values,
                 ARM_REG_PC,
@@ -2386,7 +2112,7 @@ class StrandExecution:
         next_reg_values = current_reg_values
         operands = instruction.operands
         
-        current_sp = self.get_register_bytes(next_reg_values, ARM_REG_SP, 'int')
+        current_sp = self.get_register_bytes(next_reg_values, ARM_REG_SP)
         address = current_sp - (4*len(operands))
         
         for operand in operands:
@@ -2405,10 +2131,6 @@ class StrandExecution:
             ARM_REG_SP,
             new_sp
         )
-        
-        # Sort the stack.
-        memory_map = {key:memory_map[key] for key in sorted(memory_map.keys())}
-
         return (next_reg_values, memory_map)
         
     def process_rbit(self, ins_address, instruction, current_reg_values,
@@ -2425,10 +2147,9 @@ class StrandExecution:
             return (next_reg_values)
         
         # reversed_bits.
-        src_bits = utils.get_binary_representation(src_value, 32)
+        src_bits = '{0:032b}'.format(src_value)
         reversed_bits = src_bits[::-1]
-            
-        reversed_bytes = utils.convert_bits_to_type(reversed_bits, 'hex')
+        reversed_bytes = int(reversed_bits, 2)
         
         next_reg_values = self.store_register_bytes(
             next_reg_values,
@@ -2446,21 +2167,15 @@ class StrandExecution:
         if dst_operand == None: 
             return (next_reg_values)
 
-        (src_value, _) = self.get_src_reg_value(next_reg_values, operands[1], 'hex')
+        (src_value, _) = self.get_src_reg_value(next_reg_values, operands[1])
         if src_value == None:
             return (next_reg_values)
         
         # reversed_bits.
-        if len(src_value) != 8:
-            logging.error(
-                'Reverse operand is not the correct length'
-            )
-            src_value = src_value.zfill(8)
-            
-        reversed_bytes = src_value[6:8] \
-                         + src_value[4:6] \
-                         + src_value[2:4] \
-                         + src_value[0:2]
+        reversed_bytes = int.from_bytes(
+            src_value.to_bytes(4, byteorder='little'),
+            byteorder='big'
+        )
         
         next_reg_values = self.store_register_bytes(
             next_reg_values,
@@ -2478,21 +2193,13 @@ class StrandExecution:
         if dst_operand == None: 
             return (next_reg_values)
 
-        (src_value, _) = self.get_src_reg_value(next_reg_values, operands[1], 'hex')
+        (src_value, _) = self.get_src_reg_value(next_reg_values, operands[1])
         if src_value == None:
             return (next_reg_values)
         
         # reversed_bits.
-        if len(src_value) != 8:
-            logging.error(
-                'Reverse operand is not the correct length'
-            )
-            src_value = src_value.zfill(8)
-            
-        reversed_bytes = src_value[2:4] \
-                         + src_value[0:2] \
-                         + src_value[6:8] \
-                         + src_value[4:6] 
+        reversed_bytes = ((src_value & 0x00FF00FF) << 8) \
+                         | ((src_value >> 8) & 0x00FF00FF)
         
         next_reg_values = self.store_register_bytes(
             next_reg_values,
@@ -2517,7 +2224,7 @@ class StrandExecution:
             src_operand = operands[1]
             shift_operand = operands[2]
 
-        (src_value, carry) = self.get_src_reg_value(next_reg_values, src_operand, 'int')
+        (src_value, carry) = self.get_src_reg_value(next_reg_values, src_operand)
         if src_value == None:
             if self.stop_on_none == True: return (next_reg_values, None)
             return (next_reg_values, condition_flags)
@@ -2553,8 +2260,7 @@ class StrandExecution:
 
         (src_value, carry) = self.get_src_reg_value(
             next_reg_values, 
-            operands[1], 
-            'int'
+            operands[1]
         )
         if src_value == None:
             if self.stop_on_none == True: return (next_reg_values, None)
@@ -2596,16 +2302,14 @@ class StrandExecution:
 
         (start_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            start_operand, 
-            'int'
+            start_operand
         )
         if start_value == None:
             if self.stop_on_none == True: return (next_reg_values, None)
             return (next_reg_values, condition_flags)
         (add_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            add_operand, 
-            'int',
+            add_operand,
             condition_flags['c']
         )
         if add_value == None:
@@ -2647,16 +2351,14 @@ class StrandExecution:
 
         (start_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            start_operand, 
-            'int'
+            start_operand
         )
         if start_value == None:
             if self.stop_on_none == True: return (next_reg_values, None)
             return (next_reg_values, condition_flags)
         (add_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            add_operand, 
-            'int',
+            add_operand,
             condition_flags['c']
         )
         if add_value == None:
@@ -2699,26 +2401,15 @@ class StrandExecution:
         if src_value == None:
             return (next_reg_values)
         
-        (lsb, _) = self.get_src_reg_value(next_reg_values, operands[2], 'int')
-        (width, _) = self.get_src_reg_value(next_reg_values, operands[3], 'int')
-        src_bits = utils.get_binary_representation(src_value, 32)
-        msb = lsb + width - 1
-        new_bits = src_bits[msb:lsb]
-        top_bit = new_bits[0]
-        if msb <= 31:
-            extended_bits = ''
-            for i in range(32):
-                extended_bits += top_bit
-            extended_bits += new_bits
-            new_bits = extended_bits[-32:]
-            
-        new_value = utils.convert_bits_to_type(new_bits, 'hex')
+        (lsb, _) = self.get_src_reg_value(next_reg_values, operands[2])
+        (width, _) = self.get_src_reg_value(next_reg_values, operands[3])
+        field_value = (src_value >> lsb) & ((1 << width) - 1)
+        new_value = binops.sign_extend(field_value, bit_length=width)
         
         next_reg_values = self.store_register_bytes(
             next_reg_values,
             dst_operand,
-            new_value,
-            True
+            new_value
         )
         return (next_reg_values)
         
@@ -2741,16 +2432,14 @@ class StrandExecution:
 
         (numerator, _) = self.get_src_reg_value(
             next_reg_values, 
-            numerator_operand, 
-            'int',
+            numerator_operand,
             signed=True
         )
         if numerator == None: 
             return (next_reg_values)
         (denominator, _) = self.get_src_reg_value(
             next_reg_values, 
-            denominator_operand, 
-            'int',
+            denominator_operand,
             signed=True
         )
         if denominator == None: 
@@ -2759,17 +2448,12 @@ class StrandExecution:
             value = 0
         else:
             value = numerator//denominator
-        if abs(value) > 2147483647:
-            value = np.uint32(value)
-        else:
-            value = np.int32(value)
-        value = '{0:08x}'.format(value)
+        value = value & 0xFFFFFFFF
         
         next_reg_values = self.store_register_bytes(
             next_reg_values,
             dst_operand,
-            value,
-            True
+            value
         )
         return (next_reg_values)
         
@@ -2779,7 +2463,7 @@ class StrandExecution:
         operands = instruction.operands
 
         dst_register = operands[0]
-        (address, _) = self.get_src_reg_value(next_reg_values, dst_register, 'int')
+        (address, _) = self.get_src_reg_value(next_reg_values, dst_register)
         if address == None: 
             return (next_reg_values, memory_map)
         
@@ -2807,18 +2491,19 @@ class StrandExecution:
         opcode_id = instruction.id
         operands = instruction.operands
 
-        (src_value, _) = self.get_src_reg_value(next_reg_values, operands[0], 'hex')
+        (src_value, _) = self.get_src_reg_value(next_reg_values, operands[0])
         if src_value == None: 
             return (next_reg_values, memory_map)
         
         num_bytes = 4
         if opcode_id in [ARM_INS_STRB, ARM_INS_STREXB]:
-            src_value = src_value[-2:]
+            src_value = src_value & 0xFF
             num_bytes = 1
         elif opcode_id in [ARM_INS_STRH, ARM_INS_STREXH]:
-            src_value = src_value[-4:]
+            src_value = src_value & 0xFFFF
             num_bytes = 2
-        logging.trace('Value to store: ' + str(src_value))
+        if utils.is_log_enabled(logging.TRACE):
+            logging.trace('Value to store: ' + str(src_value))
 
         post_index_reg = None
         if len(operands) == 3:
@@ -2844,7 +2529,7 @@ class StrandExecution:
         if opcode_id in [ARM_INS_STREX, ARM_INS_STREXB, ARM_INS_STREXH]:
             # We assume the executing processor always has exclusive access 
             #  to the memory addressed.
-            new_reg_value = '00000000'
+            new_reg_value = 0
             next_reg_values = self.store_register_bytes(
                 next_reg_values,
                 operands[0].value.reg,
@@ -2859,17 +2544,18 @@ class StrandExecution:
         opcode_id = instruction.id
         operands = instruction.operands
 
-        (src_value1, _) = self.get_src_reg_value(next_reg_values, operands[0], 'hex')
-        (src_value2, _) = self.get_src_reg_value(next_reg_values, operands[1], 'hex')
+        (src_value1, _) = self.get_src_reg_value(next_reg_values, operands[0])
+        (src_value2, _) = self.get_src_reg_value(next_reg_values, operands[1])
         if ((src_value1 == None) and (src_value2 == None)):
             return (next_reg_values, memory_map)
             
-        logging.trace(
-            'Values to store: ' 
-            + str(src_value1) 
-            + ' and ' 
-            + str(src_value2)
-        )
+        if utils.is_log_enabled(logging.TRACE):
+            logging.trace(
+                'Values to store: ' 
+                + str(src_value1) 
+                + ' and ' 
+                + str(src_value2)
+            )
 
         post_index_reg = None
         if len(operands) == 4:
@@ -2920,16 +2606,14 @@ class StrandExecution:
 
         (start_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            start_operand, 
-            'int'
+            start_operand
         )
         if start_value == None:
             if self.stop_on_none == True: return (next_reg_values, None)
             return (next_reg_values, condition_flags)
         (add_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            add_operand, 
-            'int',
+            add_operand,
             condition_flags['c']
         )
         if add_value == None:
@@ -2967,22 +2651,20 @@ class StrandExecution:
 
         (src_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            src_operand, 
-            'hex'
+            src_operand
         )
         if src_value == None:
             return (next_reg_values)
         
         # This is to make sure we get the correct bytes.
-        src_value = src_value.zfill(8)
-
+        bit_length = 32
         if opcode_id == ARM_INS_SXTB:
-            src_value = src_value[-2:]
+            bit_length = 8
         elif opcode_id == ARM_INS_SXTH:
-            src_value = src_value[-4:]
+            bit_length = 16
         
         # This is the actual extension.
-        extended_value = binops.sign_extend(src_value)
+        extended_value = binops.sign_extend(src_value, bit_length=bit_length)
         
         next_reg_values = self.store_register_bytes(
             next_reg_values,
@@ -3008,21 +2690,14 @@ class StrandExecution:
         if src_value == None: 
             return (next_reg_values)
         
-        (lsb, _) = self.get_src_reg_value(next_reg_values, operands[2], 'int')
-        (width, _) = self.get_src_reg_value(next_reg_values, operands[3], 'int')
-        src_bits = utils.get_binary_representation(src_value, 32)
-        msb = lsb + width - 1
-        new_bits = src_bits[msb:lsb]
-        if msb <= 31:
-            new_bits = new_bits.zfill(32)
-            
-        new_value = utils.convert_bits_to_type(new_bits, 'hex')
+        (lsb, _) = self.get_src_reg_value(next_reg_values, operands[2])
+        (width, _) = self.get_src_reg_value(next_reg_values, operands[3])
+        new_value = (src_value >> lsb) & ((1 << width) - 1)
         
         next_reg_values = self.store_register_bytes(
             next_reg_values,
             dst_operand,
-            new_value,
-            True
+            new_value
         )
         return (next_reg_values)
             
@@ -3045,15 +2720,13 @@ class StrandExecution:
 
         (numerator, _) = self.get_src_reg_value(
             next_reg_values, 
-            numerator_operand, 
-            'int'
+            numerator_operand
         )
         if numerator == None: 
             return (next_reg_values)
         (denominator, _) = self.get_src_reg_value(
             next_reg_values, 
-            denominator_operand, 
-            'int'
+            denominator_operand
         )
         if denominator == None: 
             return (next_reg_values)
@@ -3065,8 +2738,7 @@ class StrandExecution:
         next_reg_values = self.store_register_bytes(
             next_reg_values,
             dst_operand,
-            value,
-            True
+            value
         )
         return (next_reg_values)
             
@@ -3084,28 +2756,24 @@ class StrandExecution:
 
         (src_value, _) = self.get_src_reg_value(
             next_reg_values, 
-            src_operand, 
-            'hex'
+            src_operand
         )
         if src_value == None: 
             return (next_reg_values)
         
         # This is to make sure we get the correct bytes.
-        src_value = src_value.zfill(8)
-
         if opcode_id == ARM_INS_UXTB:
-            src_value = src_value[-2:]
+            src_value = src_value & 0xFF
         elif opcode_id == ARM_INS_UXTH:
-            src_value = src_value[-4:]
+            src_value = src_value & 0xFFFF
         
         # This is the actual extension.
-        extended_value = src_value.zfill(8)
+        extended_value = src_value
         
         next_reg_values = self.store_register_bytes(
             next_reg_values,
             dst_operand,
-            extended_value,
-            True
+            extended_value
         )
         return (next_reg_values)
 
@@ -3117,38 +2785,24 @@ class StrandExecution:
         dst_operand = operand.value.reg
         return dst_operand
         
-    def get_src_reg_value(self, current_reg_values, src_operand, dtype='hex',
-                            carry_in=None, signed=None):
+    def get_src_reg_value(self, current_reg_values, src_operand, 
+                            carry_in=None, signed=False):
         if src_operand.type == ARM_OP_IMM:
-            src_value = src_operand.value.imm
-            if src_value < 0:
-                src_value = '{:08x}'.format(src_value & (2**32-1))
-            else:
-                src_value = np.uint32(src_value)
-                src_value = '{:08x}'.format(src_value & (2**32-1))
+            src_value = src_operand.value.imm & 0xFFFFFFFF
         elif src_operand.type == ARM_OP_REG:
             src_register = src_operand.value.reg
             if current_reg_values[src_register] == None:
                 return (None, None)
             src_value = self.get_register_bytes(
                 current_reg_values,
-                src_register,
-                dtype
+                src_register
             )
-            if src_register == ARM_REG_PC:
-                if type(src_value) is int:
-                    src_value = np.uint32(src_value)
         else:
             logging.critical('Non imm/reg src ' + instruction.op_str)
             return (None, None)
 
-        if carry_in == None:
-            src_value = utils.convert_type(src_value, dtype, signed=signed)        
-            return (src_value, carry_in)
-        
         carry = carry_in
-        if src_operand.shift.value != 0:
-            src_value = utils.convert_type(src_value, 'int', signed=signed)
+        if ((carry_in != None) and (src_operand.shift.value != 0)):
             shift_value = src_operand.shift.value
             shift_type = src_operand.shift.type
             if shift_type == ARM_SFT_ASR:
@@ -3163,9 +2817,9 @@ class StrandExecution:
                 (src_value, carry) = binops.rotate_right_with_extend(
                     src_value, carry_in
                 )
-        else:
-            carry = carry_in
-        src_value = utils.convert_type(src_value, dtype, signed=signed)        
+        if ((signed == True) and (src_value != None)):
+            if src_value & 0x80000000:
+                src_value = src_value - 0x100000000
         return (src_value, carry)
         
     def get_shift_value(self, current_reg_values, shift_operand):
@@ -3177,8 +2831,7 @@ class StrandExecution:
                 return None
             shift_value = self.get_register_bytes(
                 current_reg_values,
-                src_register,
-                'int'
+                src_register
             )
         else:
             logging.critical('Non imm src ' + instruction.op_str)
@@ -3209,8 +2862,7 @@ class StrandExecution:
                 return(src_memory_address, next_reg_values)
             base_value = self.get_register_bytes(
                 current_reg_values,
-                base_register,
-                'int'
+                base_register
             )
         
         # Register offset.
@@ -3225,8 +2877,7 @@ class StrandExecution:
                 
             offset_value = self.get_register_bytes(
                 current_reg_values,
-                index_register,
-                'int'
+                index_register
             )
             (offset_value, _) = binops.logical_shift_left(offset_value, lshift)
         # Immediate offset.
@@ -3242,20 +2893,21 @@ class StrandExecution:
             if post_index_reg != None:
                 (post_index_val, _) = self.get_src_reg_value(
                     next_reg_values,
-                    post_index_reg,
-                    'int'
+                    post_index_reg
                 )
                 register_wback += post_index_val
             if base_register != ARM_REG_PC:
                 next_reg_values = self.store_register_bytes(
                     next_reg_values,
                     base_register,
-                    '{0:08x}'.format(register_wback)
+                    register_wback
                 )
 
         return(src_memory_address, next_reg_values)
        
     def get_pc_value(self, ins_address):
+        if self.all_addresses is common_objs.all_addresses:
+            return common_objs.pc_address_index.get(ins_address)
         pc_address_1 = self.get_next_address(self.all_addresses, ins_address)
         pc_address = self.get_next_address(self.all_addresses, pc_address_1)
         return pc_address
@@ -3299,93 +2951,59 @@ class StrandExecution:
         # Default to RAM.
         return consts.ADDRESS_RAM
     
-    def get_register_bytes(self, registers, address, dtype='hex'):
+    def get_register_bytes(self, registers, address):
         value = None
         if address in registers:
             value = registers[address]
-        else:
-            return value
-            
-        # Type conversion
-        value = utils.convert_type(value, dtype)
         return value
         
     def get_value_from_memory(self, memory_map, address, 
-                                num_bytes=4, dtype='hex', unprocessed=False):
+                                num_bytes=4, unprocessed=False):
         address_type = self.get_address_type(address, memory_map)
         src_value = None
         if address_type == consts.ADDRESS_DATA:
-            src_value = self.get_data_bytes(address, num_bytes, dtype)
+            src_value = self.get_data_value(address, num_bytes)
         elif address_type == consts.ADDRESS_FIRMWARE:
-            src_value = utils.get_firmware_bytes(address, num_bytes, dtype)
+            src_value = utils.get_firmware_value(address, num_bytes)
         else:
             src_value = self.get_memory_bytes(
                 memory_map,
                 address,
                 num_bytes,
-                dtype,
                 unprocessed
             )
             
         # If we get unusable values, return all-0s.
         # This is EXTREMELY IMPORTANT! DO NOT MODIFY OR DELETE!
-        if (((src_value == None) 
-                or (src_value == '')) 
-                and (dtype == 'hex')):
+        if src_value == None:
             logging.debug('Returned value is empty or None.')
-            src_value = ''.zfill(num_bytes*2)
+            src_value = 0
         return (src_value)
         
-    def get_data_bytes(self, address, num_bytes=4, dtype='hex',
-            endian=common_objs.endian):
-        logging.debug(
-            'Getting ' 
-            + str(num_bytes)
-            + ' bytes from data region '
-            + ' starting at memory address '
-            + hex(address)
-        )
+    def get_data_value(self, address, num_bytes=4):
         offset = address - common_objs.data_segment_start_address
         address_in_firmware = \
             common_objs.data_segment_start_firmware_address + offset
-        logging.debug(
-            'Address '
-            + hex(address)
-            + ' translates to '
-            + hex(address_in_firmware)
-            + ' in firmware.'
-        )
-        value = utils.get_firmware_bytes(
-                    address_in_firmware, 
-                    num_bytes,
-                    endian='big'
-                )
-        if endian == 'little':
-            value = utils.reverse_bytes(utils.convert_type(value, 'bytes'))
-            value = utils.convert_type(value, 'hex')
-        logging.debug('Read bytes ' + value)
-        # Type conversion.
-        value = utils.convert_type(value, dtype)
+        value = utils.get_firmware_value(address_in_firmware, num_bytes)
         return value
-        
 
-    def get_memory_bytes(self, memory_map, address, num_bytes=4, dtype='hex', 
+    def get_memory_bytes(self, memory_map, address, num_bytes=4, 
                             unprocessed=False, endian=common_objs.endian):
         # If we want raw values, then use this.
         if unprocessed == True:
             value = self.get_unprocessed_memory_bytes(
                 memory_map,
                 address,
-                num_bytes,
-                dtype
+                num_bytes
             )
             return value
         
-        logging.debug(
-            'Reading ' + str(num_bytes) + ' bytes '
-            + 'from address ' + '{0:08x}'.format(address) 
-            + ' in memory'
-        )
+        if utils.is_log_enabled(logging.DEBUG):
+            logging.debug(
+                'Reading ' + str(num_bytes) + ' bytes '
+                + 'from address ' + '{0:08x}'.format(address) 
+                + ' in memory'
+            )
         # If the values are required by register_evaluator.
         if (num_bytes == 4):
             if (address%4 != 0):
@@ -3397,133 +3015,107 @@ class StrandExecution:
             value = self.get_memory_halfword(memory_map, address, endian)
         elif (num_bytes == 1):
             if address not in memory_map:
-                value = '00'
+                value = 0
             else:
                 value = memory_map[address]
         else:
             logging.error('Invalid number of bytes.')
-        value = utils.convert_type(value, dtype)
         return value
         
     def get_memory_word(self, memory_map, address, endian=common_objs.endian):
-        logging.debug(
-            'Reading word '
-            + 'from address ' + '{0:08x}'.format(address) 
-            + ' in memory'
-        )
-        if endian == None: endian = common_objs.endian
-        out_value = ''
-        for i in range(4):
-            if (address+i) in memory_map:
-                concat_value = memory_map[address+i]
-            else:
-                concat_value = '00'
-            if endian == 'little':
-                out_value = concat_value + out_value
-            else:
-                out_value = out_value + concat_value
-        return out_value
+        if utils.is_log_enabled(logging.DEBUG):
+            logging.debug(
+                'Reading word '
+                + 'from address ' + '{0:08x}'.format(address) 
+                + ' in memory'
+            )
+        return self.get_memory_value(memory_map, address, 4, endian)
         
     def get_memory_halfword(self, memory_map, address, endian=common_objs.endian):
-        logging.debug(
-            'Reading halfword '
-            + 'from address ' + '{0:08x}'.format(address) 
-            + ' in memory'
-        )
+        if utils.is_log_enabled(logging.DEBUG):
+            logging.debug(
+                'Reading halfword '
+                + 'from address ' + '{0:08x}'.format(address) 
+                + ' in memory'
+            )
+        return self.get_memory_value(memory_map, address, 2, endian)
+        
+    def get_memory_value(self, memory_map, address, num_bytes, 
+                            endian=common_objs.endian):
         if endian == None: endian = common_objs.endian
-        out_value = ''
-        for i in range(2):
+        out_value = 0
+        for i in range(num_bytes):
             if (address+i) in memory_map:
-                concat_value = memory_map[address+i]
+                byte_value = memory_map[address+i]
             else:
-                concat_value = '00'
+                byte_value = 0
             if endian == 'little':
-                out_value = concat_value + out_value
+                out_value = out_value | (byte_value << (8*i))
             else:
-                out_value = out_value + concat_value
+                out_value = (out_value << 8) | byte_value
         return out_value
     
-    def get_unprocessed_memory_bytes(self, memory_map, address, 
-                                        num_bytes=4, dtype='hex'):
-        logging.debug(
-            'Reading ' + str(num_bytes) + ' unprocessed bytes '
-            + 'from address ' + '{0:08x}'.format(address) 
-            + ' in memory'
-        )
-        out_value = ''
+    def get_unprocessed_memory_bytes(self, memory_map, address, num_bytes=4):
+        if utils.is_log_enabled(logging.DEBUG):
+            logging.debug(
+                'Reading ' + str(num_bytes) + ' unprocessed bytes '
+                + 'from address ' + '{0:08x}'.format(address) 
+                + ' in memory'
+            )
+        out_value = None
         for i in range(num_bytes):
-            if (address+i) in memory_map:
-                out_value = memory_map[address+i] + out_value
-            else:
+            if (address+i) not in memory_map:
                 break
+            if out_value == None: out_value = 0
+            out_value = out_value | (memory_map[address+i] << (8*i))
         return out_value
-    
-    def available_bytes_at_memory_location(self, memory_map, address, dtype):
-        temp_bytes = 0
-        if address in memory_map:
-            temp_value = memory_map[address]
-            if temp_value != None:
-                if dtype == 'hex':
-                    temp_value = utils.convert_type(temp_value, 'hex')
-                    temp_halfbytes = len(temp_value)
-                    temp_bytes = int(temp_halfbytes/2)
-        return temp_bytes
-
-    def store_register_bytes(self, registers, address, value, force_word_length=False):
+
+    def store_register_bytes(self, registers, address, value):
         if address not in registers:
             return registers
-        
-        value = utils.convert_type(value, 'hex')
-        if force_word_length == True: 
-            value = value.zfill(8)
-            value = value[-8:]
+        if value != None:
+            value = value & 0xFFFFFFFF
         registers[address] = value
         return registers
         
     def store_value_to_memory(self, value, address, memory_map, num_bytes):
-        value = utils.convert_type(value, 'hex')
-        if value == None:
-            value = '00' * num_bytes
-        value = value.zfill(2*num_bytes)
+        address_type = self.get_address_type(address, memory_map)
+        if address_type is consts.ADDRESS_FIRMWARE:
+            logging.critical(
+                'Memory address is within firmware address range: '
+                + '{0:08x}'.format(address)
+            )
+            return memory_map
 
+        if value == None:
+            value = 0
         for i in range(num_bytes):
-            byte0 = (i*-2) - 1
-            byte1 = (i*-2) - 2
-            concat = value[byte1] + value[byte0]
-            memory_map[address+i] = concat
+            memory_map[address+i] = (value >> (8*i)) & 0xFF
         
-        logging.debug(
-            'Storing data: ' 
-            + str(value) 
-            + ' to memory address: ' 
-            + hex(address)
-        )
+        if utils.is_log_enabled(logging.DEBUG):
+            logging.debug(
+                'Storing data: ' 
+                + hex(value) 
+                + ' to memory address: ' 
+                + hex(address)
+            )
         return memory_map
 
-    def store_memory_bytes(self, memory_map, address, value, 
-                               force_word_length=False):
-        value = utils.convert_type(value, 'hex')
-        if force_word_length == True: value = value.zfill(8)
-        
+    def store_memory_bytes(self, memory_map, address, value, num_bytes=4):
         if value == None:
-            memory_map[address] = '00'
+            memory_map[address] = 0
             return memory_map
             
-        if len(value) % 2 != 0:
-            value = '0' + value
-        num_bytes = int(len(value)/2)
         for i in range(num_bytes):
-            byte0 = (i*-2) - 1
-            byte1 = (i*-2) - 2
-            concat = value[byte1] + value[byte0]
-            memory_map[address+i] = concat
-        
-        logging.debug(
-            'Storing data: ' 
-            + str(value) 
-            + ' to memory address: ' 
-            + hex(address)
-        )                 
+            memory_map[address+i] = (value >> (8*i)) & 0xFF
+        
+        if utils.is_log_enabled(logging.DEBUG):
+            logging.debug(
+                'Storing data: ' 
+                + hex(value) 
+                + ' to memory address: ' 
+                + hex(address)
+            )                 
         return memory_map
 
     def process_memset(self, memory_map, register_object, memset_obj, address):
@@ -3539,8 +3131,6 @@ class StrandExecution:
                 or (length == None)):
             logging.warning('At least one of the 3 parameters is null.')
             return memory_map
-        if type(length) == str:
-            length = int(length, 16)
         if length == 0:
             logging.warning('memset len specified as 0 at ' + hex(address))
             return memory_map
@@ -3549,18 +3139,14 @@ class StrandExecution:
         # We choose the length as the maximum length specified in 
         #  COI definitions.
         if length > 125:
-            logging.debug(
-                'Over-large value for length '
-                + str(length)
-            )
+            if utils.is_log_enabled(logging.DEBUG):
+                logging.debug(
+                    'Over-large value for length '
+                    + str(length)
+                )
             return memory_map
-        value = utils.convert_type(value, 'hex')
-        value = value.zfill(8)
-        if value[0:6] != '000000':
+        if ((value < 0) or (value > 0xFF)):
             return memory_map
-        value = value[-2:]
-        if type(ptr_address) == str:
-            ptr_address = int(ptr_address, 16)
             
         address = ptr_address
         while length > 0:
@@ -3568,31 +3154,32 @@ class StrandExecution:
                 fill_length = length
             else:
                 fill_length = 4
-            mul_value = ''
+            mul_value = 0
             for i in range(fill_length):
-                mul_value += value
+                mul_value = (mul_value << 8) | value
             memory_map = self.store_memory_bytes(
                 memory_map,
                 address,
-                mul_value
+                mul_value,
+                fill_length
             )
             address = address + 4
             length = length - 4
         return memory_map
         
     def process_software_udiv(self, register_object):
-        numerator = utils.convert_type(register_object[ARM_REG_R0], 'int')
-        denominator = utils.convert_type(register_object[ARM_REG_R1], 'int')
+        numerator = register_object[ARM_REG_R0]
+        denominator = register_object[ARM_REG_R1]
         if ((numerator == None) or (denominator == None)):
             return register_object
         if denominator == 0:
-            register_object[ARM_REG_R1] = utils.convert_type(numerator, 'hex')
-            register_object[ARM_REG_R0] = '00000000'
+            register_object[ARM_REG_R1] = numerator
+            register_object[ARM_REG_R0] = 0
             return register_object
         quotient = numerator//denominator
         remainder = numerator%denominator
-        register_object[ARM_REG_R0] = utils.convert_type(quotient, 'hex')
-        register_object[ARM_REG_R1] = utils.convert_type(remainder, 'hex')
+        register_object[ARM_REG_R0] = quotient
+        register_object[ARM_REG_R1] = remainder
         return register_object
         
     # =======================================================================  
@@ -3602,6 +3189,10 @@ class StrandExecution:
         if address_obj == None: return None
         if ins_address == None: return None
         
+        # Use the address index where possible.
+        if address_obj is common_objs.all_addresses:
+            return common_objs.next_address_index.get(ins_address)
+        
         if type(address_obj) is dict:
             address_obj = list(address_obj.keys())
             address_obj.sort()
@@ -3622,7 +3213,9 @@ class StrandExecution:
         for address in memory:
             string_mem += hex(address)
             string_mem += ':'
-            value = utils.convert_type(memory[address], 'hex')
+            value = memory[address]
+            if value != None:
+                value = hex(value)
             string_mem += str(value)
             string_mem += ','
         string_mem += '}'
@@ -0,0 +1,241 @@
+import logging
+from argxtract.common import objects as common_objs
+
+
+class TraceTreeBuilder:
+    def __init__(self, max_nodes=None):
+        """Build the combined trace tree for COI call sites.
+
+        Call chains are followed backwards from each COI call site,
+        and each chain is added to the tree (from the outermost caller
+        inwards) as soon as it is complete, rather than being stored.
+        The tree is capped at max_nodes call sites (0 or None for no cap).
+        """
+        self.max_nodes = max_nodes
+        self.trace_tree = {}
+        self.num_nodes = 0
+        self.is_truncated = False
+        # Callers of each function block, as used for chains.
+        self.chain_callers = {}
+
+    def add_coi_call_sites(self, coi_name, call_sites):
+        """Add the chains for a COI, given (call site, function block) pairs.
+
+        Returns True if at least one chain was added for the COI.
+        """
+        is_chain_added = False
+        for (call_site, function_block) in sorted(set(call_sites)):
+            if self.is_truncated == True:
+                break
+            logging.trace(
+                'Getting chains for '
+                + hex(call_site)
+                + ' in function block '
+                + hex(function_block)
+            )
+            if self.add_call_site_chains(coi_name, call_site, function_block):
+                is_chain_added = True
+        return is_chain_added
+
+    def add_call_site_chains(self, coi_name, call_site, function_block):
+        is_chain_added = False
+        path = []
+        pending = [(call_site, function_block, 0)]
+        while pending != []:
+            (xref, function_block, depth) = pending.pop()
+            del path[depth:]
+            path.append((xref, function_block))
+
+            (is_chain_end, callers) = self.get_chain_callers(function_block)
+            for caller in callers:
+                # If this item is already in chain, then we would just
+                #  be looping over and over. Stop at this point instead.
+                if caller in path:
+                    is_chain_end = True
+                    continue
+                pending.append((caller[0], caller[1], depth+1))
+
+            if is_chain_end == False:
+                continue
+            if self.add_path(coi_name, path) == False:
+                return is_chain_added
+            is_chain_added = True
+        return is_chain_added
+
+    def get_chain_callers(self, function_block):
+        """Get whether a chain can end at a function block, and its callers.
+
+        Callers are (calling address, calling function block) pairs.
+        """
+        if function_block in self.chain_callers:
+            return self.chain_callers[function_block]
+
+        # If there are no calls to this function block, perhaps it's the
+        #  end of the chain, i.e., the starting point.
+        if function_block not in common_objs.function_blocks:
+            caller_sites = None
+        else:
+            caller_sites = \
+                common_objs.call_graph.get_caller_sites(function_block)
+        if caller_sites == None:
+            self.chain_callers[function_block] = (True, [])
+            return self.chain_callers[function_block]
+
+        reset_handler = common_objs.application_vector_table['reset']
+        is_chain_end = False
+        callers = set()
+        for (xref_from, caller_block) in caller_sites:
+            # If it's self-references, ignore.
+            if caller_block == function_block:
+                continue
+            # If it's the Reset Handler, end the chain here.
+            if caller_block == reset_handler:
+                is_chain_end = True
+                continue
+            callers.add((xref_from, caller_block))
+        self.chain_callers[function_block] = (is_chain_end, sorted(callers))
+        return self.chain_callers[function_block]
+
+    def get_chain_function_blocks(self, function_blocks):
+        """Get all function blocks that can appear in chains from the given ones."""
+        chain_function_blocks = list(function_blocks)
+        seen = set(function_blocks)
+        pending = list(function_blocks)
+        while pending != []:
+            function_block = pending.pop()
+            (is_chain_end, callers) = self.get_chain_callers(function_block)
+            for (xref_from, caller_block) in callers:
+                if caller_block in seen:
+                    continue
+                seen.add(caller_block)
+                chain_function_blocks.append(caller_block)
+                pending.append(caller_block)
+        return chain_function_blocks
+
+    def add_path(self, coi_name, path):
+        # Paths go from the COI call site outwards, whereas the tree
+        #  goes from the outermost caller inwards.
+        if self.max_nodes:
+            # Count the nodes that aren't already in the tree.
+            new_nodes = len(path)
+            level = self.trace_tree
+            for (ins_address, function_block) in reversed(path):
+                if function_block not in level:
+                    break
+                working_object = level[function_block]['branch_or_end_points']
+                if ins_address not in working_object:
+                    break
+                new_nodes -= 1
+                level = working_object[ins_address]['branch_target']
+            if (self.num_nodes + new_nodes) > self.max_nodes:
+                logging.warning(
+                    'Trace tree has reached the maximum size of '
+                    + str(self.max_nodes)
+                    + ' nodes. Remaining call chains will not be traced.'
+                )
+                self.is_truncated = True
+                return False
+
+        level = self.trace_tree
+        for (ins_address, function_block) in reversed(path):
+            if function_block not in level:
+                level[function_block] = {
+                    'branch_or_end_points': {}
+                }
+            working_object = level[function_block]['branch_or_end_points']
+            if ins_address not in working_object:
+                working_object[ins_address] = {
+                    'branch_target': {},
+                    'coi_name': None,
+                    'is_end': False
+                }
+                self.num_nodes += 1
+            level = working_object[ins_address]['branch_target']
+        working_object[ins_address]['is_end'] = True
+        working_object[ins_address]['coi_name'] = coi_name
+        return True
+
+    def get_sorted_trace_tree(self, level=None):
+        """Get the trace tree, ordered by address at every level."""
+        if level == None:
+            level = self.trace_tree
+        sorted_level = {}
+        for function_block in sorted(level):
+            working_object = level[function_block]['branch_or_end_points']
+            sorted_object = {}
+            for ins_address in sorted(working_object):
+                node = working_object[ins_address]
+                sorted_object[ins_address] = {
+                    'branch_target': 
+                        self.get_sorted_trace_tree(node['branch_target']),
+                    'coi_name': node['coi_name'],
+                    'is_end': node['is_end']
+                }
+            sorted_level[function_block] = {
+                'branch_or_end_points': sorted_object
+            }
+        return sorted_level
+
+    def annotate_trace_tree(self):
+        """Get the sorted trace tree, annotated for tracing.
+
+        Endpoints are given ids (epid<n>), and every trace object is given
+        a node_id. The endpoint ids under each trace object, and the parent
+        that each trace object returns to, are indexed by node id.
+        """
+        trace_tree = self.get_sorted_trace_tree()
+        self.num_endpoints = 0
+        self.endpoint_ids = []
+        self.return_parents = []
+        for function_block in trace_tree:
+            self.annotate_trace_object(
+                trace_tree[function_block],
+                None,
+                None,
+                {},
+                True
+            )
+        return trace_tree
+
+    def annotate_trace_object(self, trace_object, parent, branch_point,
+            ancestor_points, is_traced):
+        node_id = len(self.endpoint_ids)
+        trace_object['node_id'] = node_id
+        self.endpoint_ids.append([])
+
+        # Returns are resolved (top-down) to the first trace object
+        #  containing the branch point, so a trace object returns to its
+        #  parent only if no earlier ancestor contains the branch point.
+        # The parent's own points are counted in ancestor_points.
+        if ((parent != None) and (ancestor_points[branch_point] == 1)):
+            self.return_parents.append((parent, branch_point))
+        else:
+            self.return_parents.append(None)
+
+        points = trace_object['branch_or_end_points']
+        for ins_address in points:
+            ancestor_points[ins_address] = \
+                ancestor_points.get(ins_address, 0) + 1
+        endpoint_ids = []
+        for ins_address in points:
+            point = points[ins_address]
+            # Endpoints are not traced beyond.
+            if ((point['is_end'] == True) and (is_traced == True)):
+                point['id'] = 'epid' + str(self.num_endpoints)
+                self.num_endpoints += 1
+                endpoint_ids.append(point['id'])
+            for function_block in point['branch_target']:
+                target_endpoint_ids = self.annotate_trace_object(
+                    point['branch_target'][function_block],
+                    trace_object,
+                    ins_address,
+                    ancestor_points,
+                    ((is_traced == True) and (point['is_end'] == False))
+                )
+                if point['is_end'] == False:
+                    endpoint_ids.extend(target_endpoint_ids)
+        for ins_address in points:
+            ancestor_points[ins_address] -= 1
+
+        self.endpoint_ids[node_id] = endpoint_ids
+        return endpoint_ids
@@ -0,0 +1,125 @@
+import functools
+from capstone.arm import *
+from argxtract.core import consts
+from argxtract.common import objects as common_objs
+
+
+class TranslationCache:
+    # Step types that always end a block.
+    BLOCK_END_STEPS = [
+        consts.STEP_DATA,
+        consts.STEP_BRANCH,
+        consts.STEP_TABLE_BRANCH,
+        consts.STEP_IT
+    ]
+
+    def __init__(self, evaluator):
+        """Cache of translated basic blocks, by start address.
+
+        A block is a straight-line run of instructions, ending after a
+        branch, an instruction that writes to PC, or the end of code.
+        Each instruction is translated (once) into a step:
+            (address, PC value, step type, instruction, operation,
+                next address, whether PC is written)
+        The checks that don't depend on the trace state (errored, data
+        and skipped instructions, handler lookup, next address) are
+        resolved at translation time, and operations are instruction
+        handlers pre-bound to their instruction.
+        """
+        self.evaluator = evaluator
+        self.blocks = {}
+        self.steps = {}
+
+    def get_block(self, start_address):
+        block = self.blocks.get(start_address)
+        if block == None:
+            block = self.translate_block(start_address)
+            self.blocks[start_address] = block
+        return block
+
+    def translate_block(self, start_address):
+        code_end = common_objs.code_end_address
+        block = []
+        ins_address = start_address
+        while True:
+            step = self.get_step(ins_address)
+            block.append(step)
+            (step_type, next_address, writes_pc) = \
+                (step[2], step[5], step[6])
+            if step_type in self.BLOCK_END_STEPS:
+                break
+            if writes_pc == True:
+                break
+            if ((next_address == None) or (next_address > code_end)):
+                break
+            ins_address = next_address
+        return tuple(block)
+
+    def get_step(self, ins_address):
+        # Blocks may overlap (e.g., when branching into the middle
+        #  of one), so steps are shared between blocks.
+        step = self.steps.get(ins_address)
+        if step == None:
+            step = self.translate_instruction(ins_address)
+            self.steps[ins_address] = step
+        return step
+
+    def translate_instruction(self, ins_address):
+        evaluator = self.evaluator
+        pc_value = evaluator.get_pc_value(ins_address)
+        next_address = evaluator.get_next_address(
+            evaluator.all_addresses,
+            ins_address
+        )
+        writes_pc = evaluator.check_pc_written(ins_address)
+
+        instruction = None
+        operation = None
+        # Same order of checks as for interpreted instructions.
+        if ins_address in common_objs.errored_instructions:
+            step_type = consts.STEP_ERRORED
+        elif common_objs.disassembled_firmware[ins_address]['is_data'] == True:
+            step_type = consts.STEP_DATA
+        elif evaluator.check_skip_instruction(ins_address) == True:
+            step_type = consts.STEP_SKIP
+        else:
+            instruction = common_objs.disassembled_firmware[ins_address]['insn']
+            opcode_id = instruction.id
+            if opcode_id in [ARM_INS_B, ARM_INS_BL, ARM_INS_BLX, ARM_INS_BX,
+                    ARM_INS_CBNZ, ARM_INS_CBZ]:
+                step_type = consts.STEP_BRANCH
+            elif opcode_id in [ARM_INS_TBB, ARM_INS_TBH]:
+                step_type = consts.STEP_TABLE_BRANCH
+            elif opcode_id == ARM_INS_IT:
+                step_type = consts.STEP_IT
+            else:
+                step_type = consts.STEP_EXECUTE
+                operation = self.translate_operation(ins_address, instruction)
+        return (ins_address, pc_value, step_type, instruction, operation,
+                    next_address, writes_pc)
+
+    def translate_operation(self, ins_address, instruction):
+        """Bind an instruction's handler to the instruction.
+
+        Operations take (register_object, memory_map, trace_obj,
+        current_path, condition_flags, null_registers) and return
+        (register_object, memory_map, condition_flags, null_registers).
+        """
+        evaluator = self.evaluator
+        instruction_handler = evaluator.instruction_handlers.get(
+            instruction.id,
+            evaluator.execute_unhandled_instruction
+        )
+        operation = functools.partial(
+            instruction_handler,
+            ins_address,
+            instruction
+        )
+        # Conditionally executed instructions check the condition first.
+        if ((instruction.cc == ARM_CC_AL) or (instruction.cc == ARM_CC_INVALID)):
+            return operation
+        return functools.partial(
+            evaluator.execute_conditional_instruction,
+            instruction.cc,
+            operation
+        )
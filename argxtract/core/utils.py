@@ -1,6 +1,7 @@
 import os
 import sys
 import struct
+import bisect
 import logging
 import numpy as np
 from capstone.arm import *
@@ -9,40 +10,78 @@ from argxtract.core import consts
 from argxtract.common import objects as common_objs
 
 
+def build_function_block_index():
+    # Function blocks are looked up for every branch, xref and chain step,
+    #  so keep their start addresses sorted (for bisect) and 
+    #  their end addresses precomputed.
+    function_block_starts = sorted(common_objs.function_blocks.keys())
+    function_block_ends = {}
+    for idx, function_block_start in enumerate(function_block_starts):
+        if idx < (len(function_block_starts)-1):
+            block_end = get_previous_address(
+                common_objs.all_addresses,
+                function_block_starts[idx+1]
+            )
+        else:
+            block_end = common_objs.code_end_address
+        function_block_ends[function_block_start] = block_end
+    common_objs.function_block_starts = function_block_starts
+    common_objs.function_block_ends = function_block_ends
+    
 def id_function_block_for_instruction(ins_address):
-    function_block_starts = list(common_objs.function_blocks.keys())
-    function_block_starts.sort()
-    if ins_address in function_block_starts:
+    function_block_starts = common_objs.function_block_starts
+    if ins_address in common_objs.function_block_ends:
         return ins_address
     
-    len_function_starts = len(function_block_starts)        
-    closest = function_block_starts[min(range(len_function_starts),
-        key = lambda i: abs(function_block_starts[i]-ins_address))]
-        
-    if closest <= ins_address:
-        return closest
-
-    index_of_closest = function_block_starts.index(closest)
+    # Get the closest function block start at or below the address.
+    index = bisect.bisect_right(function_block_starts, ins_address) - 1
     # Make sure we don't loop backwards to end.
-    minimum_possible_address = function_block_starts[0]
-    if ((index_of_closest - 1) < 0):
-        block_start = minimum_possible_address
-    else:
-        block_start = function_block_starts[index_of_closest - 1]
-    return block_start
+    if index < 0:
+        index = 0
+    return function_block_starts[index]
     
 def id_function_block_end(function_block_start):
-    all_addresses = list(common_objs.disassembled_firmware.keys())
-    all_addresses.sort()
-    function_block_starts = list(common_objs.function_blocks.keys())
-    curr_index = function_block_starts.index(function_block_start)
-    if curr_index < (len(function_block_starts)-1):
-        next_function_start = (function_block_starts[curr_index+1])
-        next_function_index = all_addresses.index(next_function_start)
-        block_end = all_addresses[next_function_index-1]
-    else:
-        block_end = common_objs.code_end_address
-    return block_end
+    return common_objs.function_block_ends[function_block_start]
+    
+def build_address_index():
+    # Instruction addresses don't change once links have been annotated,
+    #  so we sort them once and index next/previous/PC addresses,
+    #  rather than searching a sorted list for every lookup.
+    all_addresses = []
+    for address in sorted(common_objs.disassembled_firmware.keys()):
+        if address < common_objs.app_code_base:
+            continue
+        all_addresses.append(address)
+        
+    next_address_index = {}
+    previous_address_index = {}
+    previous_address = None
+    for address in all_addresses:
+        previous_address_index[address] = previous_address
+        if previous_address != None:
+            next_address_index[previous_address] = address
+        previous_address = address
+    if previous_address != None:
+        next_address_index[previous_address] = None
+    
+    # PC is the address of the instruction after the next one.
+    pc_address_index = {}
+    for address in all_addresses:
+        next_address = next_address_index[address]
+        if next_address == None:
+            pc_address_index[address] = None
+        else:
+            pc_address_index[address] = next_address_index[next_address]
+    
+    common_objs.all_addresses = all_addresses
+    common_objs.next_address_index = next_address_index
+    common_objs.previous_address_index = previous_address_index
+    common_objs.pc_address_index = pc_address_index
+    
+def is_log_enabled(level):
+    # Used to avoid building expensive log messages (e.g., instruction 
+    #  listings or memory dumps) that would only be discarded.
+    return logging.getLogger().isEnabledFor(level)
     
 def sort_dict_keys(dictionary):
     keys = list(dictionary.keys())
@@ -150,26 +189,6 @@ def convert_type(value, dtype, byte_length='default', signed=None):
             )
     return value
     
-def get_bit_length(value):
-    bit_length = None
-    if ((type(value) is np.uint32) or (type(value) is np.int32)):
-        bit_length = 32
-    elif ((type(value) is np.uint16) or (type(value) is np.int16)):
-        bit_length = 16
-    elif ((type(value) is np.uint8) or (type(value) is np.int8)):
-        bit_length = 8
-    elif (type(value) is str):
-        if len(value) == 8:
-            bit_length = 32
-        elif len(value) == 4:
-            bit_length = 16
-        elif len(value) == 2:
-            bit_length = 8
-    if bit_length == None: 
-        print(type(value))
-        logging.error('WHAT')
-    return bit_length
-    
 def get_binary_representation(value, length):
     if value == None: return None
     if type(value) is str:
@@ -179,34 +198,6 @@ def get_binary_representation(value, length):
         binary = np.binary_repr(value, width=length)
     return binary          
     
-def convert_bits_to_type(bitstring, dtype):
-    if ((dtype is str) or (dtype == 'hex')):
-        new_value = '%0*x' % ((len(bitstring) + 3) // 4, int(bitstring, 2))
-    else:
-        if dtype == np.int8:
-            try:
-                decimal_value = np.int8(int(bitstring, 2))
-            except:
-                decimal_value = np.uint8(int(bitstring, 2))
-        elif dtype == np.uint8:
-            decimal_value = np.uint8(int(bitstring, 2))
-        elif dtype == np.int16:
-            try:
-                decimal_value = np.int16(int(bitstring, 2))
-            except:
-                decimal_value = np.uint16(int(bitstring, 2))
-        elif dtype == np.uint16:
-            decimal_value = np.uint16(int(bitstring, 2))
-        elif dtype == np.int32:
-            try:
-                decimal_value = np.int32(int(bitstring, 2))
-            except:
-                decimal_value = np.uint32(int(bitstring, 2))
-        elif dtype == np.uint32:
-            decimal_value = np.uint32(int(bitstring, 2))
-        new_value = decimal_value.astype(dtype)
-    return new_value
-    
 def reverse_bytes(bytes):
     hex_bytes = bytes.hex()
     ba = bytearray.fromhex(hex_bytes)
@@ -215,32 +206,6 @@ def reverse_bytes(bytes):
     reversed_bytes = bytes.fromhex(reversed_hex)
     return reversed_bytes
 
-def get_numpy_type(values):
-    dtype = np.int8
-    for value in values:
-        val_type = type(value)
-        if dtype == np.int8:
-            dtype = val_type
-        elif dtype == np.uint8:
-            if val_type == np.int8:
-                continue
-            dtype = val_type
-        elif dtype == np.int16:
-            if ((val_type == np.int8) 
-                    or (val_type == np.uint8)):
-                continue
-            dtype = val_type
-        elif dtype == np.uint16:
-            if ((val_type == np.int8) 
-                    or (val_type == np.uint8) 
-                    or (val_type == np.int16)):
-                continue
-            dtype = val_type
-        elif dtype == np.int32:
-            if val_type == np.uint32:
-                dtype = val_type
-    return dtype
-    
 def get_firmware_bytes(address, num_bytes=4, dtype='hex', 
         endian=common_objs.endian):
     address = address - common_objs.disassembly_start_address
@@ -278,6 +243,59 @@ def get_firmware_bytes(address, num_bytes=4, dtype='hex',
     # Type conversion.
     value = convert_type(value, dtype)
     return value
+
+def get_firmware_value(address, num_bytes=4, endian=common_objs.endian):
+    address = address - common_objs.disassembly_start_address
+    data_bytes = common_objs.core_bytes[address:(address+num_bytes)]
+    if len(data_bytes) == 0:
+        return None
+    value = int.from_bytes(data_bytes, byteorder=endian)
+    return value
+
+def build_instruction_table():
+    # An array summary of the disassembled firmware, which allows the scan
+    #  for the previous valid instruction to be vectorised. 
+    # Instructions, xrefs, etc. are still held in the disassembled 
+    #  firmware object.
+    base = common_objs.disassembly_start_address
+    addresses = sorted(common_objs.disassembled_firmware.keys())
+    if addresses == []:
+        length = 0
+    else:
+        length = get_instruction_table_index(addresses[-1]) + 1
+    instruction_table = {
+        'is_valid': np.zeros(length, dtype=bool),
+        'is_nop': np.zeros(length, dtype=bool)
+    }
+    errored_instructions = set(common_objs.errored_instructions)
+    for address in addresses:
+        if address < base:
+            continue
+        entry = common_objs.disassembled_firmware[address]
+        if entry['is_data'] == True:
+            continue
+        insn = entry['insn']
+        if ((insn == None) or (insn.id == ARM_INS_INVALID)):
+            continue
+        index = get_instruction_table_index(address)
+        # Same conditions as is_valid_code_address.
+        if address not in errored_instructions:
+            instruction_table['is_valid'][index] = True
+        # NOPs, including moves from a register to itself.
+        if insn.id == ARM_INS_NOP:
+            instruction_table['is_nop'][index] = True
+        elif insn.id in [ARM_INS_MOV, ARM_INS_MOVT, ARM_INS_MOVW]:
+            operands = insn.operands
+            if len(operands) == 2:
+                if operands[0].value.reg == operands[1].value.reg:
+                    instruction_table['is_nop'][index] = True
+    common_objs.instruction_table = instruction_table
+    
+def get_instruction_table_index(address):
+    return (address - common_objs.disassembly_start_address) // 2
+    
+def get_instruction_table_address(index):
+    return common_objs.disassembly_start_address + (2 * index)
     
 def get_next_address(list_obj, item):
     if list_obj == None: return None
@@ -286,6 +304,17 @@ def get_next_address(list_obj, item):
     if type(list_obj) is dict:
         list_obj = list(list_obj.keys())
         list_obj.sort()
+    
+    # Use the address index where possible.
+    if list_obj is common_objs.all_addresses:
+        if item in common_objs.next_address_index:
+            return common_objs.next_address_index[item]
+        logging.trace('Item not in list. Estimating position.')
+        position = bisect.bisect_left(list_obj, item)
+        if ((position == 0) or (position == len(list_obj))):
+            logging.trace('Item not in list. Returning None.')
+            return None
+        return list_obj[position]
             
     if item not in list_obj:
         logging.trace('Item not in list. Estimating position.')
@@ -309,6 +338,12 @@ def get_previous_address(address_obj, address):
     if address_obj == None: return None
     if address == None: return None
     
+    # Use the address index where possible.
+    if address_obj is common_objs.all_addresses:
+        if address in common_objs.previous_address_index:
+            return common_objs.previous_address_index[address]
+        return get_previous_partial_address(address_obj, address)
+    
     if address in address_obj:
         index = address_obj.index(address)
         if index == 0:
@@ -324,6 +359,10 @@ def get_previous_address(address_obj, address):
 def get_previous_partial_address(address_obj, address):
     if address_obj == None: return None
     if address == None: return None
+    
+    # Dictionary lookups are faster than list searches.
+    if address_obj is common_objs.all_addresses:
+        address_obj = common_objs.previous_address_index
         
     if address not in address_obj:
         for i in range(1,4):
@@ -0,0 +1,237 @@
+"""Time the tracers at different log levels.
+
+Analyses a firmware file (by default, examples/nordic_ble) at each log
+level, and reports the total analysis time along with the time spent
+within the register tracer and the strand tracer. As the COI traces of
+the example are short, the register tracer is then also run from every
+function block, with each trace stopped after a fixed number of queued
+states (rather than after a time limit), so that runs are comparable.
+
+Log records are written to os.devnull, so that the timings reflect the
+cost of building log messages rather than that of printing them.
+
+Usage: python benchmarks/trace_logging.py [-f FILE] [-v VENDOR] 
+            [-r REPEAT] [-s STATES]
+"""
+import os
+import sys
+import shutil
+import timeit
+import logging
+import argparse
+
+base_path = os.path.abspath(
+    os.path.join(os.path.dirname(os.path.realpath(__file__)), '..')
+)
+sys.path.insert(0, base_path)
+
+from argxtract.core import utils
+from argxtract.core import consts
+from argxtract.common import objects as common_objs
+from argxtract.core.trace_tree import TraceTreeBuilder
+from argxtract.core.analyser import FirmwareAnalyser
+from argxtract.core.register_evaluator import RegisterEvaluator
+from argxtract.core.strand_execution import StrandExecution
+
+
+LOG_LEVELS = [
+    ('INFO', logging.INFO),
+    ('DEBUG', logging.DEBUG)
+]
+
+
+class TraceTimer:
+    def __init__(self):
+        """Accumulate the time spent within a (possibly nested) method."""
+        self.elapsed_time = 0
+        self.depth = 0
+
+    def wrap(self, method):
+        def timed_method(*args, **kwargs):
+            if self.depth == 0:
+                start_time = timeit.default_timer()
+            self.depth += 1
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.depth -= 1
+                if self.depth == 0:
+                    self.elapsed_time += timeit.default_timer() - start_time
+        return timed_method
+
+
+class CappedRegisterEvaluator(RegisterEvaluator):
+    def __init__(self, max_states):
+        """Register evaluator that stops each trace after max_states states."""
+        RegisterEvaluator.__init__(self)
+        self.max_states = max_states
+        self.num_states = 0
+
+    def queue_handler(self):
+        # Called once per start point.
+        self.num_states = 0
+        RegisterEvaluator.queue_handler(self)
+
+    def handle_queue(self):
+        self.num_states += 1
+        RegisterEvaluator.handle_queue(self)
+
+    def time_check(self):
+        return (self.num_states >= self.max_states)
+
+
+class NullCoiProcessor:
+    def process_trace_output(self, trace_output):
+        # Carry on with the memory as it was at the endpoint.
+        coi_name = list(trace_output.keys())[0]
+        return trace_output[coi_name]['memory'].fork()
+
+
+def run_function_block_traces(max_states, timers):
+    """Trace from every function block, to its last instruction."""
+    trace_tree_builder = TraceTreeBuilder()
+    for function_block in sorted(common_objs.function_blocks):
+        end_address = utils.id_function_block_end(function_block)
+        if ((end_address == None) or (end_address == function_block)):
+            continue
+        trace_tree_builder.add_path(
+            'fblock_' + hex(function_block),
+            [(end_address, function_block)]
+        )
+    trace_tree = trace_tree_builder.annotate_trace_tree()
+    
+    timers['register'].elapsed_time = 0
+    register_evaluator = CappedRegisterEvaluator(max_states)
+    register_evaluator.estimate_reg_values_for_trace_object(
+        trace_tree,
+        NullCoiProcessor(),
+        trace_tree_builder
+    )
+    return timers['register'].elapsed_time
+
+
+def run_analysis(fw_file, vendor, loglevel, timers):
+    firmware_analyser = FirmwareAnalyser(
+        consts.MODE_SVC,
+        vendor,
+        common_objs.max_time,
+        common_objs.per_trace_max_time,
+        None,
+        common_objs.max_call_depth,
+        loglevel,
+        common_objs.null_value_handling,
+        False,
+        0
+    )
+    for timer in timers.values():
+        timer.elapsed_time = 0
+    start_time = timeit.default_timer()
+    output = firmware_analyser.analyse_firmware(fw_file)
+    total_time = timeit.default_timer() - start_time
+    if output == None:
+        logging.critical('Analysis failed for ' + fw_file)
+    return (
+        total_time,
+        timers['register'].elapsed_time,
+        timers['strand'].elapsed_time
+    )
+
+
+def main():
+    argparser = argparse.ArgumentParser(
+        description = 'Time the tracers at different log levels.'
+    )
+    argparser.add_argument(
+        '-f',
+        '--file',
+        type = str,
+        default = os.path.join(
+            base_path, 'examples', 'nordic_ble', 'nordic_ble.bin'
+        ),
+        help = 'firmware file to be analysed.'
+    )
+    argparser.add_argument(
+        '-v',
+        '--vendor',
+        type = str,
+        default = 'nordic_ble',
+        help = 'the vendor/chipset to test against.'
+    )
+    argparser.add_argument(
+        '-r',
+        '--repeat',
+        type = int,
+        default = 3,
+        help = 'number of runs per log level (the fastest is reported).'
+    )
+    argparser.add_argument(
+        '-s',
+        '--states',
+        type = int,
+        default = 1000,
+        help = 'number of queued states per function block trace.'
+    )
+    args = argparser.parse_args()
+
+    # Time the tracers' entry points.
+    timers = {
+        'register': TraceTimer(),
+        'strand': TraceTimer()
+    }
+    RegisterEvaluator.trace_register_values = timers['register'].wrap(
+        RegisterEvaluator.trace_register_values
+    )
+    StrandExecution.trace_register_values = timers['strand'].wrap(
+        StrandExecution.trace_register_values
+    )
+
+    # Discard log output.
+    null_stream = open(os.devnull, 'w')
+    for handler in logging.getLogger().handlers:
+        handler.setStream(null_stream)
+
+    # The analyser keeps its working files in tmp.
+    tmp_path = os.path.join(base_path, 'tmp')
+    created_tmp = (not os.path.isdir(tmp_path))
+    os.makedirs(tmp_path, exist_ok=True)
+
+    print('File: ' + args.file)
+    print(
+        '{0:<8}{1:>12}{2:>18}{3:>16}{4:>24}'.format(
+            'level', 'total (s)', 'register (s)', 'strand (s)', 
+            'fblock traces (s)'
+        )
+    )
+    try:
+        for (level_name, loglevel) in LOG_LEVELS:
+            runs = []
+            for i in range(args.repeat):
+                (total_time, register_time, strand_time) = run_analysis(
+                    args.file,
+                    args.vendor,
+                    loglevel,
+                    timers
+                )
+                function_block_time = run_function_block_traces(
+                    args.states,
+                    timers
+                )
+                runs.append((total_time, register_time, strand_time,
+                                function_block_time))
+            print(
+                '{0:<8}{1:>12.2f}{2:>18.2f}{3:>16.2f}{4:>24.2f}'.format(
+                    level_name, 
+                    min([run[0] for run in runs]),
+                    min([run[1] for run in runs]),
+                    min([run[2] for run in runs]),
+                    min([run[3] for run in runs])
+                )
+            )
+    finally:
+        null_stream.close()
+        if created_tmp == True:
+            shutil.rmtree(tmp_path)
+
+
+if __name__ == '__main__':
+    main()
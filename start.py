@@ -5,11 +5,12 @@ import shutil
 import hashlib
 import logging
 import argparse
-from time import sleep
+from time import time
 from argxtract.common import objects as common_objs
 from argxtract.core import consts
 from argxtract.core.analyser import FirmwareAnalyser
-from multiprocessing import Process, JoinableQueue, active_children
+from multiprocessing import Process, Pipe
+from multiprocessing.connection import wait
 
 
 class argxtract:
@@ -18,11 +19,16 @@ class argxtract:
         self.function_folder = None
         self.mode = consts.MODE_SVC
         self.processes = 1
+        self.pattern_processes = 1
         self.bypass = False
         self.max_time = common_objs.max_time
         self.per_trace_max_time = common_objs.per_trace_max_time
         self.max_call_depth = common_objs.max_call_depth
         self.null_handling = common_objs.null_value_handling
+        self.queue_memory = common_objs.trace_queue_max_memory
+        self.tree_size = common_objs.max_trace_tree_size
+        self.kill_time = 0
+        self.cache_folder = None
         self.app_code_base = None
         self.core_file_list = []
         self.loglevel = logging.INFO
@@ -123,7 +129,9 @@ class argxtract:
             '--processes',
             type = int,
             action = 'store',
-            help = 'number of parallel processes ("threads") to use.'
+            help = 'number of parallel processes ("threads") to use. '
+                   + 'Processes not needed for analysing files are used '
+                   + 'for function pattern matching.'
         )
         self.argparser.add_argument(
             '-F',
@@ -158,6 +166,39 @@ class argxtract:
                    + 'l (loose - keep track when LDR attempts to load from outside RAM), '
                    + 's (strict - keep track when LDR attempts to load from any inaccessible memory location).'
         )
+        self.argparser.add_argument(
+            '-q',
+            '--queue_memory',
+            type = int,
+            action = 'store',
+            help = 'memory (in MB) to use for pending trace states '
+                   + 'before writing them to file. 0 writes all to file.'
+        )
+        self.argparser.add_argument(
+            '-s',
+            '--tree_size',
+            type = int,
+            action = 'store',
+            help = 'maximum number of call sites in the trace tree '
+                   + 'built from COI call chains. 0 removes the limit.'
+        )
+        self.argparser.add_argument(
+            '-k',
+            '--kill_time',
+            type = int,
+            action = 'store',
+            help = 'hard time limit per file in seconds, when using multiple '
+                   + 'processes. The process analysing a file for longer '
+                   + 'than this is killed and replaced. 0 (default) disables it.'
+        )
+        self.argparser.add_argument(
+            '-C',
+            '--Cache',
+            type = str,
+            action = 'store',
+            help = 'folder in which to cache disassembled firmware, '
+                   + 'so that re-analysing a file skips disassembly.'
+        )
         
     def check_args(self):
         args = self.argparser.parse_args()
@@ -292,6 +333,24 @@ class argxtract:
         if args.bypass:
             self.bypass = True
             
+        if args.queue_memory != None:
+            if args.queue_memory >= 0:
+                self.queue_memory = args.queue_memory
+                
+        if args.tree_size != None:
+            if args.tree_size >= 0:
+                self.tree_size = args.tree_size
+                
+        if args.kill_time != None:
+            if args.kill_time >= 0:
+                self.kill_time = args.kill_time
+                
+        if args.Cache:
+            if (not (os.path.isdir(args.Cache))):
+                print('Cache folder does not exist!')
+                sys.exit(0)
+            self.cache_folder = args.Cache
+            
         if ((self.max_time == 0) and (self.per_trace_max_time == 0)):
             self.max_time = common_objs.max_time
             
@@ -315,14 +374,21 @@ class argxtract:
         else:
             logging.debug('Deleting previous tmp directory.')
             shutil.rmtree('tmp')
-            sleep(2)
-            os.mkdir('tmp')
+            os.makedirs('tmp', exist_ok=True)
         
         # Create output folder.
         if (not (os.path.isdir('output'))):
             logging.info('Creating output directory.')
             os.mkdir('output')
             
+        # With fewer files than processes, the remaining processes are 
+        #  shared out for function pattern matching within each file.
+        if len(self.core_file_list) > 0:
+            self.pattern_processes = max(
+                1, 
+                self.processes // len(self.core_file_list)
+            )
+            
         if self.processes == 1:
             self.execute_single_process()
         else:
@@ -343,7 +409,11 @@ class argxtract:
             self.loglevel,
             self.null_handling,
             self.bypass,
-            0
+            0,
+            self.queue_memory,
+            self.cache_folder,
+            self.pattern_processes,
+            self.tree_size
         )
         outfile = open('status.csv', 'w')
         for fw_file in self.core_file_list:
@@ -378,118 +448,159 @@ class argxtract:
         self.loglevel = logging.CRITICAL
         logging.getLogger().setLevel(logging.CRITICAL)
         
-        length_fw_list = int(len(self.core_file_list)/self.processes)
         print(
             "Total number of FW files: " 
             + str(len(self.core_file_list)) 
-            + "\nNumber of files per thread:"
-            + str(length_fw_list)
+            + "\nNumber of processes: "
+            + str(self.processes)
         )
-    
-        #Create queues for sending jobs to worker threads and receiving results from them.
-        process_send_queue = JoinableQueue()
-        process_receive_queue = JoinableQueue() 
         
-        num_processes = 0
-        process_list = []
+        # Each worker gets its own pipe, so that we always know which file 
+        #  a worker is analysing, and so that killing a hung worker 
+        #  cannot corrupt a queue shared with the other workers.
+        self.workers = {}
+        self.num_processes = 0
+        pending_files = list(self.core_file_list)
+        pending_files.reverse()
+        for i in range(0, min(self.processes, len(pending_files))):
+            self.start_worker()
         
-        #Create worker processes.
-        for i in range(0, self.processes):
-            workerx = argxtractWorker(
-                self.mode,
-                self.vendor, 
-                self.max_time,
-                self.per_trace_max_time,
-                self.function_folder,
-                self.max_call_depth,
-                self.loglevel,
-                self.null_handling,
-                self.bypass,
-                self.app_code_base
-            )
-            worker = Process(
-                target=workerx.main,
-                args=(
-                    process_send_queue,
-                    process_receive_queue,
-                    num_processes
-                )
-            )
-            worker.start()
-            process_list.append(worker)
-            num_processes+=1
-            
-        #Send jobs to worker processes.
-        for fw_file in self.core_file_list:
-            process_send_queue.put(fw_file)
-            
-        completed_apk_count = 0
+        completed_fw_count = 0
         outfile = open('status.csv', 'w')
         
-        while True:
-            #Get and process information sent by worker process.
-            result = process_receive_queue.get()
-            process_receive_queue.task_done()
-            
-            # Log, etc.
-            split_result = result.split(',')
-            filename = split_result[0]
-            print('Finished analysing ' + filename)
-            if len(split_result) > 1:
-                status = split_result[1]
-            else:
-                status = 'Completed'
-            if len(split_result) > 2:
-                error = split_result[2]
-            else:
-                error = 'None'
-            outfile.write(filename + ',' + status + ',' + error + '\n')
-            outfile.flush()
-            
-            #Check if any processes have become zombies.
-            if len(active_children()) < self.processes:
-                for p in process_list:
-                    if not p.is_alive():
-                        process_list.remove(p)
-                        # Create replacement worker.
-                        workerx = argxtractWorker(
-                            self.mode,
-                            self.vendor, 
-                            self.max_time,
-                            self.per_trace_max_time,
-                            self.function_folder,
-                            self.max_call_depth,
-                            self.loglevel,
-                            self.null_handling,
-                            self.bypass,
-                            self.app_code_base
-                        )
-                        worker = Process(
-                            target=workerx.main, 
-                            args=(
-                                process_send_queue,
-                                process_receive_queue,
-                                num_processes
-                            )
+        while completed_fw_count < len(self.core_file_list):
+            # Send jobs to idle worker processes.
+            for process_id in self.workers:
+                worker = self.workers[process_id]
+                if ((worker['file'] != None) or (pending_files == [])):
+                    continue
+                worker['file'] = pending_files.pop()
+                worker['start'] = time()
+                worker['connection'].send(worker['file'])
+                
+            # Get and process results as they are sent by worker processes.
+            connections = {
+                self.workers[process_id]['connection']:process_id
+                    for process_id in self.workers
+            }
+            results = []
+            for connection in wait(list(connections.keys()), timeout=1):
+                worker = self.workers[connections[connection]]
+                try:
+                    result = connection.recv()
+                except EOFError:
+                    # The worker has died. This is handled below.
+                    continue
+                results.append(result)
+                worker['file'] = None
+                worker['start'] = None
+                
+            # Check for workers that have crashed or exceeded the time limit.
+            for process_id in list(self.workers.keys()):
+                worker = self.workers[process_id]
+                if not worker['process'].is_alive():
+                    if worker['file'] != None:
+                        results.append(
+                            worker['file'] 
+                            + ',Crashed,Exit code ' 
+                            + str(worker['process'].exitcode)
                         )
-                        worker.start()
-                        process_list.append(worker)
-                        num_processes+=1
-
-            #Check if all APKs have been analysed.
-            completed_apk_count+=1
-            if completed_apk_count == len(self.core_file_list):
-                break
+                elif ((worker['file'] != None) and (self.kill_time > 0) 
+                        and ((time() - worker['start']) > self.kill_time)):
+                    self.kill_worker(process_id)
+                    results.append(
+                        worker['file'] 
+                        + ',Timeout,Killed after ' 
+                        + str(self.kill_time) 
+                        + 's'
+                    )
+                else:
+                    continue
+                # Replace the worker.
+                self.stop_worker(process_id)
+                if pending_files != []:
+                    self.start_worker()
+            
+            for result in results:
+                # Log, etc.
+                split_result = result.split(',')
+                filename = split_result[0]
+                print('Finished analysing ' + filename)
+                if len(split_result) > 1:
+                    status = split_result[1]
+                else:
+                    status = 'Completed'
+                if len(split_result) > 2:
+                    error = split_result[2]
+                else:
+                    error = 'None'
+                outfile.write(filename + ',' + status + ',' + error + '\n')
+                outfile.flush()
+                completed_fw_count+=1
                 
         print("All done")
-        # Tell child processes to stop
-        for i in range(self.processes):
-            process_send_queue.put('STOP')
+        # Tell child processes to stop.
+        for process_id in list(self.workers.keys()):
+            self.workers[process_id]['connection'].send('STOP')
+            self.stop_worker(process_id)
+        outfile.close()
+        
+    def start_worker(self):
+        workerx = argxtractWorker(
+            self.mode,
+            self.vendor, 
+            self.max_time,
+            self.per_trace_max_time,
+            self.function_folder,
+            self.max_call_depth,
+            self.loglevel,
+            self.null_handling,
+            self.bypass,
+            self.app_code_base,
+            self.queue_memory,
+            self.cache_folder,
+            self.pattern_processes,
+            self.tree_size
+        )
+        (parent_connection, child_connection) = Pipe()
+        worker = Process(
+            target=workerx.main,
+            args=(
+                child_connection,
+                self.num_processes
+            )
+        )
+        worker.start()
+        # The child end is only needed by the worker.
+        child_connection.close()
+        self.workers[self.num_processes] = {
+            'process': worker,
+            'connection': parent_connection,
+            'file': None,
+            'start': None
+        }
+        self.num_processes+=1
+        
+    def kill_worker(self, process_id):
+        process = self.workers[process_id]['process']
+        # Terminate first, so that the worker can stop any processes 
+        #  of its own (i.e., for pattern matching). 
+        # Only kill it if it doesn't stop.
+        process.terminate()
+        process.join(consts.WORKER_TERMINATE_TIMEOUT)
+        if process.is_alive():
+            process.kill()
+        
+    def stop_worker(self, process_id):
+        worker = self.workers.pop(process_id)
+        worker['process'].join()
+        worker['connection'].close()
             
 
 class argxtractWorker:
     def __init__(self, mode, vendor, max_time, per_trace_max_time, function_folder, 
-            max_call_depth, loglevel, null_handling, bypass, app_code_base):
+            max_call_depth, loglevel, null_handling, bypass, app_code_base,
+            queue_memory, cache_folder, pattern_processes, tree_size):
         self.mode = mode
         self.vendor = vendor
         self.bypass = bypass
@@ -500,9 +611,13 @@ class argxtractWorker:
         self.loglevel = loglevel
         self.null_handling = null_handling
         self.app_code_base = app_code_base
+        self.queue_memory = queue_memory
+        self.cache_folder = cache_folder
+        self.pattern_processes = pattern_processes
+        self.tree_size = tree_size
         logging.getLogger().setLevel(loglevel)
         
-    def main(self, in_queue, out_queue, process_id):
+    def main(self, connection, process_id):
         firmware_analyser = FirmwareAnalyser(
             self.mode,
             self.vendor, 
@@ -513,59 +628,58 @@ class argxtractWorker:
             self.loglevel,
             self.null_handling,
             self.bypass,
-            process_id
+            process_id,
+            self.queue_memory,
+            self.cache_folder,
+            self.pattern_processes,
+            self.tree_size
         )
 
-        # Get job from queue.
-        for queue_input in iter(in_queue.get, 'STOP'):
-            filename = str(queue_input).strip()
+        # Get job from parent.
+        for job_input in iter(connection.recv, 'STOP'):
+            filename = str(job_input).strip()
             print("\n\n[MAIN] Thread {1} - File {0}".format(
                 filename, str(process_id)))
-                
-            # Get hash of file bytes.
-            filebytes = open(filename, 'rb').read()
-            m = hashlib.sha256(filebytes)
-            # Don't waste resources by keeping file bytes in memory.
-            filebytes = None
-            # Get digest value.
-            digest = m.hexdigest()
-            outputfilename = './output/' + digest + '.json'
-            
-            # Get analysis output.
-            try:
-                output = firmware_analyser.analyse_firmware(filename, self.app_code_base)
-                # If no output, but no error.
-                if output == None:
-                    if self.function_folder != None:
-                        out_queue.put(filename 
-                                      + "," 
-                                      + "FunctionsSaved"
-                                  )
-                    else:
-                        out_queue.put(filename 
-                                          + "," 
-                                          + "None"
-                                      )
-                    in_queue.task_done()
-                    sleep(2)
-                    continue
-                # If an output was obtained.
-                # Write to file.
-                with open(outputfilename, 'w') as f: 
-                    json.dump(output, f, indent=4)
-                out_queue.put(filename)
-                in_queue.task_done()
-                sleep(2)
-                continue
-            except Exception as e:
-                out_queue.put(filename 
-                                  + "," 
-                                  + "Error,"
-                                  + str(e)
-                              )
-                in_queue.task_done()
-                sleep(2)
-                continue
+            result = self.analyse_file(firmware_analyser, filename)
+            connection.send(result)
+        connection.close()
+        
+    def analyse_file(self, firmware_analyser, filename):
+        # Get hash of file bytes.
+        filebytes = open(filename, 'rb').read()
+        m = hashlib.sha256(filebytes)
+        # Don't waste resources by keeping file bytes in memory.
+        filebytes = None
+        # Get digest value.
+        digest = m.hexdigest()
+        outputfilename = './output/' + digest + '.json'
+        
+        # Get analysis output.
+        try:
+            output = firmware_analyser.analyse_firmware(filename, self.app_code_base)
+            # If no output, but no error.
+            if output == None:
+                if self.function_folder != None:
+                    return (filename 
+                            + "," 
+                            + "FunctionsSaved"
+                        )
+                else:
+                    return (filename 
+                            + "," 
+                            + "None"
+                        )
+            # If an output was obtained.
+            # Write to file.
+            with open(outputfilename, 'w') as f: 
+                json.dump(output, f, indent=4)
+            return filename
+        except Exception as e:
+            return (filename 
+                    + "," 
+                    + "Error,"
+                    + str(e)
+                )
 
 if __name__ == '__main__':
     analysable_instance = argxtract()
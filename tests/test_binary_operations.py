@@ -0,0 +1,254 @@
+"""Differential tests for argxtract.core.binary_operations.
+
+The integer implementations are compared against reference
+implementations that operate on hex/bit strings, as the operations
+were originally implemented.
+
+Run with: python -m unittest discover tests
+"""
+import random
+import unittest
+from argxtract.core import binary_operations as binops
+
+
+EDGE_VALUES = [
+    0x00000000, 0x00000001, 0x00000002, 0x0000007F, 0x00000080,
+    0x000000FF, 0x00007FFF, 0x00008000, 0x0000FFFF, 0x7FFFFFFE,
+    0x7FFFFFFF, 0x80000000, 0x80000001, 0xAAAAAAAA, 0x55555555,
+    0xFFFFFFFE, 0xFFFFFFFF
+]
+SHIFT_AMOUNTS = list(range(0, 34)) + [40, 64]
+NUM_RANDOM_VALUES = 500
+
+
+# ------------------- String-based reference implementations -------------------
+def ref_to_bits(hex_value):
+    return bin(int('1' + hex_value, 16))[3:]
+
+def ref_to_hex(bits):
+    return '%0*x' % ((len(bits) + 3) // 4, int(bits, 2))
+
+def ref_logical_shift_left(hex_value, shift):
+    if shift == 0:
+        return (hex_value, 0)
+    if shift > 32:
+        return ('00000000', 0)
+    bits = ref_to_bits(hex_value)
+    bit_length = len(bits)
+    for i in range(shift):
+        bits += '0'
+        carry_out = bits[0]
+        bits = bits[(-1*bit_length):]
+    return (ref_to_hex(bits), int(carry_out))
+
+def ref_logical_shift_right(hex_value, shift):
+    if shift == 0:
+        return (hex_value, 0)
+    if shift > 32:
+        return ('00000000', 0)
+    bits = ref_to_bits(hex_value)
+    bit_length = len(bits)
+    for i in range(shift):
+        bits = '0' + bits
+        carry_out = bits[-1]
+        bits = bits[0:bit_length]
+    return (ref_to_hex(bits), int(carry_out))
+
+def ref_arithmetic_shift_right(hex_value, shift):
+    if shift == 0:
+        return (hex_value, 0)
+    if shift > 32:
+        return (None, 0)
+    bits = ref_to_bits(hex_value)
+    bit_length = len(bits)
+    leftmost_bit = bits[0]
+    for i in range(shift):
+        bits = leftmost_bit + bits
+        carry_out = bits[-1]
+        bits = bits[0:bit_length]
+    return (ref_to_hex(bits), int(carry_out))
+
+def ref_rotate_right(hex_value, shift):
+    if shift == 0:
+        return (hex_value, 0)
+    if shift > 32:
+        return (None, 0)
+    bits = ref_to_bits(hex_value)
+    bit_length = len(bits)
+    for i in range(shift):
+        rightmost_bit = bits[-1]
+        bits = (rightmost_bit + bits)[0:bit_length]
+    return (ref_to_hex(bits), int(rightmost_bit))
+
+def ref_rotate_right_with_extend(hex_value, carry_in):
+    bits = ref_to_bits(hex_value)
+    carry_out = int(bits[-1])
+    bits = (str(carry_in) + bits)[0:len(bits)]
+    return (ref_to_hex(bits), carry_out)
+
+def ref_sign_extend(hex_value, total_bits):
+    bits = ref_to_bits(hex_value)
+    bits = (bits[0] * (total_bits - len(bits))) + bits
+    return ref_to_hex(bits)
+
+def ref_add_with_carry(hex_x, hex_y, carry_in, sub=False):
+    # Bit-serial (ripple-carry) adder. Overflow is the carry into
+    #  the top bit XOR the carry out of it.
+    x_bits = ref_to_bits(hex_x)
+    y_bits = ref_to_bits(hex_y)
+    if sub == True:
+        y_bits = ''.join(['1' if bit == '0' else '0' for bit in y_bits])
+    result_bits = ''
+    carry = carry_in
+    carry_into_top = 0
+    for i in range(len(x_bits) - 1, -1, -1):
+        if i == 0:
+            carry_into_top = carry
+        total = int(x_bits[i]) + int(y_bits[i]) + carry
+        result_bits = str(total % 2) + result_bits
+        carry = total // 2
+    return (ref_to_hex(result_bits), carry, carry_into_top ^ carry)
+
+def ref_split_leading_bits(bits, field_bits):
+    return (bits[0:field_bits], bits[field_bits:])
+
+def ref_reverse_words(bits, word_bits):
+    words = [bits[i:i+word_bits] for i in range(0, len(bits), word_bits)]
+    return ''.join(reversed(words))
+
+
+# ------------------------------- Tests -------------------------------
+class BinaryOperationsTest(unittest.TestCase):
+    def setUp(self):
+        generator = random.Random(0x5EED)
+        self.values = EDGE_VALUES + [
+            generator.getrandbits(32) for i in range(NUM_RANDOM_VALUES)
+        ]
+        self.generator = generator
+
+    def assert_matches_reference(self, result, reference):
+        (ref_value, ref_carry) = reference
+        if ref_value != None:
+            ref_value = int(ref_value, 16)
+        self.assertEqual(result, (ref_value, ref_carry))
+
+    def test_logical_shift_left(self):
+        for value in self.values:
+            for shift in SHIFT_AMOUNTS:
+                self.assert_matches_reference(
+                    binops.logical_shift_left(value, shift),
+                    ref_logical_shift_left('%08x' % value, shift)
+                )
+
+    def test_logical_shift_right(self):
+        for value in self.values:
+            for shift in SHIFT_AMOUNTS:
+                self.assert_matches_reference(
+                    binops.logical_shift_right(value, shift),
+                    ref_logical_shift_right('%08x' % value, shift)
+                )
+
+    def test_arithmetic_shift_right(self):
+        for value in self.values:
+            for shift in SHIFT_AMOUNTS:
+                self.assert_matches_reference(
+                    binops.arithmetic_shift_right(value, shift),
+                    ref_arithmetic_shift_right('%08x' % value, shift)
+                )
+
+    def test_rotate_right(self):
+        for value in self.values:
+            for shift in SHIFT_AMOUNTS:
+                self.assert_matches_reference(
+                    binops.rotate_right(value, shift),
+                    ref_rotate_right('%08x' % value, shift)
+                )
+
+    def test_rotate_right_with_extend(self):
+        for value in self.values:
+            for carry_in in [0, 1]:
+                self.assert_matches_reference(
+                    binops.rotate_right_with_extend(value, carry_in),
+                    ref_rotate_right_with_extend('%08x' % value, carry_in)
+                )
+            # No carry input is treated as 0.
+            self.assertEqual(
+                binops.rotate_right_with_extend(value),
+                binops.rotate_right_with_extend(value, 0)
+            )
+
+    def test_sign_extend(self):
+        for value in self.values:
+            for bit_length in [8, 16, 32]:
+                truncated = value & binops.get_mask(bit_length)
+                hex_value = '%0*x' % (bit_length // 4, truncated)
+                self.assertEqual(
+                    binops.sign_extend(truncated, 32, bit_length),
+                    int(ref_sign_extend(hex_value, 32), 16)
+                )
+
+    def test_add_with_carry(self):
+        pairs = [(x, y) for x in EDGE_VALUES for y in EDGE_VALUES]
+        for i in range(NUM_RANDOM_VALUES):
+            pairs.append((
+                self.generator.choice(self.values),
+                self.generator.choice(self.values)
+            ))
+        for (x, y) in pairs:
+            for carry_in in [0, 1]:
+                for sub in [False, True]:
+                    (ref_result, ref_carry, ref_overflow) = \
+                        ref_add_with_carry('%08x' % x, '%08x' % y, carry_in, sub)
+                    self.assertEqual(
+                        binops.add_with_carry(x, y, carry_in, sub=sub),
+                        (int(ref_result, 16), ref_carry, ref_overflow)
+                    )
+
+    def test_add_with_carry_known_values(self):
+        # (x, y, carry_in, sub) -> (result, carry, overflow)
+        known_values = [
+            ((0xFFFFFFFF, 1, 0, False), (0x00000000, 1, 0)),
+            ((0x7FFFFFFF, 1, 0, False), (0x80000000, 0, 1)),
+            ((0x80000000, 0x80000000, 0, False), (0x00000000, 1, 1)),
+            ((5, 3, 1, True), (2, 1, 0)),
+            ((3, 5, 1, True), (0xFFFFFFFE, 0, 0)),
+            ((0, 1, 1, True), (0xFFFFFFFF, 0, 0)),
+            ((0x80000000, 1, 1, True), (0x7FFFFFFF, 1, 1)),
+        ]
+        for (arguments, expected) in known_values:
+            (x, y, carry_in, sub) = arguments
+            self.assertEqual(
+                binops.add_with_carry(x, y, carry_in, sub=sub),
+                expected
+            )
+        self.assertEqual(binops.add_with_carry(None, 1), (None, None, None))
+
+    def test_split_leading_bits(self):
+        for value in self.values:
+            for num_bits in [8, 16, 24, 32]:
+                truncated = value & binops.get_mask(num_bits)
+                bits = '{0:0{1}b}'.format(truncated, num_bits)
+                for field_bits in range(0, num_bits + 9, 3):
+                    (leading_part, remaining_part) = \
+                        binops.split_leading_bits(truncated, num_bits, field_bits)
+                    (ref_leading, ref_remaining) = \
+                        ref_split_leading_bits(bits, field_bits)
+                    self.assertEqual(leading_part[1], len(ref_leading))
+                    self.assertEqual(remaining_part[1], len(ref_remaining))
+                    self.assertEqual(leading_part[0], int('0' + ref_leading, 2))
+                    self.assertEqual(remaining_part[0], int('0' + ref_remaining, 2))
+
+    def test_reverse_words(self):
+        for value in self.values:
+            for num_bits in [8, 16, 24, 32, 48]:
+                wide_value = value & binops.get_mask(num_bits)
+                bits = '{0:0{1}b}'.format(wide_value, num_bits)
+                for word_bits in [8, 16, 32]:
+                    self.assertEqual(
+                        binops.reverse_words(wide_value, num_bits, word_bits),
+                        int(ref_reverse_words(bits, word_bits), 2)
+                    )
+
+
+if __name__ == '__main__':
+    unittest.main()
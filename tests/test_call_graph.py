@@ -0,0 +1,168 @@
+"""Tests for argxtract.core.call_graph.
+
+Call depths and components are compared against a brute-force oracle
+(pairwise reachability and exhaustive path enumeration) on random
+call graphs.
+
+Run with: python -m unittest discover tests
+"""
+import random
+import unittest
+from argxtract.core.call_graph import CallGraph
+
+
+NUM_RANDOM_GRAPHS = 300
+MAX_FUNCTIONS = 10
+
+
+# ------------------------- Brute-force oracle -------------------------
+def get_edges(function_blocks):
+    edges = {}
+    for function_start in function_blocks:
+        edges[function_start] = set()
+        xref_tos = function_blocks[function_start]['xref_to']
+        if xref_tos == None:
+            continue
+        for xref_to in xref_tos:
+            if ((xref_to in function_blocks) and (xref_to != function_start)):
+                edges[function_start].add(xref_to)
+    return edges
+
+def get_reachable(edges, source):
+    reachable = set()
+    pending = [source]
+    while pending != []:
+        current = pending.pop()
+        for callee in edges[current]:
+            if callee in reachable:
+                continue
+            reachable.add(callee)
+            pending.append(callee)
+    return reachable
+
+def get_oracle_components(edges):
+    # Functions are in the same component if they can reach each other.
+    reachable = {
+        function_start: get_reachable(edges, function_start)
+            for function_start in edges
+    }
+    components = {}
+    for function_start in edges:
+        components[function_start] = frozenset(
+            [function_start] + [
+                other for other in reachable[function_start]
+                    if function_start in reachable[other]
+            ]
+        )
+    return components
+
+def get_oracle_depths(edges):
+    components = get_oracle_components(edges)
+    component_edges = {}
+    for function_start in edges:
+        component = components[function_start]
+        if component not in component_edges:
+            component_edges[component] = set()
+        for callee in edges[function_start]:
+            if components[callee] != component:
+                component_edges[component].add(components[callee])
+
+    # Longest path, by enumerating all paths.
+    def get_longest_path(component):
+        longest = 0
+        for callee_component in component_edges[component]:
+            longest = max(longest, get_longest_path(callee_component) + 1)
+        return longest
+
+    return {
+        function_start: get_longest_path(components[function_start])
+            for function_start in edges
+    }
+
+def make_random_function_blocks(generator):
+    num_functions = generator.randint(1, MAX_FUNCTIONS)
+    function_starts = generator.sample(range(0x1000, 0x2000, 2), num_functions)
+    density = generator.random()
+    function_blocks = {}
+    for function_start in function_starts:
+        if generator.random() < 0.1:
+            function_blocks[function_start] = {'xref_to': None}
+            continue
+        xref_tos = []
+        for callee in function_starts:
+            # Includes self-calls.
+            if generator.random() < (density / 2):
+                xref_tos.append(callee)
+        # Duplicate calls and calls to addresses that are not
+        #  function blocks are ignored.
+        if ((xref_tos != []) and (generator.random() < 0.2)):
+            xref_tos.append(generator.choice(xref_tos))
+        if generator.random() < 0.2:
+            xref_tos.append(0x3000)
+        generator.shuffle(xref_tos)
+        function_blocks[function_start] = {'xref_to': xref_tos}
+    return function_blocks
+
+
+# ------------------------------- Tests -------------------------------
+class CallGraphTest(unittest.TestCase):
+    def setUp(self):
+        generator = random.Random(0xCA11)
+        self.random_graphs = [
+            make_random_function_blocks(generator)
+                for i in range(NUM_RANDOM_GRAPHS)
+        ]
+
+    def test_call_depths_match_oracle(self):
+        for function_blocks in self.random_graphs:
+            call_graph = CallGraph(function_blocks)
+            oracle_depths = get_oracle_depths(get_edges(function_blocks))
+            for function_start in function_blocks:
+                self.assertEqual(
+                    call_graph.get_call_depth(function_start),
+                    oracle_depths[function_start]
+                )
+
+    def test_components_match_oracle(self):
+        for function_blocks in self.random_graphs:
+            call_graph = CallGraph(function_blocks)
+            edges = get_edges(function_blocks)
+            oracle_components = get_oracle_components(edges)
+            for component in call_graph.components:
+                members = frozenset(
+                    call_graph.function_starts[member] for member in component
+                )
+                for member in members:
+                    self.assertEqual(members, oracle_components[member])
+            # Components are numbered with callees before callers.
+            for function_start in edges:
+                caller = call_graph.function_index[function_start]
+                for callee_start in edges[function_start]:
+                    callee = call_graph.function_index[callee_start]
+                    self.assertLessEqual(
+                        call_graph.component_index[callee],
+                        call_graph.component_index[caller]
+                    )
+
+    def test_unknown_function_depth(self):
+        call_graph = CallGraph({0x1000: {'xref_to': [0x1002]}})
+        self.assertEqual(call_graph.get_call_depth(0x1000), 0)
+        self.assertEqual(call_graph.get_call_depth(0x2000), 0)
+
+    def test_long_call_chain(self):
+        # Long chains must not hit the recursion limit.
+        num_functions = 5000
+        function_blocks = {}
+        for i in range(num_functions):
+            function_start = 0x1000 + (2 * i)
+            function_blocks[function_start] = {'xref_to': [function_start + 2]}
+        # Close a loop over the last ten functions.
+        last_function = 0x1000 + (2 * (num_functions - 1))
+        function_blocks[last_function]['xref_to'] = [last_function - 18]
+        call_graph = CallGraph(function_blocks)
+        self.assertEqual(call_graph.get_call_depth(0x1000), num_functions - 10)
+        self.assertEqual(call_graph.get_call_depth(last_function), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+"""Tests for the embedded SoftDevice index of the nordic_ble analyser.
+
+Run with: python -m unittest discover tests
+"""
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from argxtract.common import paths as common_paths
+from argxtract.resources.vendor.nordic_ble.chipset_analyser import \
+    VendorChipsetAnalyser
+
+
+SOFTDEVICE_NAME = 's132_nrf52_7.0.1_softdevice_sdk_17.0.2.bin'
+SOFTDEVICE_SIZE = 0x1000
+
+
+class SoftDeviceIndexTest(unittest.TestCase):
+    def setUp(self):
+        generator = random.Random(0x5D)
+        self.softdevice = bytes(
+            generator.getrandbits(8) for i in range(SOFTDEVICE_SIZE)
+        )
+        self.vendor_path = tempfile.mkdtemp()
+        self.softdevice_dir = os.path.join(self.vendor_path, 'softdevices')
+        os.makedirs(self.softdevice_dir)
+        with open(os.path.join(self.softdevice_dir, SOFTDEVICE_NAME), 'wb') as f:
+            f.write(self.softdevice)
+        with open(os.path.join(self.softdevice_dir, 'README.txt'), 'w') as f:
+            f.write('Download all SoftDevices available from Nordic into this folder.')
+        self.analyser = VendorChipsetAnalyser()
+        self.analyser.build_softdevice_index(self.softdevice_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.vendor_path)
+
+    def test_index_excludes_readme(self):
+        entries = [
+            entry for entries in self.analyser.softdevice_index.values()
+                for entry in entries
+        ]
+        self.assertEqual(
+            [entry['name'] for entry in entries],
+            [SOFTDEVICE_NAME]
+        )
+
+    def test_match_embedded_softdevice(self):
+        firmware = (b'\xff' * 0x100) + self.softdevice + (b'\x00' * 0x200)
+        self.assertEqual(
+            self.analyser.match_softdevice_index(firmware),
+            SOFTDEVICE_NAME
+        )
+        # Exact (whole-file) match.
+        self.assertEqual(
+            self.analyser.match_softdevice_index(self.softdevice),
+            SOFTDEVICE_NAME
+        )
+
+    def test_no_match_for_partial_softdevice(self):
+        firmware = (b'\xff' * 0x100) + self.softdevice[:-1]
+        self.assertEqual(self.analyser.match_softdevice_index(firmware), None)
+        modified = bytearray(self.softdevice)
+        modified[0] ^= 0xFF
+        self.assertEqual(
+            self.analyser.match_softdevice_index(bytes(modified)),
+            None
+        )
+
+    def test_index_read_from_vendor_path(self):
+        # The index is built from the softdevices folder of the vendor.
+        self.addCleanup(setattr, common_paths, 'vendor_path',
+            common_paths.vendor_path)
+        self.addCleanup(setattr, common_paths, 'path_to_fw',
+            common_paths.path_to_fw)
+        common_paths.vendor_path = self.vendor_path
+        common_paths.path_to_fw = os.path.join(self.vendor_path, 'fw.bin')
+        with open(common_paths.path_to_fw, 'wb') as f:
+            f.write(b'\xff' * 0x100)
+        analyser = VendorChipsetAnalyser()
+        analyser.check_for_embedded_softdevice()
+        self.assertEqual(len(analyser.softdevice_index), 1)
+        self.assertEqual(analyser.embedded_softdevice, False)
+
+
+if __name__ == '__main__':
+    unittest.main()